@@ -1,4 +1,7 @@
+import importlib
 from importlib.metadata import version
+from types import ModuleType
+from typing import TYPE_CHECKING
 
 __version__ = version("dummio")
 
@@ -7,32 +10,51 @@ from dummio import json as json
 from dummio import pickle as pickle
 from dummio import text as text
 
-try:
+# Submodules that not every user needs, often depending on optional and slow-to-import packages, are imported on first
+# attribute access.
+_LAZY_SUBMODULES = {
+    "aio",
+    "cache",
+    "dill",
+    "jsonl",
+    "memo",
+    "msgpack",
+    "onnx",
+    "orjson",
+    "pydantic",
+    "yaml",
+}
+
+if TYPE_CHECKING:
+    from dummio import aio as aio
+    from dummio import cache as cache
+    from dummio import dill as dill
+    from dummio import jsonl as jsonl
+    from dummio import memo as memo
+    from dummio import msgpack as msgpack
+    from dummio import onnx as onnx
+    from dummio import orjson as orjson
+    from dummio import pydantic as pydantic
     from dummio import yaml as yaml
-except ImportError:
-    # this would require an optional yaml dependency such as pyyaml
-    pass
 
-try:
-    from dummio import onnx as onnx
-except ImportError:
-    # this would require the optional dependency onnx
-    pass
 
-try:
-    from dummio import pydantic as pydantic
-except ImportError:
-    # this would require the optional dependency pydantic
-    pass
+def __getattr__(name: str) -> ModuleType:
+    """Import optional submodules lazily, e.g. `dummio.yaml` imports ruamel.yaml only when first accessed.
 
-try:
-    from dummio import dill as dill
-except ImportError:
-    # this would require the optional dependency dill
-    pass
+    Raises:
+        AttributeError: if `name` is not a dummio submodule, or if the submodule requires an optional dependency that is
+            not installed (chained from the ImportError), so that e.g. `hasattr(dummio, "onnx")` is False rather than
+            raising. `import dummio.onnx` raises the ImportError itself.
+    """
+    if name not in _LAZY_SUBMODULES:
+        raise AttributeError(f"module 'dummio' has no attribute '{name}'")
+    try:
+        module = importlib.import_module(f"dummio.{name}")
+    except ImportError as exc:
+        raise AttributeError(f"module 'dummio' has no attribute '{name}', since importing it failed: {exc}") from exc
+    globals()[name] = module
+    return module
 
-try:
-    from dummio import orjson as orjson
-except ImportError:
-    # this would require the optional dependency orjson
-    pass
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | _LAZY_SUBMODULES)
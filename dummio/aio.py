@@ -0,0 +1,137 @@
+"""Asynchronous IO: coroutine equivalents of the `save` and `load` methods of any dummio IO module.
+
+For example,
+```
+data = await dummio.aio.load("s3://bucket/data.json", module=dummio.json)
+await dummio.aio.save(df, filepath="gcs://bucket/data.parquet", module=dummio.pandas.df_parquet)
+```
+
+For remote paths on filesystems with an async implementation (such as s3fs, gcsfs, and adlfs), the transfer is a
+coroutine on the event loop, so many transfers can be in flight without a thread for each. Serialization runs in the
+default executor: the module's own `save`/`load` writes/reads an in-memory scratch file (with the same file name, so
+that extension-based behavior carries over), which keeps the async API exactly consistent with the synchronous one.
+Sidecar files that the module writes next to the data file (see `dummio.utils.sidecars`), such as schema fingerprints
+and onnx external data, are transferred along with it.
+
+Local files and other filesystems fall back to running the module's `save`/`load` in the default executor.
+"""
+
+import asyncio
+import uuid
+from types import ModuleType
+from typing import Any
+
+from fsspec.asyn import AsyncFileSystem
+from upath import UPath
+
+from dummio.constants import PathType
+from dummio.utils import is_local, sidecars
+
+SCRATCH_DIRECTORY = "memory://dummio-aio"
+
+
+def _name(filepath: UPath) -> str:
+    """The file name of the scratch file for filepath."""
+    return filepath.name or "data"
+
+
+def _scratch_path(filepath: UPath) -> UPath:
+    """A unique in-memory path with the same file name as filepath."""
+    return UPath(SCRATCH_DIRECTORY) / uuid.uuid4().hex / _name(filepath)
+
+
+def _async_filesystem(path: UPath) -> AsyncFileSystem | None:
+    """An async instance of the path's filesystem, if the path is remote and its filesystem supports async."""
+    if is_local(path) or not path.fs.async_impl:
+        return None
+    fs = type(path.fs)(asynchronous=True, **path.storage_options)
+    assert isinstance(fs, AsyncFileSystem), "expected an async filesystem since async_impl is set"
+    return fs
+
+
+def _remove_scratch(scratch: UPath) -> None:
+    """Remove the scratch directory, which may not exist if nothing was written to it."""
+    try:
+        scratch.fs.rm(scratch.parent.path, recursive=True)
+    except FileNotFoundError:
+        pass
+
+
+def _dumps(module: ModuleType, data: Any, filepath: UPath, kwargs: dict[str, Any]) -> dict[str, bytes]:
+    """Serialize data to bytes via the module's save method, by file name, including any sidecar files."""
+    scratch = _scratch_path(filepath)
+    try:
+        module.save(data, filepath=scratch, **kwargs)
+        return {path.name: path.read_bytes() for path in scratch.parent.iterdir()}
+    finally:
+        _remove_scratch(scratch)
+
+
+def _loads(module: ModuleType, payloads: dict[str, bytes], filepath: UPath, kwargs: dict[str, Any]) -> Any:
+    """Deserialize data from bytes via the module's load method, given the bytes of each file by file name."""
+    scratch = _scratch_path(filepath)
+    try:
+        for name, payload in payloads.items():
+            (scratch.parent / name).write_bytes(payload)
+        return module.load(scratch, **kwargs)
+    finally:
+        _remove_scratch(scratch)
+
+
+async def _cat_file(fs: AsyncFileSystem, path: UPath) -> bytes | None:
+    """The content of a file, or None if it does not exist."""
+    try:
+        return await fs._cat_file(path.path)
+    except FileNotFoundError:
+        return None
+
+
+async def _rm_file(fs: AsyncFileSystem, path: UPath) -> None:
+    """Remove a file, if it exists."""
+    try:
+        await fs._rm_file(path.path)
+    except FileNotFoundError:
+        pass
+
+
+async def save(data: Any, *, filepath: PathType, module: ModuleType, **kwargs) -> None:
+    """Save data without blocking the event loop.
+
+    Args:
+        data: Data to save.
+        filepath: Path to save the data.
+        module: The dummio IO module to save with, such as `dummio.json` or `dummio.pandas.df_parquet`.
+        **kwargs: Additional keyword arguments for `module.save`.
+    """
+    path = UPath(filepath)
+    fs = _async_filesystem(path)
+    if fs is None or "a" in kwargs.get("mode", ""):
+        # appending requires the existing content, so it can not be serialized independently of the transfer
+        await asyncio.to_thread(module.save, data, filepath=filepath, **kwargs)
+        return
+    payloads = await asyncio.to_thread(_dumps, module, data, path, kwargs)
+    name = _name(path)
+    transfers = [fs._pipe_file((path.parent / key).path, payload) for key, payload in payloads.items() if key != name]
+    # remove sidecar files left over from an earlier save, which would not match the new data file:
+    transfers += [_rm_file(fs, sidecar) for sidecar in sidecars(path, module=module) if sidecar.name not in payloads]
+    await asyncio.gather(*transfers)
+    # the data file goes last, so that it is not visible before its sidecar files:
+    await fs._pipe_file(path.path, payloads[name])
+
+
+async def load(filepath: PathType, *, module: ModuleType, **kwargs) -> Any:
+    """Load data without blocking the event loop.
+
+    Args:
+        filepath: Path to read the data.
+        module: The dummio IO module to load with, such as `dummio.json` or `dummio.pandas.df_parquet`.
+        **kwargs: Additional keyword arguments for `module.load`.
+    """
+    path = UPath(filepath)
+    fs = _async_filesystem(path)
+    if fs is None:
+        return await asyncio.to_thread(module.load, filepath, **kwargs)
+    paths = [path, *sidecars(path, module=module)]
+    contents = await asyncio.gather(fs._cat_file(path.path), *[_cat_file(fs, sidecar) for sidecar in paths[1:]])
+    payloads = {_name(p): content for p, content in zip(paths, contents) if content is not None}
+    return await asyncio.to_thread(_loads, module, payloads, path, kwargs)
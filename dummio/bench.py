@@ -0,0 +1,334 @@
+"""Benchmarks of save/load throughput, latency, and peak memory for the dummio IO modules.
+
+Each case saves and loads a generated dataset (with a configurable number of rows) a few times, and reports:
+- the file size,
+- p50/p99 latency of save and load,
+- throughput in MB/s (file size over the median latency), and
+- peak resident memory (RSS) of the process, and its increase over the baseline after generating the dataset.
+
+By default each case runs in a fresh process, so that peak RSS reflects only that case. Cases whose optional
+dependencies are not installed are reported as skipped. Results are machine-readable, for comparison across releases:
+```
+dummio bench --rows 100000 --output results.json
+```
+"""
+
+import importlib
+import json
+import platform
+import statistics
+import sys
+import tempfile
+import time
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import asdict, dataclass, field
+from datetime import datetime, timezone
+from functools import lru_cache, partial
+from importlib.metadata import version
+from multiprocessing import get_context
+from typing import Any, Callable
+
+from upath import UPath
+
+from dummio.constants import PathType
+
+MB = 2**20
+DEFAULT_ROWS = 10_000
+DEFAULT_REPEATS = 5
+
+
+def _records(rows: int) -> dict[str, Any]:
+    """A dictionary resembling a typical json payload."""
+    records = [
+        {"id": i, "name": f"name_{i}", "value": i / 7, "active": i % 2 == 0, "tags": ["a", "b"]} for i in range(rows)
+    ]
+    return {"records": records}
+
+
+def _record_list(rows: int) -> list[dict[str, Any]]:
+    return _records(rows)["records"]
+
+
+@lru_cache(maxsize=None)
+def _dataclasses(mixin: str) -> tuple[type, type]:
+    """Dataclasses of a record and of a collection of records, inheriting the mashumaro mixin (given by its path)."""
+    module_name, name = mixin.rsplit(".", 1)
+    base = getattr(importlib.import_module(module_name), name)
+
+    @dataclass
+    class Record(base):
+        id: int
+        name: str
+        value: float
+        active: bool
+        tags: list[str]
+
+    @dataclass
+    class Records(base):
+        records: list[Record]
+
+    return Record, Records
+
+
+def _dataclass_list(mixin: str, rows: int) -> list[Any]:
+    record, _ = _dataclasses(mixin)
+    return [record(**values) for values in _record_list(rows)]
+
+
+def _dataclass_records(mixin: str, rows: int) -> Any:
+    _, records = _dataclasses(mixin)
+    return records(records=_dataclass_list(mixin, rows))
+
+
+def _text(rows: int) -> str:
+    return "".join(f"line {i}: the quick brown fox jumps over the lazy dog\n" for i in range(rows))
+
+
+def _array(rows: int) -> Any:
+    import numpy as np
+
+    return np.random.default_rng(0).standard_normal((rows, 8))
+
+
+def _frame(rows: int) -> Any:
+    import numpy as np
+    import pandas as pd
+
+    rng = np.random.default_rng(0)
+    return pd.DataFrame(
+        {
+            "id": np.arange(rows),
+            "value": rng.standard_normal(rows),
+            "category": rng.choice(["a", "b", "c", "d"], size=rows),
+            "name": [f"name_{i}" for i in range(rows)],
+        }
+    )
+
+
+@dataclass
+class Case:
+    """A benchmark case: one IO module applied to one kind of generated dataset."""
+
+    module: str
+    data: Callable[[int], Any]
+    filename: str
+    save_kwargs: dict[str, Any] = field(default_factory=dict)
+    load_kwargs: dict[str, Any] = field(default_factory=dict)
+    # names of the module's save and load methods:
+    save_method: str = "save"
+    load_method: str = "load"
+    # whether to pass the class of the data (or of its elements, for lists) as the `model` argument of load:
+    pass_model: bool = False
+
+
+_JSON_MIXIN = "mashumaro.mixins.json.DataClassJSONMixin"
+_ORJSON_MIXIN = "mashumaro.mixins.orjson.DataClassORJSONMixin"
+_MSGPACK_MIXIN = "mashumaro.mixins.msgpack.DataClassMessagePackMixin"
+
+
+CASES: dict[str, Case] = {
+    "json": Case("dummio.json", _records, "data.json"),
+    "orjson": Case("dummio.orjson", _records, "data.json"),
+    "jsonl": Case("dummio.jsonl", _record_list, "data.jsonl"),
+    "msgpack": Case("dummio.msgpack", _records, "data.msgpack"),
+    "yaml": Case("dummio.yaml", _records, "data.yaml"),
+    "yaml_safe": Case("dummio.yaml", _records, "data.yaml", save_kwargs={"typ": "safe"}, load_kwargs={"typ": "safe"}),
+    "yaml_libyaml": Case(
+        "dummio.yaml", _records, "data.yaml", save_kwargs={"engine": "libyaml"}, load_kwargs={"engine": "libyaml"}
+    ),
+    "mashumaro_json": Case(
+        "dummio.mashumaro.json", partial(_dataclass_records, _JSON_MIXIN), "data.json", pass_model=True
+    ),
+    "mashumaro_orjson": Case(
+        "dummio.mashumaro.orjson", partial(_dataclass_records, _ORJSON_MIXIN), "data.json", pass_model=True
+    ),
+    "mashumaro_orjson_list": Case(
+        "dummio.mashumaro.orjson",
+        partial(_dataclass_list, _ORJSON_MIXIN),
+        "data.json",
+        save_method="save_list",
+        load_method="load_list",
+        pass_model=True,
+    ),
+    "mashumaro_msgpack": Case(
+        "dummio.mashumaro.msgpack", partial(_dataclass_records, _MSGPACK_MIXIN), "data.msgpack", pass_model=True
+    ),
+    "mashumaro_msgpack_list": Case(
+        "dummio.mashumaro.msgpack",
+        partial(_dataclass_list, _MSGPACK_MIXIN),
+        "data.msgpack",
+        save_method="save_list",
+        load_method="load_list",
+        pass_model=True,
+    ),
+    "pickle": Case("dummio.pickle", _records, "data.pkl"),
+    "pickle_out_of_band": Case("dummio.pickle", _array, "data.pkl", save_kwargs={"out_of_band": True}),
+    "dill": Case("dummio.dill", _records, "data.pkl"),
+    "text": Case("dummio.text", _text, "data.txt"),
+    "numpy": Case("dummio.numpy.ndarray_io", _array, "data.npy"),
+    "df_csv": Case("dummio.pandas.df_csv", _frame, "data.csv"),
+    "df_feather": Case("dummio.pandas.df_feather", _frame, "data.feather"),
+    "df_parquet": Case("dummio.pandas.df_parquet", _frame, "data.parquet"),
+    "df_vortex": Case("dummio.pandas.df_vortex", _frame, "data.vortex"),
+}
+
+
+@dataclass
+class Result:
+    """Measurements for one benchmark case."""
+
+    case: str
+    module: str
+    rows: int
+    repeats: int
+    skipped: str | None = None
+    file_bytes: int | None = None
+    save_p50_s: float | None = None
+    save_p99_s: float | None = None
+    load_p50_s: float | None = None
+    load_p99_s: float | None = None
+    save_mb_per_s: float | None = None
+    load_mb_per_s: float | None = None
+    peak_rss_mb: float | None = None
+    peak_rss_increase_mb: float | None = None
+
+
+def _percentile(values: list[float], percent: float) -> float:
+    """The percentile of the values, interpolating linearly between the closest ranks."""
+    if len(values) == 1:
+        return values[0]
+    return statistics.quantiles(values, n=100, method="inclusive")[int(percent) - 1]
+
+
+def _check_repeats(repeats: int) -> None:
+    if repeats < 1:
+        raise ValueError(f"repeats must be at least 1, got {repeats}.")
+
+
+def _peak_rss_mb() -> float | None:
+    """Peak resident memory of the current process so far, if available on this platform."""
+    try:
+        import resource
+    except ImportError:
+        # e.g. on windows
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is in bytes on macOS, but in kilobytes on linux:
+    return peak / MB if sys.platform == "darwin" else peak / 1024
+
+
+def run_case(name: str, *, rows: int, repeats: int, directory: PathType) -> Result:
+    """Run one benchmark case in the current process.
+
+    Args:
+        name: Name of the case, a key of CASES.
+        rows: Size of the generated dataset.
+        repeats: Number of save/load cycles to time.
+        directory: Directory in which to write the data file; may be a cloud location.
+    """
+    _check_repeats(repeats)
+    case = CASES[name]
+    result = Result(case=name, module=case.module, rows=rows, repeats=repeats)
+    try:
+        module = importlib.import_module(case.module)
+        data = case.data(rows)
+    except ImportError as err:
+        result.skipped = str(err)
+        return result
+    save, load = getattr(module, case.save_method), getattr(module, case.load_method)
+    load_kwargs = dict(case.load_kwargs)
+    if case.pass_model:
+        load_kwargs["model"] = type(data[0]) if isinstance(data, list) else type(data)
+    filepath = UPath(directory) / name / case.filename
+    filepath.parent.mkdir(parents=True, exist_ok=True)
+    baseline_rss = _peak_rss_mb()
+    save_times, load_times = [], []
+    for _ in range(repeats):
+        start = time.perf_counter()
+        save(data, filepath=filepath, **case.save_kwargs)
+        save_times.append(time.perf_counter() - start)
+        start = time.perf_counter()
+        load(filepath, **load_kwargs)
+        load_times.append(time.perf_counter() - start)
+    result.peak_rss_mb = _peak_rss_mb()
+    if result.peak_rss_mb is not None and baseline_rss is not None:
+        result.peak_rss_increase_mb = result.peak_rss_mb - baseline_rss
+    result.file_bytes = filepath.stat().st_size
+    result.save_p50_s = statistics.median(save_times)
+    result.save_p99_s = _percentile(save_times, 99)
+    result.load_p50_s = statistics.median(load_times)
+    result.load_p99_s = _percentile(load_times, 99)
+    result.save_mb_per_s = result.file_bytes / MB / result.save_p50_s
+    result.load_mb_per_s = result.file_bytes / MB / result.load_p50_s
+    return result
+
+
+def run(
+    cases: list[str] | None = None,
+    *,
+    rows: int = DEFAULT_ROWS,
+    repeats: int = DEFAULT_REPEATS,
+    directory: PathType | None = None,
+    isolate: bool = True,
+) -> list[Result]:
+    """Run benchmark cases.
+
+    Args:
+        cases: Names of the cases to run (keys of CASES). Defaults to all cases.
+        rows: Size of the generated datasets.
+        repeats: Number of save/load cycles to time per case.
+        directory: Directory in which to write the data files; may be a cloud location. Defaults to a temporary
+            directory.
+        isolate: If true, run each case in a fresh process so that peak memory measurements are not affected by
+            other cases.
+    """
+    _check_repeats(repeats)
+    names = cases or list(CASES)
+    unknown = [name for name in names if name not in CASES]
+    if unknown:
+        raise ValueError(f"Unknown benchmark cases {unknown}. Choose from {list(CASES)}.")
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        directory = directory or tmp_dir
+        results = []
+        for name in names:
+            kwargs = {"rows": rows, "repeats": repeats, "directory": directory}
+            if isolate:
+                with ProcessPoolExecutor(max_workers=1, mp_context=get_context("spawn")) as executor:
+                    results.append(executor.submit(run_case, name, **kwargs).result())
+            else:
+                results.append(run_case(name, **kwargs))
+    return results
+
+
+def report(results: list[Result]) -> dict[str, Any]:
+    """A machine-readable report of the results, including information about the environment."""
+    return {
+        "dummio_version": version("dummio"),
+        "python_version": platform.python_version(),
+        "platform": platform.platform(),
+        "created_at": datetime.now(timezone.utc).isoformat(),
+        "results": [asdict(result) for result in results],
+    }
+
+
+def format_table(results: list[Result]) -> str:
+    """A human-readable table of the results."""
+    lines = [
+        f"{'case':<24}{'MB':>9}{'save p50 ms':>13}{'load p50 ms':>13}{'save MB/s':>11}{'load MB/s':>11}{'RSS+ MB':>9}"
+    ]
+    for result in results:
+        if result.skipped is not None:
+            lines.append(f"{result.case:<24}skipped: {result.skipped}")
+            continue
+        assert result.file_bytes is not None and result.save_p50_s is not None and result.load_p50_s is not None
+        lines.append(
+            f"{result.case:<24}{result.file_bytes / MB:>9.2f}{result.save_p50_s * 1e3:>13.2f}"
+            f"{result.load_p50_s * 1e3:>13.2f}{result.save_mb_per_s:>11.1f}{result.load_mb_per_s:>11.1f}"
+            f"{float('nan') if result.peak_rss_increase_mb is None else result.peak_rss_increase_mb:>9.1f}"
+        )
+    return "\n".join(lines)
+
+
+def save_report(results: list[Result], *, filepath: PathType) -> None:
+    """Save the machine-readable report of the results as json."""
+    UPath(filepath).write_text(json.dumps(report(results), indent=2))
@@ -0,0 +1,168 @@
+"""Opt-in local on-disk read-through cache for loading remote files.
+
+Every `load` of an `s3://` or `gcs://` path downloads the file again. Instead, a `ReadThroughCache` keeps local copies
+of remote files under a directory of your choice, and only downloads a file again if its version tag (an ETag,
+generation number, or similar, as reported by the filesystem's `ukey`) has changed. Checking the version tag requires
+only a metadata request. When the cache exceeds `max_bytes`, the least recently used files are evicted.
+
+Sidecar files that the loading module writes next to a remote file (see `dummio.utils.sidecars`), such as schema
+fingerprints and onnx external data, are cached and revalidated together with it, at the cost of one more metadata
+request per possible sidecar file of that module.
+
+Example:
+```
+cache = ReadThroughCache("~/.cache/dummio", max_bytes=2**30)
+data = cache.load("s3://bucket/reference.json", module=dummio.json)
+df = cache.load("s3://bucket/table.parquet", module=dummio.pandas.df_parquet, columns=["a"])
+```
+
+Local paths pass straight through to the module.
+"""
+
+import hashlib
+import json
+import os
+import threading
+import uuid
+from pathlib import Path
+from types import ModuleType
+from typing import Any
+
+from upath import UPath
+
+from dummio.constants import PathType
+from dummio.utils import is_local, sidecars
+
+DEFAULT_MAX_BYTES = 10 * 2**30
+METADATA_FILENAME = "metadata.json"
+
+
+def version_tag(filepath: PathType) -> str:
+    """An identifier of the current version of a file, such as its ETag on S3 or its generation on GCS."""
+    path = UPath(filepath)
+    return str(path.fs.ukey(path.path))
+
+
+def _sidecar_version_tag(filepath: UPath) -> str | None:
+    """The version tag of a sidecar file, or None if it does not exist."""
+    try:
+        return version_tag(filepath)
+    except FileNotFoundError:
+        return None
+
+
+class ReadThroughCache:
+    """A size-limited local copy of remote files, revalidated against their version tag on each access."""
+
+    def __init__(self, directory: str | Path, *, max_bytes: int = DEFAULT_MAX_BYTES) -> None:
+        """Configure the cache.
+
+        Args:
+            directory: Local directory in which to keep the cached files. It is created if it does not exist.
+            max_bytes: Maximum total size of the cached files. The least recently used files are evicted beyond this.
+        """
+        self.directory = Path(directory).expanduser()
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+
+    def _entry(self, path: UPath) -> Path:
+        """The directory holding the cached copy of a remote file and its metadata."""
+        return self.directory / hashlib.sha256(str(path).encode()).hexdigest()
+
+    def localize(self, filepath: PathType, *, module: ModuleType | None = None) -> PathType:
+        """A local path with the current content of filepath, downloading the file only if the cached copy is stale.
+
+        Args:
+            filepath: Path to a (typically remote) file.
+            module: The dummio IO module that will load the file, if any, so that its sidecar files are cached too.
+        """
+        path = UPath(filepath)
+        if is_local(path):
+            return filepath
+        entry = self._entry(path)
+        # keep the original file name, for the sake of IO methods that depend on the extension:
+        local_path = entry / (path.name or "data")
+        metadata_path = entry / METADATA_FILENAME
+        # the remote files by local file name, with the sidecar files first, so that the data file is replaced last:
+        remote_sidecars = [] if module is None else sidecars(path, module=module)
+        remotes = {sidecar.name: sidecar for sidecar in remote_sidecars} | {local_path.name: path}
+        tags = {name: _sidecar_version_tag(remote) for name, remote in remotes.items() if remote is not path}
+        tags[local_path.name] = version_tag(path)
+        with self._lock:
+            if local_path.exists() and metadata_path.exists():
+                metadata = json.loads(metadata_path.read_text())
+                if metadata.get("tags") == tags:
+                    # the modification time of the metadata file tracks the most recent use:
+                    os.utime(metadata_path)
+                    return local_path
+        entry.mkdir(parents=True, exist_ok=True)
+        for name, remote in remotes.items():
+            if tags[name] is None:
+                (entry / name).unlink(missing_ok=True)
+                continue
+            partial_path = entry / f".{uuid.uuid4().hex}.partial"
+            try:
+                remote.fs.get_file(remote.path, str(partial_path))
+                os.replace(partial_path, entry / name)
+            finally:
+                partial_path.unlink(missing_ok=True)
+        size = sum((entry / name).stat().st_size for name, tag in tags.items() if tag is not None)
+        metadata = {"url": str(path), "tags": tags, "size": size}
+        with self._lock:
+            metadata_path.write_text(json.dumps(metadata))
+            self._evict(keep=entry)
+        return local_path
+
+    def load(self, filepath: PathType, *, module: ModuleType, **kwargs) -> Any:
+        """Load a file via the cache.
+
+        Args:
+            filepath: Path to read the data.
+            module: The dummio IO module to load with, such as `dummio.json` or `dummio.pandas.df_parquet`.
+            **kwargs: Additional keyword arguments for `module.load`.
+        """
+        return module.load(self.localize(filepath, module=module), **kwargs)
+
+    def size(self) -> int:
+        """Total size of the cached files, in bytes."""
+        return sum(size for _, _, size in self._entries())
+
+    def clear(self) -> None:
+        """Remove all cached files."""
+        with self._lock:
+            for entry, _, _ in self._entries():
+                self._remove(entry)
+
+    def _entries(self) -> list[tuple[Path, float, int]]:
+        """(entry directory, time of last use, size) of each complete cache entry."""
+        entries = []
+        if not self.directory.exists():
+            return entries
+        for entry in self.directory.iterdir():
+            metadata_path = entry / METADATA_FILENAME
+            try:
+                last_used = metadata_path.stat().st_mtime
+                size = json.loads(metadata_path.read_text())["size"]
+            except (FileNotFoundError, NotADirectoryError, json.JSONDecodeError):
+                continue
+            entries.append((entry, last_used, size))
+        return entries
+
+    @staticmethod
+    def _remove(entry: Path) -> None:
+        """Remove a cache entry directory and its files."""
+        for file in entry.iterdir():
+            file.unlink(missing_ok=True)
+        entry.rmdir()
+
+    def _evict(self, *, keep: Path) -> None:
+        """Remove the least recently used entries (other than `keep`) until the cache fits within max_bytes."""
+        entries = sorted(self._entries(), key=lambda item: item[1])
+        total = sum(size for _, _, size in entries)
+        for entry, _, size in entries:
+            if total <= self.max_bytes:
+                break
+            if entry == keep:
+                continue
+            self._remove(entry)
+            total -= size
@@ -0,0 +1,57 @@
+"""The `dummio` command line interface."""
+
+import argparse
+
+from dummio import bench
+
+
+def _positive_int(value: str) -> int:
+    """Parse a positive integer argument."""
+    number = int(value)
+    if number < 1:
+        raise argparse.ArgumentTypeError(f"expected a positive integer, got {value}")
+    return number
+
+
+def _bench(args: argparse.Namespace) -> None:
+    """Run the benchmarks, print a summary table, and optionally save the full results."""
+    cases = args.cases.split(",") if args.cases else None
+    results = bench.run(
+        cases,
+        rows=args.rows,
+        repeats=args.repeats,
+        directory=args.directory,
+        isolate=not args.in_process,
+    )
+    print(bench.format_table(results))
+    if args.output:
+        bench.save_report(results, filepath=args.output)
+        print(f"Saved results to {args.output}")
+
+
+def main(argv: list[str] | None = None) -> None:
+    """Run the dummio command line interface."""
+    parser = argparse.ArgumentParser(prog="dummio")
+    subparsers = parser.add_subparsers(required=True)
+
+    bench_parser = subparsers.add_parser("bench", help="Benchmark save/load of the dummio IO modules.")
+    bench_parser.add_argument("--cases", help=f"Comma-separated subset of {','.join(bench.CASES)}.")
+    bench_parser.add_argument("--rows", type=int, default=bench.DEFAULT_ROWS, help="Size of the generated datasets.")
+    bench_parser.add_argument(
+        "--repeats", type=_positive_int, default=bench.DEFAULT_REPEATS, help="Save/load cycles per case."
+    )
+    bench_parser.add_argument("--directory", help="Directory (possibly in the cloud) for the data files.")
+    bench_parser.add_argument("--output", help="Path at which to save the results as json.")
+    bench_parser.add_argument(
+        "--in-process",
+        action="store_true",
+        help="Run all cases in this process (faster, but peak memory is then cumulative across cases).",
+    )
+    bench_parser.set_defaults(func=_bench)
+
+    args = parser.parse_args(argv)
+    args.func(args)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,99 @@
+"""Transparent streaming compression, with the codec chosen by the trailing file extension.
+
+For example, `dummio.json.save(data, filepath="data.json.zst")` writes zstd-compressed json, and
+`dummio.json.load("data.json.zst")` decompresses it again. Data streams through the (de)compressor without buffering the
+full payload. Supported extensions:
+- `.gz`: gzip (standard library)
+- `.bz2`: bz2 (standard library)
+- `.zst`: zstd, requiring the optional `zstandard` package. This is the only codec that supports multiple threads.
+- `.lz4`: lz4 frames, requiring the optional `lz4` package.
+
+Modules that support compression accept `compression_level` and `compression_threads` arguments on save.
+"""
+
+import bz2
+import gzip
+import io
+from contextlib import contextmanager
+from typing import IO, Any, Iterator
+
+from upath import UPath
+
+from dummio.constants import DEFAULT_ENCODING, PathType
+
+GZIP = "gzip"
+BZ2 = "bz2"
+ZSTD = "zstd"
+LZ4 = "lz4"
+CODECS = {
+    ".gz": GZIP,
+    ".bz2": BZ2,
+    ".zst": ZSTD,
+    ".lz4": LZ4,
+}
+
+
+def codec(filepath: PathType) -> str | None:
+    """The name of the compression codec implied by the file extension, if any."""
+    return CODECS.get(UPath(filepath).suffix.lower())
+
+
+def _compressed_stream(name: str, raw: IO[bytes], mode: str, *, level: int | None, threads: int | None) -> IO[bytes]:
+    """Wrap a raw binary file in a (de)compressing binary stream. Closing the stream does not close the raw file."""
+    reading = mode.startswith("r")
+    if threads is not None and name != ZSTD:
+        raise ValueError(f"compression_threads is supported only for zstd, not {name}.")
+    if name == GZIP:
+        return gzip.GzipFile(fileobj=raw, mode=mode, compresslevel=9 if level is None else level)  # pyright: ignore[reportReturnType]
+    if name == BZ2:
+        return bz2.BZ2File(raw, mode=mode, compresslevel=9 if level is None else level)  # pyright: ignore[reportCallIssue, reportArgumentType, reportReturnType]
+    if name == ZSTD:
+        try:
+            import zstandard
+        except ImportError:
+            raise ImportError("Install zstandard to read and write .zst files")
+        # the zstandard streams are raw (unbuffered) streams, which some consumers (such as pandas) do not recognize as
+        # binary files, so wrap them in buffered streams:
+        if reading:
+            reader = zstandard.ZstdDecompressor().stream_reader(raw, read_across_frames=True, closefd=False)
+            return io.BufferedReader(reader)  # pyright: ignore[reportArgumentType]
+        compressor = zstandard.ZstdCompressor(level=3 if level is None else level, threads=threads or 0)
+        return io.BufferedWriter(compressor.stream_writer(raw, closefd=False))  # pyright: ignore[reportArgumentType]
+    try:
+        import lz4.frame
+    except ImportError:
+        raise ImportError("Install lz4 to read and write .lz4 files")
+    kwargs: dict[str, Any] = {} if level is None else {"compression_level": level}
+    return lz4.frame.LZ4FrameFile(raw, mode=mode, **kwargs)  # pyright: ignore[reportReturnType]
+
+
+@contextmanager
+def open_file(
+    filepath: PathType,
+    mode: str = "rb",
+    *,
+    encoding: str | None = None,
+    level: int | None = None,
+    threads: int | None = None,
+) -> Iterator[IO[Any]]:
+    """Open a file like `UPath.open`, transparently (de)compressing it if the extension implies a codec.
+
+    Args:
+        filepath: Path to the file.
+        mode: One of "r", "w", "a" (text modes) or "rb", "wb", "ab" (binary modes).
+        encoding: The text encoding, for text modes.
+        level: The compression level, for writing compressed files. Defaults to the codec's default level.
+        threads: Number of threads for zstd compression (0 for single-threaded, -1 for one per core).
+    """
+    path = UPath(filepath)
+    binary = "b" in mode
+    name = codec(path)
+    if name is None:
+        with path.open(mode) if binary else path.open(mode, encoding=encoding or DEFAULT_ENCODING) as file:
+            yield file
+        return
+    binary_mode = mode.replace("b", "").replace("t", "") + "b"
+    with path.open(binary_mode) as raw:
+        stream = _compressed_stream(name, raw, binary_mode, level=level, threads=threads)
+        with stream if binary else io.TextIOWrapper(stream, encoding=encoding or DEFAULT_ENCODING) as file:
+            yield file
@@ -3,20 +3,34 @@
 from typing import Any
 
 import dill
-from upath import UPath
 
+from dummio import compression
 from dummio.constants import PathType
+from dummio.hooks import instrument
 
 
-def save(data: Any, *, filepath: PathType) -> None:
-    """Save a pickle file."""
-    path = UPath(filepath)
-    with path.open("wb") as file:
+@instrument
+def save(
+    data: Any,
+    *,
+    filepath: PathType,
+    compression_level: int | None = None,
+    compression_threads: int | None = None,
+) -> None:
+    """Save a pickle file.
+
+    Args:
+        data: Data to save.
+        filepath: Path to save the data.
+        compression_level: Compression level, if the file extension implies compression (see dummio.compression).
+        compression_threads: Number of compression threads, for zstd compression.
+    """
+    with compression.open_file(filepath, "wb", level=compression_level, threads=compression_threads) as file:
         dill.dump(data, file)
 
 
+@instrument
 def load(filepath: PathType) -> Any:
     """Read a pickle file."""
-    path = UPath(filepath)
-    with path.open("rb") as file:
+    with compression.open_file(filepath, "rb") as file:
         return dill.load(file)
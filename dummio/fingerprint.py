@@ -0,0 +1,61 @@
+"""Schema fingerprints, stored in sidecar files, to detect files saved with a different version of a model.
+
+Trusted loads (such as `dummio.pydantic.load(..., trusted=True)`) skip validation, so they must not be applied to a file
+that was saved from a model whose schema has since changed. At save time, the sha256 digest of the model's json schema
+is written to a sidecar file next to the data file (named like the data file, plus SUFFIX). A trusted load compares the
+sidecar with the digest of the current schema, and fails fast on a mismatch.
+"""
+
+import hashlib
+import json
+from typing import Any
+
+from upath import UPath
+
+from dummio.constants import PathType
+
+SUFFIX = ".schema-sha256"
+
+
+def digest(schema: dict[str, Any]) -> str:
+    """The sha256 hex digest of a json schema, independent of the order of its keys."""
+    return hashlib.sha256(json.dumps(schema, sort_keys=True).encode()).hexdigest()
+
+
+def sidecar(filepath: PathType) -> UPath:
+    """The path of the fingerprint sidecar file of a data file."""
+    path = UPath(filepath)
+    return path.with_name(path.name + SUFFIX)
+
+
+def write(fingerprint: str, *, filepath: PathType) -> None:
+    """Write the fingerprint sidecar file of a data file."""
+    sidecar(filepath).write_text(fingerprint)
+
+
+def remove(*, filepath: PathType) -> None:
+    """Remove the fingerprint sidecar file of a data file, if any, before the data file is overwritten.
+
+    Otherwise, a stale fingerprint would let a trusted load skip validation of data that was never checked against it.
+    """
+    sidecar(filepath).unlink(missing_ok=True)
+
+
+def verify(fingerprint: str, *, filepath: PathType) -> None:
+    """Assert that the fingerprint sidecar file of a data file matches the expected fingerprint.
+
+    Raises:
+        ValueError: if the sidecar file is missing or its fingerprint does not match.
+    """
+    try:
+        stored = sidecar(filepath).read_text().strip()
+    except FileNotFoundError:
+        raise ValueError(
+            f"Cannot load {filepath} in trusted mode, since it has no schema fingerprint. Save it with "
+            "fingerprint=True."
+        )
+    if stored != fingerprint:
+        raise ValueError(
+            f"The schema fingerprint of {filepath} does not match the current model, so the file is stale. Load it "
+            "with trusted=False to validate it."
+        )
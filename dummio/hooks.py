@@ -0,0 +1,237 @@
+"""Instrumentation hooks around every dummio save/load.
+
+Register callbacks to observe IO, for example to export production metrics:
+```
+def on_finish(event: Event) -> None:
+    print(event.module, event.operation, event.protocol, event.duration_s, event.nbytes)
+
+dummio.hooks.register(on_finish=on_finish)
+```
+
+Each `save`/`load` calls the `on_start` callbacks with an `Event` before doing any IO, and the `on_finish` callbacks
+with the same event (now including its duration and any error) afterwards. Modules that serialize to bytes before
+writing them (or read bytes before deserializing them) also report how long each phase took, via `phase`, so that
+`Event.serialize_s` and `Event.transfer_s` split the duration into serialization and transfer. When no callbacks are
+registered, the only overhead is a check that both lists of callbacks are empty, plus a no-op context per phase.
+
+`Stats` is a built-in aggregator of per-module counters and latency histograms:
+```
+stats = Stats()
+stats.install()
+...
+print(stats.summary())
+```
+"""
+
+import functools
+import threading
+import time
+from contextlib import AbstractContextManager, nullcontext
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from types import TracebackType
+from typing import Any, Callable, Literal, ParamSpec, TypeVar
+
+from upath import UPath
+
+from dummio.constants import PathType
+
+P = ParamSpec("P")
+R = TypeVar("R")
+
+Hook = Callable[["Event"], None]
+
+_START_HOOKS: list[Hook] = []
+_FINISH_HOOKS: list[Hook] = []
+
+SERIALIZE = "serialize"
+TRANSFER = "transfer"
+Phase = Literal["serialize", "transfer"]
+
+# The event of the save/load in progress, if any hooks are registered:
+_CURRENT_EVENT: ContextVar["Event | None"] = ContextVar("dummio_hooks_event", default=None)
+_NO_PHASE = nullcontext()
+
+# Upper bounds (in seconds) of the buckets of the latency histograms of `Stats`; the last bucket is unbounded:
+LATENCY_BUCKETS = (0.001, 0.005, 0.01, 0.05, 0.1, 0.5, 1.0, 5.0, 10.0, float("inf"))
+
+
+@dataclass
+class Event:
+    """A single save or load, as seen by the hooks.
+
+    `serialize_s` and `transfer_s` are the total time spent (de)serializing and reading/writing bytes, for modules that
+    report these phases, and None otherwise. For memory-mapped local files, reading happens during deserialization.
+    """
+
+    module: str
+    operation: str
+    filepath: PathType
+    started_at: float = field(default_factory=time.perf_counter)
+    duration_s: float | None = None
+    serialize_s: float | None = None
+    transfer_s: float | None = None
+    error: BaseException | None = None
+    _nbytes: int | None = field(default=None, repr=False)
+
+    @property
+    def protocol(self) -> str:
+        """The filesystem protocol of the filepath, e.g. "s3" or "gs", or "file" for local files."""
+        return UPath(self.filepath).protocol or "file"
+
+    @property
+    def nbytes(self) -> int | None:
+        """The size of the file in bytes, or None if it does not exist (such as after a failed save).
+
+        This is looked up when first accessed (which, for remote files, is a metadata request), so that hooks that do
+        not need it do not pay for it.
+        """
+        if self._nbytes is None:
+            path = UPath(self.filepath)
+            try:
+                self._nbytes = path.fs.size(path.path)
+            except FileNotFoundError:
+                return None
+        return self._nbytes
+
+
+class _Timer:
+    """Add the time spent within the context to a phase of an event."""
+
+    def __init__(self, event: Event, attribute: str) -> None:
+        self.event = event
+        self.attribute = attribute
+
+    def __enter__(self) -> None:
+        self.started_at = time.perf_counter()
+
+    def __exit__(
+        self, exc_type: type[BaseException] | None, exc: BaseException | None, traceback: TracebackType | None
+    ) -> None:
+        elapsed = time.perf_counter() - self.started_at
+        setattr(self.event, self.attribute, (getattr(self.event, self.attribute) or 0.0) + elapsed)
+
+
+def phase(name: Phase) -> AbstractContextManager[None]:
+    """A context that times a phase of the save/load in progress, for modules to report serialization and transfer.
+
+    For example, `with phase(SERIALIZE): payload = serialize(data)`. This is a no-op when no hooks are registered.
+    """
+    event = _CURRENT_EVENT.get()
+    if event is None:
+        return _NO_PHASE
+    return _Timer(event, f"{name}_s")
+
+
+def register(*, on_start: Hook | None = None, on_finish: Hook | None = None) -> None:
+    """Register callbacks to be called at the start and/or finish of every save and load."""
+    if on_start is not None:
+        _START_HOOKS.append(on_start)
+    if on_finish is not None:
+        _FINISH_HOOKS.append(on_finish)
+
+
+def unregister(*, on_start: Hook | None = None, on_finish: Hook | None = None) -> None:
+    """Unregister callbacks that were previously registered."""
+    if on_start is not None:
+        _START_HOOKS.remove(on_start)
+    if on_finish is not None:
+        _FINISH_HOOKS.remove(on_finish)
+
+
+def instrument(func: Callable[P, R]) -> Callable[P, R]:
+    """Decorate a module's save or load method to call the registered hooks."""
+    module = func.__module__
+    operation = func.__name__
+
+    @functools.wraps(func)
+    def wrapper(*args: P.args, **kwargs: P.kwargs) -> R:
+        if not _START_HOOKS and not _FINISH_HOOKS:
+            return func(*args, **kwargs)
+        filepath: Any = kwargs["filepath"] if "filepath" in kwargs else args[0]
+        event = Event(module=module, operation=operation, filepath=filepath)
+        for hook in _START_HOOKS:
+            hook(event)
+        token = _CURRENT_EVENT.set(event)
+        try:
+            return func(*args, **kwargs)
+        except BaseException as err:
+            event.error = err
+            raise
+        finally:
+            _CURRENT_EVENT.reset(token)
+            event.duration_s = time.perf_counter() - event.started_at
+            for hook in _FINISH_HOOKS:
+                hook(event)
+
+    return wrapper
+
+
+@dataclass
+class _ModuleStats:
+    """Counters and a latency histogram for one (module, operation, protocol)."""
+
+    count: int = 0
+    errors: int = 0
+    nbytes: int = 0
+    total_duration_s: float = 0.0
+    total_serialize_s: float = 0.0
+    total_transfer_s: float = 0.0
+    latency_histogram: list[int] = field(default_factory=lambda: [0] * len(LATENCY_BUCKETS))
+
+
+class Stats:
+    """Aggregate per-format counters and latency histograms of all saves and loads."""
+
+    def __init__(self, *, count_bytes: bool = False) -> None:
+        """Configure the aggregator.
+
+        Args:
+            count_bytes: If true, also sum the sizes of the files. This costs a metadata request per remote file.
+        """
+        self.count_bytes = count_bytes
+        self._stats: dict[tuple[str, str, str], _ModuleStats] = {}
+        self._lock = threading.Lock()
+
+    def install(self) -> None:
+        """Start aggregating events."""
+        register(on_finish=self.on_finish)
+
+    def uninstall(self) -> None:
+        """Stop aggregating events."""
+        unregister(on_finish=self.on_finish)
+
+    def on_finish(self, event: Event) -> None:
+        """Add a finished event to the aggregates."""
+        assert event.duration_s is not None, "expected a finished event"
+        nbytes = (event.nbytes or 0) if self.count_bytes and event.error is None else 0
+        bucket = next(i for i, bound in enumerate(LATENCY_BUCKETS) if event.duration_s <= bound)
+        key = (event.module, event.operation, event.protocol)
+        with self._lock:
+            stats = self._stats.setdefault(key, _ModuleStats())
+            stats.count += 1
+            stats.errors += event.error is not None
+            stats.nbytes += nbytes
+            stats.total_duration_s += event.duration_s
+            stats.total_serialize_s += event.serialize_s or 0.0
+            stats.total_transfer_s += event.transfer_s or 0.0
+            stats.latency_histogram[bucket] += 1
+
+    def summary(self) -> list[dict[str, Any]]:
+        """The aggregates, one record per (module, operation, protocol)."""
+        with self._lock:
+            return [
+                {
+                    "module": module,
+                    "operation": operation,
+                    "protocol": protocol,
+                    "count": stats.count,
+                    "errors": stats.errors,
+                    "nbytes": stats.nbytes,
+                    "total_duration_s": stats.total_duration_s,
+                    "total_serialize_s": stats.total_serialize_s,
+                    "total_transfer_s": stats.total_transfer_s,
+                    "latency_histogram": dict(zip(LATENCY_BUCKETS, stats.latency_histogram)),
+                }
+                for (module, operation, protocol), stats in self._stats.items()
+            ]
@@ -4,9 +4,12 @@ import json
 
 from upath import UPath
 
+from dummio import compression
 from dummio.constants import DEFAULT_ENCODING, DEFAULT_WRITE_MODE, AnyDict, PathType
+from dummio.hooks import instrument
 
 
+@instrument
 def save(
     data: AnyDict,
     *,
@@ -14,6 +17,8 @@ def save(
     encoding: str = DEFAULT_ENCODING,
     mode: str = DEFAULT_WRITE_MODE,
     indent: int = 4,
+    compression_level: int | None = None,
+    compression_threads: int | None = None,
 ) -> None:
     """Save a json file.
 
@@ -23,8 +28,15 @@ def save(
         encoding: Encoding to use.
         mode: Write mode.
         indent: Number of spaces of indentation for the json file.
+        compression_level: Compression level, if the file extension implies compression (see dummio.compression).
+        compression_threads: Number of compression threads, for zstd compression.
     """
-    if isinstance(filepath, UPath):
+    if compression.codec(filepath):
+        with compression.open_file(
+            filepath, mode, encoding=encoding, level=compression_level, threads=compression_threads
+        ) as file:
+            json.dump(data, file, indent=indent)
+    elif isinstance(filepath, UPath):
         data_str = json.dumps(data, indent=indent)
         filepath.write_text(data_str, encoding=encoding)
     else:
@@ -32,8 +44,12 @@ def save(
             json.dump(data, file)
 
 
+@instrument
 def load(filepath: PathType, encoding: str = DEFAULT_ENCODING) -> AnyDict:
     """Read a json file."""
+    if compression.codec(filepath):
+        with compression.open_file(filepath, "r", encoding=encoding) as file:
+            return json.load(file)
     if isinstance(filepath, UPath):
         data_str = filepath.read_text(encoding=encoding)
         return json.loads(data_str)
@@ -0,0 +1,81 @@
+"""IO for JSON Lines (one json document per line) using orjson.
+
+Records are encoded in batches on save, and can be decoded lazily, line by line, on load, so that large logs stream in
+constant memory:
+```
+dummio.jsonl.save(events, filepath="events.jsonl")  # events may be any iterable, such as a generator
+for event in dummio.jsonl.load("events.jsonl", lazy=True):
+    ...
+```
+"""
+
+from itertools import islice
+from typing import Iterable, Iterator, Literal, overload
+
+import orjson
+
+from dummio import compression
+from dummio.constants import AnyDict, PathType
+from dummio.hooks import instrument
+
+# Number of records to encode per write:
+DEFAULT_BATCH_SIZE = 1000
+
+
+@instrument
+def save(
+    data: Iterable[AnyDict],
+    *,
+    filepath: PathType,
+    mode: Literal["w", "a"] = "w",
+    option: int | None = None,
+    batch_size: int = DEFAULT_BATCH_SIZE,
+    compression_level: int | None = None,
+    compression_threads: int | None = None,
+) -> None:
+    """Save records as a JSON Lines file.
+
+    Args:
+        data: Records to save. This may be any iterable, such as a generator; it is consumed batch by batch.
+        filepath: Path to save the data.
+        mode: Write mode: "w" to overwrite, or "a" to append to an existing file.
+        option: orjson options flag, e.g., orjson.OPT_SERIALIZE_NUMPY. Indentation options are not supported, since
+            each record must be on a single line.
+        batch_size: Number of records to encode per write.
+        compression_level: Compression level, if the file extension implies compression (see dummio.compression).
+        compression_threads: Number of compression threads, for zstd compression.
+    """
+    option = (option or 0) | orjson.OPT_APPEND_NEWLINE
+    records = iter(data)
+    with compression.open_file(filepath, mode + "b", level=compression_level, threads=compression_threads) as file:
+        while batch := list(islice(records, batch_size)):
+            file.write(b"".join(orjson.dumps(record, option=option) for record in batch))
+
+
+def _iter_records(filepath: PathType) -> Iterator[AnyDict]:
+    """Decode the records of a JSON Lines file one line at a time, skipping blank lines."""
+    with compression.open_file(filepath, "rb") as file:
+        for line in file:
+            if line.strip():
+                yield orjson.loads(line)
+
+
+@overload
+def load(filepath: PathType, *, lazy: Literal[False] = False) -> list[AnyDict]: ...
+
+
+@overload
+def load(filepath: PathType, *, lazy: Literal[True]) -> Iterator[AnyDict]: ...
+
+
+@instrument
+def load(filepath: PathType, *, lazy: bool = False) -> Iterable[AnyDict]:
+    """Read a JSON Lines file.
+
+    Args:
+        filepath: Path to read the data.
+        lazy: If true, return a generator that opens the file when first advanced and decodes one line at a time,
+            holding only one record in memory. Otherwise, return a list of all records.
+    """
+    records = _iter_records(filepath)
+    return records if lazy else list(records)
@@ -0,0 +1,67 @@
+"""Lists of mashumaro dataclasses, encoded and decoded with codecs compiled once per dataclass.
+
+This is the shared implementation of `save_list`/`load_list` of the mashumaro modules that serialize to bytes (see
+dummio.mashumaro.orjson and dummio.mashumaro.msgpack), which differ only in their codec classes.
+"""
+
+from functools import lru_cache
+from typing import Any, Callable, Protocol, TypeVar
+
+T = TypeVar("T")
+
+# Number of dataclasses for which to keep compiled codecs:
+CACHE_SIZE = 128
+
+
+def list_model(data: list[Any], model: type | None = None) -> type | None:
+    """The dataclass of the items of a list, or None for an empty list of unknown dataclass.
+
+    Raises:
+        ValueError: if the model is not given and the items are not all of the same dataclass, since each item would be
+            encoded with the fields of the first.
+    """
+    if model is not None or not data:
+        return model
+    types = {type(item) for item in data}
+    if len(types) > 1:
+        names = sorted(type_.__name__ for type_ in types)
+        raise ValueError(f"Cannot save a list of mixed types {names} without specifying the model.")
+    return types.pop()
+
+
+class Encoder(Protocol):
+    """A compiled mashumaro encoder to bytes."""
+
+    def encode(self, obj: Any) -> bytes:
+        """Encode an object."""
+        ...
+
+
+class Decoder(Protocol):
+    """A compiled mashumaro decoder from bytes."""
+
+    def decode(self, data: bytes) -> Any:
+        """Decode an object."""
+        ...
+
+
+class ListCodec:
+    """Encode and decode lists of dataclasses, with an encoder and decoder compiled once per dataclass."""
+
+    def __init__(self, encoder: Callable[[Any], Encoder], decoder: Callable[[Any], Decoder]) -> None:
+        """Configure the codec.
+
+        Args:
+            encoder: The mashumaro encoder class, such as `mashumaro.codecs.orjson.ORJSONEncoder`.
+            decoder: The mashumaro decoder class, such as `mashumaro.codecs.orjson.ORJSONDecoder`.
+        """
+        self._encoder = lru_cache(maxsize=CACHE_SIZE)(lambda model: encoder(list[model]))
+        self._decoder = lru_cache(maxsize=CACHE_SIZE)(lambda model: decoder(list[model]))
+
+    def encode(self, data: list[Any], *, model: type | None = None) -> bytes:
+        """Encode a list of instances of the same dataclass, as an array."""
+        return self._encoder(list_model(data, model) or Any).encode(data)
+
+    def decode(self, content: bytes, *, model: type[T]) -> list[T]:
+        """Decode an array of instances of the dataclass."""
+        return self._decoder(model).decode(content)
@@ -2,37 +2,91 @@
 
 This module supports IO only for a particular simple case of mashumaro dataclasses, where the class inherits from
 `DataClassJSONMixin`. This mixin provides serialization and deserialization methods to and from dictionaries.
+
+Files written by trusted pipelines can be loaded faster with `load(..., trusted=True)`, which decodes the json with
+orjson and passes the result to the (compiled, per-class) `from_dict` decoder of mashumaro. Trusted loads require a
+schema fingerprint, written by `save(..., fingerprint=True)` (see dummio.fingerprint), so that a file saved with an
+older version of the dataclass fails fast.
 """
 
+from functools import lru_cache
 from typing import Type, TypeVar
 
+from mashumaro.jsonschema import build_json_schema
 from mashumaro.mixins.json import DataClassJSONMixin
 from upath import UPath
 
+from dummio import fingerprint as fingerprint_
 from dummio.constants import PathType
+from dummio.hooks import SERIALIZE, TRANSFER, instrument, phase
 
 T = TypeVar("T", bound=DataClassJSONMixin)
 
+# Suffixes of the sidecar files that `save` may write next to the data file (see dummio.utils.sidecars):
+SIDECAR_SUFFIXES = (fingerprint_.SUFFIX,)
+
 
+@instrument
 def save(
     data: DataClassJSONMixin,
     *,
     filepath: PathType,
+    fingerprint: bool = False,
 ) -> None:
-    """Save a mashumaro dataclass instance to a json text file."""
-    json_str = data.to_json()
+    """Save a mashumaro dataclass instance to a json text file.
+
+    Args:
+        data: The dataclass instance to save.
+        filepath: Path to save the data.
+        fingerprint: If true, also write the fingerprint of the dataclass's json schema to a sidecar file, which is
+            required for loading the file with trusted=True.
+    """
+    with phase(SERIALIZE):
+        json_str = data.to_json()
     assert isinstance(json_str, str), "expected a string from to_json()"
-    UPath(filepath).write_text(json_str)
+    fingerprint_.remove(filepath=filepath)
+    with phase(TRANSFER):
+        UPath(filepath).write_text(json_str)
+    if fingerprint:
+        fingerprint_.write(schema_fingerprint(type(data)), filepath=filepath)
 
 
+@instrument
 def load(
     filepath: PathType,
     *,
     model: Type[T],
+    trusted: bool = False,
 ) -> T:
-    """Load a mashumaro dataclass instance from a json text file."""
-    json_str = UPath(filepath).read_text()
-    return model.from_json(json_str)
+    """Load a mashumaro dataclass instance from a json text file.
+
+    Args:
+        filepath: Path to read the data.
+        model: The dataclass of the data.
+        trusted: If true, take the fast path for trusted files (see module docstring). The file must have been saved
+            with fingerprint=True from a dataclass with the same schema.
+
+    Raises:
+        ValueError: if trusted and the schema fingerprint of the file is missing or does not match the dataclass.
+    """
+    if trusted:
+        fingerprint_.verify(schema_fingerprint(model), filepath=filepath)
+        import orjson
+
+        with phase(TRANSFER):
+            content = UPath(filepath).read_bytes()
+        with phase(SERIALIZE):
+            return model.from_dict(orjson.loads(content))
+    with phase(TRANSFER):
+        json_str = UPath(filepath).read_text()
+    with phase(SERIALIZE):
+        return model.from_json(json_str)
+
+
+@lru_cache(maxsize=None)
+def schema_fingerprint(model: type[DataClassJSONMixin]) -> str:
+    """The fingerprint of the json schema of a dataclass."""
+    return fingerprint_.digest(build_json_schema(model).to_dict())
 
 
 def example(filepath: PathType) -> None:
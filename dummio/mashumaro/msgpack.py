@@ -0,0 +1,83 @@
+"""IO for mashumaro dataclasses using MessagePack.
+
+This module supports IO for mashumaro dataclasses that inherit from `DataClassMessagePackMixin`, which serializes to and
+from the compact binary MessagePack format via msgpack, and is typically much faster than `DataClassJSONMixin` (see
+dummio.mashumaro.json).
+
+Besides `save`/`load` of one dataclass instance per file, `save_list`/`load_list` write and read a MessagePack array of
+instances of the same dataclass, with an encoder and decoder compiled once per dataclass (see dummio.mashumaro.codecs).
+"""
+
+from typing import Type, TypeVar
+
+from mashumaro.codecs.msgpack import MessagePackDecoder, MessagePackEncoder
+from mashumaro.mixins.msgpack import DataClassMessagePackMixin
+from upath import UPath
+
+from dummio.constants import PathType
+from dummio.hooks import SERIALIZE, TRANSFER, instrument, phase
+from dummio.mashumaro import codecs
+
+T = TypeVar("T", bound=DataClassMessagePackMixin)
+
+
+@instrument
+def save(
+    data: DataClassMessagePackMixin,
+    *,
+    filepath: PathType,
+) -> None:
+    """Save a mashumaro dataclass instance to a MessagePack file."""
+    with phase(SERIALIZE):
+        content = data.to_msgpack()
+    with phase(TRANSFER):
+        UPath(filepath).write_bytes(content)
+
+
+@instrument
+def load(
+    filepath: PathType,
+    *,
+    model: Type[T],
+) -> T:
+    """Load a mashumaro dataclass instance from a MessagePack file."""
+    with phase(TRANSFER):
+        content = UPath(filepath).read_bytes()
+    with phase(SERIALIZE):
+        return model.from_msgpack(content)
+
+
+_LISTS = codecs.ListCodec(MessagePackEncoder, MessagePackDecoder)
+
+
+@instrument
+def save_list(
+    data: list[T],
+    *,
+    filepath: PathType,
+    model: Type[T] | None = None,
+) -> None:
+    """Save a list of mashumaro dataclass instances to a MessagePack file, as an array.
+
+    Args:
+        data: The dataclass instances to save, which may be an empty list.
+        filepath: Path to save the data.
+        model: The dataclass of the instances. Defaults to their common type, and is required for a list of mixed types.
+    """
+    with phase(SERIALIZE):
+        content = _LISTS.encode(data, model=model)
+    with phase(TRANSFER):
+        UPath(filepath).write_bytes(content)
+
+
+@instrument
+def load_list(
+    filepath: PathType,
+    *,
+    model: Type[T],
+) -> list[T]:
+    """Load a list of mashumaro dataclass instances from a MessagePack file."""
+    with phase(TRANSFER):
+        content = UPath(filepath).read_bytes()
+    with phase(SERIALIZE):
+        return _LISTS.decode(content, model=model)
@@ -10,10 +10,12 @@ from mashumaro.mixins.yaml import DataClassYAMLMixin
 from upath import UPath
 
 from dummio.constants import PathType
+from dummio.hooks import instrument
 
 T = TypeVar("T", bound=DataClassYAMLMixin)
 
 
+@instrument
 def save(
     data: DataClassYAMLMixin,
     *,
@@ -25,6 +27,7 @@ def save(
     UPath(filepath).write_text(yaml_str)
 
 
+@instrument
 def load(
     filepath: PathType,
     *,
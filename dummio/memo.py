@@ -0,0 +1,281 @@
+"""Opt-in in-process memoization of `load` for any dummio IO module.
+
+A `Memo` remembers loaded objects keyed by module, path, and load kwargs. Each call checks the file's version tag
+(derived from its modification time locally, or its ETag or similar for remote files) and loads the file again only if
+the file changed. The least recently used objects are evicted once their total estimated size exceeds `max_bytes`.
+
+Since the same object is handed to many callers, it must not be modified in place. The `policy` controls how:
+- "copy" (default): every call returns a deep copy of the memoized object.
+- "readonly": every call returns the same frozen object, where dicts, lists, and sets (including subclasses, such as
+    the ordered maps loaded by dummio.yaml) are replaced by subclasses that raise TypeError on modification, and numpy
+    arrays are not writeable. This avoids the copy while keeping the loaded types, so the object still compares equal
+    to, and json-serializes like, an unfrozen load. Other mutable objects (such as data frames) are shared as is. A
+    deep copy of a frozen object is an ordinary, mutable one; make one before saving it with dummio.yaml, whose
+    representers only accept the exact loaded types.
+
+Example:
+```
+memo = Memo(max_bytes=2**28, policy="readonly")
+config = memo.load("config.yaml", module=dummio.yaml)
+```
+"""
+
+import copy
+import sys
+import threading
+from collections import OrderedDict
+from contextlib import contextmanager
+from dataclasses import dataclass
+from functools import cache
+from types import ModuleType
+from typing import Any, Iterator, Literal, SupportsIndex, TypeAlias
+
+from upath import UPath
+
+from dummio.cache import version_tag
+from dummio.constants import PathType
+
+Policy: TypeAlias = Literal["copy", "readonly"]
+
+DEFAULT_MAX_BYTES = 2**28
+
+
+def estimate_size(obj: Any) -> int:
+    """Estimate the memory footprint of an object in bytes, including the objects it contains."""
+    seen: set[int] = set()
+
+    def _size(item: Any) -> int:
+        if id(item) in seen:
+            return 0
+        seen.add(id(item))
+        memory_usage = getattr(item, "memory_usage", None)
+        if callable(memory_usage) and hasattr(item, "index"):
+            # a pandas data frame or series
+            usage: Any = memory_usage(deep=True)
+            return int(usage.sum()) if hasattr(usage, "sum") else int(usage)
+        size = sys.getsizeof(item)
+        nbytes = getattr(item, "nbytes", None)
+        if isinstance(nbytes, int):
+            # a numpy array, possibly a view whose data is not counted by getsizeof
+            return max(size, nbytes)
+        if isinstance(item, dict):
+            return size + sum(_size(key) + _size(value) for key, value in item.items())
+        if isinstance(item, (list, tuple, set, frozenset)):
+            return size + sum(_size(element) for element in item)
+        if hasattr(item, "__dict__"):
+            return size + _size(vars(item))
+        return size
+
+    return _size(obj)
+
+
+# Methods that modify a dict, list, or set (or a subclass, such as an OrderedDict) in place:
+_MUTATORS = (
+    "__setitem__", "__delitem__", "__iadd__", "__imul__", "__ior__", "__iand__", "__isub__", "__ixor__", "add",
+    "append", "clear", "difference_update", "discard", "extend", "insert", "intersection_update", "move_to_end", "pop",
+    "popitem", "remove", "reverse", "setdefault", "sort", "subtract", "symmetric_difference_update", "update",
+)  # fmt: skip
+
+# Held while a frozen object is temporarily given back its original class, to copy it:
+_THAW_LOCK = threading.RLock()
+
+
+def _readonly(self: Any, *args, **kwargs) -> Any:
+    raise TypeError(f"'{type(self).__name__}' object is read-only")
+
+
+class ReadOnlyDict(dict):
+    """A dict that raises TypeError on modification."""
+
+    __setitem__ = __delitem__ = __ior__ = _readonly
+    clear = pop = popitem = setdefault = update = _readonly
+
+    def __reduce__(self) -> tuple:
+        """Copy and pickle as an ordinary dict."""
+        return (dict, (dict(self),))
+
+
+class ReadOnlyList(list):
+    """A list that raises TypeError on modification."""
+
+    __setitem__ = __delitem__ = __iadd__ = __imul__ = _readonly
+    append = clear = extend = insert = pop = remove = reverse = sort = _readonly
+
+    def __reduce__(self) -> tuple:
+        """Copy and pickle as an ordinary list."""
+        return (list, (list(self),))
+
+
+class ReadOnlySet(set):
+    """A set that raises TypeError on modification."""
+
+    __ior__ = __iand__ = __isub__ = __ixor__ = _readonly
+    add = clear = discard = pop = remove = update = _readonly
+    difference_update = intersection_update = symmetric_difference_update = _readonly
+
+    def __reduce__(self) -> tuple:
+        """Copy and pickle as an ordinary set."""
+        return (set, (set(self),))
+
+
+@contextmanager
+def _thawed(obj: Any) -> Iterator[None]:
+    """Temporarily give a frozen instance of a subclass back its original class."""
+    frozen = type(obj)
+    with _THAW_LOCK:
+        obj.__class__ = frozen.__bases__[1]
+        try:
+            yield
+        finally:
+            obj.__class__ = frozen
+
+
+class _ReadOnlySubclass:
+    """Base of the read-only versions of subclasses of dict, list, and set, which copy and pickle as the original."""
+
+    __slots__ = ()
+
+    def __deepcopy__(self, memo: dict[int, Any]) -> Any:
+        """A mutable deep copy, of the original class."""
+        with _thawed(self):
+            return copy.deepcopy(self, memo)
+
+    def __copy__(self) -> Any:
+        """A mutable shallow copy, of the original class."""
+        with _thawed(self):
+            return copy.copy(self)
+
+    def __reduce_ex__(self, protocol: SupportsIndex) -> Any:
+        """Pickle as a shallow copy of the original class."""
+        return (copy.copy, (copy.copy(self),))
+
+
+@cache
+def _readonly_subclass(cls: type) -> type:
+    """A subclass of cls that raises TypeError on modification."""
+    mutators = {name: _readonly for name in _MUTATORS if hasattr(cls, name)}
+    namespace = {"__slots__": (), "__module__": __name__, **mutators}
+    return type(f"ReadOnly{cls.__name__}", (_ReadOnlySubclass, cls), namespace)
+
+
+def _freeze_subclass(obj: Any) -> Any:
+    """Freeze an instance of a subclass of dict, list, or set in place, by switching it to a read-only subclass."""
+    if isinstance(obj, dict):
+        for key, value in list(obj.items()):
+            obj[key] = freeze(value)
+    elif isinstance(obj, list):
+        for i, element in enumerate(obj):
+            obj[i] = freeze(element)
+    try:
+        obj.__class__ = _readonly_subclass(type(obj))
+    except TypeError as exc:
+        raise TypeError(f"Cannot freeze an object of type '{type(obj).__name__}'") from exc
+    return obj
+
+
+def freeze(obj: Any) -> Any:
+    """A read-only version of an object that keeps its type: dicts, lists, and sets become read-only subclasses.
+
+    Instances of subclasses of dict, list, and set that are defined in Python (such as the ordered maps loaded by
+    dummio.yaml) are frozen in place.
+
+    Raises:
+        TypeError: if an instance of such a subclass can not be switched to a read-only subclass, as for subclasses
+            implemented in C (such as OrderedDict).
+    """
+    if type(obj) is dict:
+        return ReadOnlyDict({key: freeze(value) for key, value in obj.items()})
+    if type(obj) is list:
+        return ReadOnlyList(freeze(element) for element in obj)
+    if type(obj) is tuple:
+        return tuple(freeze(element) for element in obj)
+    if type(obj) is set:
+        return ReadOnlySet(obj)
+    if isinstance(obj, (dict, list, set)):
+        if isinstance(obj, (ReadOnlyDict, ReadOnlyList, ReadOnlySet, _ReadOnlySubclass)):
+            return obj
+        return _freeze_subclass(obj)
+    if hasattr(obj, "setflags") and hasattr(obj, "view"):
+        # a numpy array
+        view = obj.view()
+        view.setflags(write=False)
+        return view
+    return obj
+
+
+@dataclass
+class _Entry:
+    """A memoized object."""
+
+    tag: str
+    value: Any
+    size: int
+
+
+class Memo:
+    """A size-bounded in-process memo of loaded objects, invalidated when the underlying file changes."""
+
+    def __init__(self, *, max_bytes: int = DEFAULT_MAX_BYTES, policy: Policy = "copy") -> None:
+        """Configure the memo.
+
+        Args:
+            max_bytes: Maximum total estimated size of the memoized objects.
+            policy: How to protect memoized objects from modification by callers: "copy" or "readonly".
+        """
+        if policy not in ("copy", "readonly"):
+            raise ValueError(f"Unsupported policy '{policy}'")
+        self.max_bytes = max_bytes
+        self.policy = policy
+        self._entries: OrderedDict[tuple[str, str, str], _Entry] = OrderedDict()
+        self._lock = threading.Lock()
+
+    @property
+    def size(self) -> int:
+        """Total estimated size of the memoized objects, in bytes."""
+        return sum(entry.size for entry in self._entries.values())
+
+    def __len__(self) -> int:
+        """Number of memoized objects."""
+        return len(self._entries)
+
+    def clear(self) -> None:
+        """Forget all memoized objects."""
+        with self._lock:
+            self._entries.clear()
+
+    def load(self, filepath: PathType, *, module: ModuleType, **kwargs) -> Any:
+        """Load a file, reusing the memoized object if the file has not changed since it was loaded.
+
+        Args:
+            filepath: Path to read the data.
+            module: The dummio IO module to load with, such as `dummio.json` or `dummio.yaml`.
+            **kwargs: Additional keyword arguments for `module.load`.
+        """
+        key = (module.__name__, str(UPath(filepath)), repr(sorted(kwargs.items())))
+        tag = version_tag(filepath)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry.tag == tag:
+                self._entries.move_to_end(key)
+                return self._protect(entry.value)
+        value = module.load(filepath, **kwargs)
+        if self.policy == "readonly":
+            value = freeze(value)
+        entry = _Entry(tag=tag, value=value, size=estimate_size(value))
+        with self._lock:
+            self._entries.pop(key, None)
+            if entry.size <= self.max_bytes:
+                self._entries[key] = entry
+                self._evict()
+        return self._protect(value)
+
+    def _protect(self, value: Any) -> Any:
+        """Return a memoized value to a caller in accordance with the policy."""
+        return copy.deepcopy(value) if self.policy == "copy" else value
+
+    def _evict(self) -> None:
+        """Forget the least recently used objects until the memo fits within max_bytes."""
+        total = self.size
+        while total > self.max_bytes and self._entries:
+            _, entry = self._entries.popitem(last=False)
+            total -= entry.size
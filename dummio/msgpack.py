@@ -0,0 +1,162 @@
+"""IO for dictionaries (and other simple objects) using MessagePack, a compact binary alternative to json.
+
+In addition to the types that json supports, this module supports:
+- bytes, which are stored as is rather than text-encoded,
+- datetimes: timezone-aware datetimes use the standard MessagePack timestamp type and load as UTC datetimes, while naive
+    datetimes are stored in an extension type and load as naive datetimes, and
+- numpy arrays (of non-object dtypes), which are stored in an extension type and load as read-only arrays backed by the
+    decoded bytes, without a further copy.
+
+Local files are memory-mapped for unpacking. Files holding a sequence of objects, such as records appended one at a
+time, can be written with `save_stream` and read one object at a time with `iter_load`, in constant memory.
+"""
+
+import datetime
+import mmap
+from itertools import islice
+from typing import Any, Iterable, Iterator, Literal
+
+import msgpack
+from upath import UPath
+
+from dummio import compression
+from dummio.constants import AnyDict, PathType
+from dummio.hooks import SERIALIZE, TRANSFER, instrument, phase
+from dummio.utils import is_local, read_into
+
+# Extension type codes:
+NUMPY_EXT = 1
+NAIVE_DATETIME_EXT = 2
+
+# Number of bytes to read from the file per step of `iter_load`:
+DEFAULT_CHUNK_BYTES = 1 << 20
+
+# Number of objects to pack per write in `save_stream`:
+DEFAULT_BATCH_SIZE = 1000
+
+
+def _default(obj: Any) -> Any:
+    """Encode the types that msgpack does not support natively as extension types."""
+    if isinstance(obj, datetime.datetime):
+        # timezone-aware datetimes are packed natively as timestamps, so this is a naive datetime:
+        return msgpack.ExtType(NAIVE_DATETIME_EXT, obj.isoformat().encode())
+    if type(obj).__module__ == "numpy" and hasattr(obj, "dtype"):
+        if type(obj).__name__ != "ndarray":
+            # a numpy scalar
+            return obj.item()
+        if obj.dtype.hasobject:
+            raise TypeError("Cannot pack numpy arrays with object dtype")
+        header = msgpack.packb([obj.dtype.str, list(obj.shape)])
+        return msgpack.ExtType(NUMPY_EXT, header + obj.tobytes())
+    raise TypeError(f"Cannot pack objects of type {type(obj)}")
+
+
+def _ext_hook(code: int, data: bytes) -> Any:
+    """Decode the extension types of `_default`."""
+    if code == NAIVE_DATETIME_EXT:
+        return datetime.datetime.fromisoformat(data.decode())
+    if code == NUMPY_EXT:
+        import numpy as np
+
+        unpacker = msgpack.Unpacker()
+        unpacker.feed(data)
+        dtype, shape = unpacker.unpack()
+        # a read-only view of the extension data, rather than a copy:
+        return np.frombuffer(data, dtype=dtype, offset=unpacker.tell()).reshape(shape)
+    return msgpack.ExtType(code, data)
+
+
+def _packer() -> msgpack.Packer:
+    return msgpack.Packer(default=_default, use_bin_type=True, datetime=True)
+
+
+_UNPACK_KWARGS: dict[str, Any] = {
+    "raw": False,
+    "strict_map_key": False,
+    "timestamp": 3,
+    "ext_hook": _ext_hook,
+}
+
+
+@instrument
+def save(
+    data: AnyDict,
+    *,
+    filepath: PathType,
+    compression_level: int | None = None,
+    compression_threads: int | None = None,
+) -> None:
+    """Save a MessagePack file.
+
+    Args:
+        data: Data to save.
+        filepath: Path to save the data.
+        compression_level: Compression level, if the file extension implies compression (see dummio.compression).
+        compression_threads: Number of compression threads, for zstd compression.
+    """
+    with phase(SERIALIZE):
+        content = _packer().pack(data)
+    with (
+        phase(TRANSFER),
+        compression.open_file(filepath, "wb", level=compression_level, threads=compression_threads) as file,
+    ):
+        file.write(content)
+
+
+@instrument
+def load(filepath: PathType) -> AnyDict:
+    """Read a MessagePack file."""
+    if compression.codec(filepath):
+        with compression.open_file(filepath, "rb") as file:
+            return msgpack.unpackb(file.read(), **_UNPACK_KWARGS)
+    if is_local(filepath):
+        with open(UPath(filepath).path, "rb") as file:
+            if file.seek(0, 2):
+                with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as content, memoryview(content) as view:
+                    # the pages of the file are read as they are unpacked:
+                    with phase(SERIALIZE):
+                        return msgpack.unpackb(view, **_UNPACK_KWARGS)
+        # an empty file cannot be memory-mapped, and is not valid MessagePack anyway:
+        return msgpack.unpackb(b"", **_UNPACK_KWARGS)
+    with phase(TRANSFER):
+        content = read_into(filepath)
+    with phase(SERIALIZE):
+        return msgpack.unpackb(content, **_UNPACK_KWARGS)
+
+
+@instrument
+def save_stream(
+    data: Iterable[Any],
+    *,
+    filepath: PathType,
+    mode: Literal["w", "a"] = "w",
+    batch_size: int = DEFAULT_BATCH_SIZE,
+    compression_level: int | None = None,
+    compression_threads: int | None = None,
+) -> None:
+    """Save a sequence of objects to a MessagePack file, one after another, for reading with `iter_load`.
+
+    Args:
+        data: Objects to save. This may be any iterable, such as a generator; it is consumed batch by batch.
+        filepath: Path to save the data.
+        mode: Write mode: "w" to overwrite, or "a" to append to an existing file.
+        batch_size: Number of objects to pack per write.
+        compression_level: Compression level, if the file extension implies compression (see dummio.compression).
+        compression_threads: Number of compression threads, for zstd compression.
+    """
+    packer = _packer()
+    objects = iter(data)
+    with compression.open_file(filepath, mode + "b", level=compression_level, threads=compression_threads) as file:
+        while batch := list(islice(objects, batch_size)):
+            file.write(b"".join(packer.pack(obj) for obj in batch))
+
+
+def iter_load(filepath: PathType, *, chunk_bytes: int = DEFAULT_CHUNK_BYTES) -> Iterator[Any]:
+    """Read the objects of a MessagePack file one at a time, reading the file in chunks.
+
+    Args:
+        filepath: Path to read the data.
+        chunk_bytes: Number of bytes to read from the file at a time.
+    """
+    with compression.open_file(filepath, "rb") as file:
+        yield from msgpack.Unpacker(file, read_size=chunk_bytes, max_buffer_size=0, **_UNPACK_KWARGS)
@@ -4,16 +4,25 @@ These methods are thin wrappers over numpy.save and numpy.load. Main differences
 - These accept only str/path/upath-type filepath args (not a file-object)
 - The provided filepath is the one that gets used, overriding default numpy.save behavior which appends a .npy extension
     to the filename if it does not already have one.
+
+For large arrays, `load(..., mmap_mode="r")` memory-maps a local file, and `load_lazy` returns a `LazyArray` handle that
+reads only the bytes needed for each index, which is especially useful for files in cloud storage.
 """
 
+import math
 from typing import Any
 
 import numpy as np
 from upath import UPath
 
 from dummio.constants import PathType
+from dummio.hooks import instrument
+from dummio.utils import is_local
+
+MMAP_MODE = "mmap_mode"
 
 
+@instrument
 def save(
     data: np.ndarray,
     *,
@@ -32,18 +41,146 @@ def save(
         np.save(file=file, arr=data, **kwargs)
 
 
+@instrument
 def load(filepath: PathType, **kwargs: Any) -> np.ndarray:
     """Read a npy file as a 1-d numpy array.
 
     Args:
         filepath: Path to read the data.
-        **kwargs: Additional keyword arguments for numpy.load
+        **kwargs: Additional keyword arguments for numpy.load. In particular, `mmap_mode` memory-maps the array
+            instead of reading it into memory, which is supported only for local files.
+
+    Raises:
+        ValueError: if `mmap_mode` is specified for a file that is not on the local filesystem.
     """
     path = UPath(filepath)
+    if kwargs.get(MMAP_MODE) is not None:
+        if not is_local(path):
+            raise ValueError("mmap_mode requires a local file. Consider `load_lazy` for remote files.")
+        return np.load(file=path.path, **kwargs)
     with path.open("rb") as file:
         return np.load(file=file, **kwargs)
 
 
+class LazyArray:
+    """A read-only handle on a npy file that fetches only the byte ranges needed for each index.
+
+    Only the header is read on construction. Indexing the leading axis of a C-ordered array with an integer or a slice
+    reads just the corresponding rows; any further indexing is applied to those rows in memory. Other indices (and
+    Fortran-ordered arrays) fall back to reading the full array.
+    """
+
+    def __init__(self, filepath: PathType) -> None:
+        """Read the npy header.
+
+        Args:
+            filepath: Path to the npy file.
+        """
+        self.path = UPath(filepath)
+        with self.path.open("rb") as file:
+            version = np.lib.format.read_magic(file)
+            if version == (1, 0):
+                shape, fortran_order, dtype = np.lib.format.read_array_header_1_0(file)
+            elif version == (2, 0):
+                shape, fortran_order, dtype = np.lib.format.read_array_header_2_0(file)
+            else:
+                raise ValueError(f"Unsupported npy format version {version}")
+            self.offset = file.tell()
+        if dtype.hasobject:
+            raise ValueError("Lazy loading is not supported for arrays of python objects.")
+        self.shape: tuple[int, ...] = shape
+        self.dtype: np.dtype = dtype
+        self.fortran_order: bool = fortran_order
+
+    @property
+    def ndim(self) -> int:
+        """Number of array dimensions."""
+        return len(self.shape)
+
+    @property
+    def size(self) -> int:
+        """Number of elements in the array."""
+        return math.prod(self.shape)
+
+    @property
+    def nbytes(self) -> int:
+        """Total bytes consumed by the elements of the array."""
+        return self.size * self.dtype.itemsize
+
+    def __len__(self) -> int:
+        """Length of the leading axis."""
+        if not self.shape:
+            raise TypeError("len() of unsized object")
+        return self.shape[0]
+
+    def __repr__(self) -> str:
+        """Describe the handle without reading any data."""
+        return f"LazyArray(path={str(self.path)!r}, shape={self.shape}, dtype={self.dtype})"
+
+    def _fetch(self, start: int, end: int) -> bytes:
+        """Fetch the byte range [start, end) of the file."""
+        buffer = self.path.fs.cat_file(self.path.path, start=start, end=end)
+        assert isinstance(buffer, bytes), "expected bytes from cat_file"
+        return buffer
+
+    def _read_rows(self, start: int, stop: int) -> np.ndarray:
+        """Read rows [start, stop) of the leading axis of a C-ordered array."""
+        row_shape = self.shape[1:]
+        row_bytes = math.prod(row_shape) * self.dtype.itemsize
+        n_rows = max(stop - start, 0)
+        if n_rows == 0 or row_bytes == 0:
+            return np.empty((n_rows, *row_shape), dtype=self.dtype)
+        begin = self.offset + start * row_bytes
+        buffer = self._fetch(begin, begin + n_rows * row_bytes)
+        return np.frombuffer(buffer, dtype=self.dtype).reshape((n_rows, *row_shape))
+
+    def read(self) -> np.ndarray:
+        """Read the full array."""
+        buffer = self._fetch(self.offset, self.offset + self.nbytes)
+        flat = np.frombuffer(buffer, dtype=self.dtype)
+        if self.fortran_order:
+            return flat.reshape(self.shape[::-1]).T
+        return flat.reshape(self.shape)
+
+    def __array__(self, dtype: Any = None, copy: bool | None = None) -> np.ndarray:
+        """Read the full array, e.g. via `np.asarray`."""
+        array = self.read()
+        return array if dtype is None else array.astype(dtype)
+
+    def __getitem__(self, key: Any) -> np.ndarray:
+        """Read the rows needed for the index, then apply the index to them."""
+        keys = key if isinstance(key, tuple) else (key,)
+        if self.fortran_order or not self.shape or not keys:
+            return self.read()[key]
+        first, rest = keys[0], keys[1:]
+        n = self.shape[0]
+        if isinstance(first, (int, np.integer)) and not isinstance(first, bool):
+            index = int(first)
+            if not -n <= index < n:
+                raise IndexError(f"index {index} is out of bounds for axis 0 with size {n}")
+            index %= n
+            return self._read_rows(index, index + 1)[(0, *rest)]
+        if isinstance(first, slice):
+            rows = range(*first.indices(n))
+            if not rows:
+                return self._read_rows(0, 0)[(slice(None), *rest)]
+            low, high = min(rows[0], rows[-1]), max(rows[0], rows[-1]) + 1
+            block = self._read_rows(low, high)
+            if rows.step < 0:
+                block = block[::-1]
+            return block[(slice(None, None, abs(rows.step)), *rest)]
+        return self.read()[key]
+
+
+def load_lazy(filepath: PathType) -> LazyArray:
+    """Open a npy file as a `LazyArray`, reading only the header until the array is indexed.
+
+    Args:
+        filepath: Path to read the data.
+    """
+    return LazyArray(filepath)
+
+
 def example(filepath: PathType) -> None:
     """Example of using the numpy ndarray IO."""
 
@@ -1,38 +1,208 @@
-"""IO methods for sklearn models using ONNX serialization."""
+"""IO methods for sklearn models using ONNX serialization.
 
+Protocol buffers are limited to 2 GB, and serializing a large model to a single string holds a second copy of its
+weights in memory. With `save(..., external_data=True)`, the initializers (weights) are instead written tensor by tensor
+to a sidecar file next to the model file (named like the model file, plus EXTERNAL_DATA_SUFFIX), following the ONNX
+external data layout, and the model file holds only the graph. A sidecar file left by an earlier save is removed when
+the model is saved again without external data.
+
+`load` reads external data into the model, unless `load_external_data=False`, which is useful for inspecting the graph
+of a large model cheaply. `load_initializers` provides the weights as numpy arrays, which are memory-mapped from the
+sidecar file for local files, so they can be inspected in constant memory.
+"""
+
+import tempfile
+from contextlib import ExitStack
+from pathlib import Path, PurePosixPath
+from typing import IO, Iterator
+
+import numpy as np
 import onnx
+from onnx import external_data_helper, numpy_helper
 from upath import UPath
 
 from dummio.constants import PathType
+from dummio.hooks import SERIALIZE, TRANSFER, instrument, phase
+from dummio.utils import is_local
+
+EXTERNAL_DATA_SUFFIX = ".data"
 
+# Suffixes of the sidecar files that `save` may write next to the model file (see dummio.utils.sidecars):
+SIDECAR_SUFFIXES = (EXTERNAL_DATA_SUFFIX,)
 
-def save(data: onnx.ModelProto, *, filepath: PathType) -> None:
+# Tensors smaller than this many bytes are kept in the model file even with `external_data=True`:
+DEFAULT_SIZE_THRESHOLD = 1024
+
+
+@instrument
+def save(
+    data: onnx.ModelProto,
+    *,
+    filepath: PathType,
+    external_data: bool = False,
+    size_threshold: int = DEFAULT_SIZE_THRESHOLD,
+) -> None:
     """Saves a sklearn model to a file using ONNX serialization.
 
     Args:
         data: Data to save. This needs to be an sklearn model.
         filepath: Path to save the data.
+        external_data: If true, write the initializers to a sidecar file in the ONNX external data layout (see module
+            docstring). The model is modified while it is being saved (and restored afterwards), so it must not be used
+            concurrently.
+        size_threshold: Minimum size in bytes of the tensors to write to the sidecar file, if external_data.
     """
-    byte_str = data.SerializeToString()
-    if isinstance(filepath, UPath):
-        filepath.write_bytes(byte_str)
-    else:
-        with open(filepath, "wb") as file:
-            file.write(byte_str)
+    if external_data:
+        _save_external(data, filepath=filepath, size_threshold=size_threshold)
+        return
+    with phase(SERIALIZE):
+        byte_str = data.SerializeToString()
+    with phase(TRANSFER):
+        if isinstance(filepath, UPath):
+            filepath.write_bytes(byte_str)
+        else:
+            with open(filepath, "wb") as file:
+                file.write(byte_str)
+        # the model no longer refers to a sidecar file from an earlier save with external data:
+        _external_path(UPath(filepath)).unlink(missing_ok=True)
+
+
+def _external_path(path: UPath) -> UPath:
+    """The path of the sidecar file written next to a model file by `save(..., external_data=True)`."""
+    return path.parent / (path.name + EXTERNAL_DATA_SUFFIX)
+
+
+def _save_external(model: onnx.ModelProto, *, filepath: PathType, size_threshold: int) -> None:
+    """Save the graph to filepath and the large tensors to the sidecar file, via a local directory for remote paths."""
+    path = UPath(filepath)
+    location = path.name + EXTERNAL_DATA_SUFFIX
+    if is_local(path):
+        _write_external(model, directory=Path(path.path).parent, name=path.name, size_threshold=size_threshold)
+        return
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        _write_external(model, directory=Path(tmp_dir), name=path.name, size_threshold=size_threshold)
+        # the sidecar file goes first, so that the new graph is not visible before its weights:
+        if (Path(tmp_dir) / location).exists():
+            path.fs.put_file(str(Path(tmp_dir) / location), _external_path(path).path)
+        else:
+            # every tensor is below size_threshold:
+            _external_path(path).unlink(missing_ok=True)
+        path.fs.put_file(str(Path(tmp_dir) / path.name), path.path)
+
+
+def _write_external(model: onnx.ModelProto, *, directory: Path, name: str, size_threshold: int) -> None:
+    """Write the large tensors one at a time to the sidecar file, and then the remaining graph to the model file."""
+    location = name + EXTERNAL_DATA_SUFFIX
+    # tensors are appended to the sidecar file, so start from scratch:
+    (directory / location).unlink(missing_ok=True)
+    external_data_helper.convert_model_to_external_data(
+        model, all_tensors_to_one_file=True, location=location, size_threshold=size_threshold
+    )
+    try:
+        # this moves the data of each tensor into the sidecar file, clearing it from the model:
+        external_data_helper.write_external_data_tensors(model, str(directory))
+        (directory / name).write_bytes(model.SerializeToString())
+    finally:
+        # restore the data of the model from the sidecar file:
+        _read_external(model, directory=UPath(directory))
+
 
+def _sidecar(directory: UPath, location: str) -> UPath:
+    """The path of an external data file, which must be in the same directory as the model file."""
+    if PurePosixPath(location).name != location or location in ("", ".", ".."):
+        raise ValueError(f"Unsupported external data location '{location}'")
+    return directory / location
 
-def load(filepath: PathType) -> onnx.ModelProto:
+
+def _read_tensor(tensor: onnx.TensorProto, file: IO[bytes]) -> bytes:
+    """Read the external data of a tensor from its (open) sidecar file."""
+    info = external_data_helper.ExternalDataInfo(tensor)
+    file.seek(info.offset or 0)
+    return file.read(-1 if info.length is None else info.length)
+
+
+def _tensors(graph: onnx.GraphProto) -> Iterator[onnx.TensorProto]:
+    """The tensors of a graph, including its subgraphs: the initializers and the tensors in node attributes."""
+    yield from graph.initializer
+    for node in graph.node:
+        for attribute in node.attribute:
+            if attribute.HasField("t"):
+                yield attribute.t
+            yield from attribute.tensors
+            if attribute.HasField("g"):
+                yield from _tensors(attribute.g)
+            for subgraph in attribute.graphs:
+                yield from _tensors(subgraph)
+
+
+def _read_external(model: onnx.ModelProto, *, directory: UPath) -> None:
+    """Read the external data of the tensors of a model into the model, one tensor at a time."""
+    with ExitStack() as stack:
+        files: dict[str, IO[bytes]] = {}
+        for tensor in _tensors(model.graph):
+            if not external_data_helper.uses_external_data(tensor):
+                continue
+            if not tensor.HasField("raw_data"):
+                location = external_data_helper.ExternalDataInfo(tensor).location
+                if location not in files:
+                    files[location] = stack.enter_context(_sidecar(directory, location).open("rb"))
+                tensor.raw_data = _read_tensor(tensor, files[location])
+            tensor.ClearField("data_location")
+            del tensor.external_data[:]
+
+
+@instrument
+def load(filepath: PathType, *, load_external_data: bool = True) -> onnx.ModelProto:
     """Loads a sklearn model from a file using ONNX serialization.
 
     Args:
         filepath: Path to read the data.
+        load_external_data: If true, read the data of the tensors in external data files into the model. Otherwise,
+            the model holds only references to the external data, e.g. for inspecting the graph.
+    """
+    with phase(TRANSFER):
+        if isinstance(filepath, UPath):
+            byte_str = filepath.read_bytes()
+        else:
+            with open(filepath, "rb") as file:
+                byte_str = file.read()
+    with phase(SERIALIZE):
+        model = onnx.load_model_from_string(byte_str)
+    if load_external_data:
+        with phase(TRANSFER):
+            _read_external(model, directory=UPath(filepath).parent)
+    return model
+
+
+def load_initializers(filepath: PathType) -> dict[str, np.ndarray]:
+    """Load the initializers (weights) of a model as numpy arrays, by name.
+
+    Initializers in external data files are memory-mapped (read-only) for local files, so that they do not take up
+    memory until they are accessed; for remote files, they are read one at a time.
+
+    Args:
+        filepath: Path to the model file.
     """
-    if isinstance(filepath, UPath):
-        byte_str = filepath.read_bytes()
-    else:
-        with open(filepath, "rb") as file:
-            byte_str = file.read()
-    return onnx.load_model_from_string(byte_str)
+    model = load(filepath, load_external_data=False)
+    directory = UPath(filepath).parent
+    initializers = {}
+    for tensor in model.graph.initializer:
+        if not external_data_helper.uses_external_data(tensor):
+            initializers[tensor.name] = numpy_helper.to_array(tensor)
+            continue
+        info = external_data_helper.ExternalDataInfo(tensor)
+        sidecar = _sidecar(directory, info.location)
+        # the raw data of onnx tensors is little-endian:
+        dtype = np.dtype(onnx.helper.tensor_dtype_to_np_dtype(tensor.data_type)).newbyteorder("<")
+        shape = tuple(tensor.dims)
+        if is_local(sidecar):
+            initializers[tensor.name] = np.memmap(
+                sidecar.path, dtype=dtype, mode="r", offset=info.offset or 0, shape=shape
+            )
+        else:
+            with sidecar.open("rb") as file:
+                initializers[tensor.name] = np.frombuffer(_read_tensor(tensor, file), dtype=dtype).reshape(shape)
+    return initializers
 
 
 def example(filepath: PathType) -> None:
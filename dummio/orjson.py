@@ -1,11 +1,20 @@
-"""IO for json using orjson."""
+"""IO for json using orjson.
+
+Loading avoids intermediate copies of the file content: local files are memory-mapped and parsed in place, and other
+files are read into a single buffer of the file's size. Saving hands the serialized bytes directly to the filesystem.
+"""
+
+import mmap
 
 import orjson
 from upath import UPath
 
 from dummio.constants import AnyDict, PathType
+from dummio.hooks import SERIALIZE, TRANSFER, instrument, phase
+from dummio.utils import is_local, read_into
 
 
+@instrument
 def save(
     data: AnyDict,
     *,
@@ -17,23 +26,34 @@ def save(
     Args:
         data: Data to save.
         filepath: Path to save the data.
-        encoding: Encoding to use.
-        mode: Write mode.
         option: orjson options flag, e.g., orjson.OPT_INDENT_2, orjson.OPT_SERIALIZE_NUMPY
     """
-    data_bytes = orjson.dumps(data, option=option)
-    if isinstance(filepath, UPath):
-        filepath.write_bytes(data_bytes)
-    else:
-        with open(filepath, "wb") as file:  # Binary mode for orjson
-            file.write(data_bytes)
+    with phase(SERIALIZE):
+        data_bytes = orjson.dumps(data, option=option)
+    path = UPath(filepath)
+    with phase(TRANSFER):
+        if is_local(path):
+            with open(path.path, "wb") as file:
+                file.write(data_bytes)
+        else:
+            # upload the bytes in one piece, rather than copying them into the write buffer of a file object:
+            path.fs.pipe_file(path.path, data_bytes)
 
 
+@instrument
 def load(filepath: PathType) -> AnyDict:
     """Read a json file using orjson."""
-    if isinstance(filepath, UPath):
-        data_bytes = filepath.read_bytes()
-        return orjson.loads(data_bytes)
-    else:
-        with open(filepath, "rb") as file:  # Binary mode for orjson
-            return orjson.loads(file.read())
+    path = UPath(filepath)
+    if is_local(path):
+        with open(path.path, "rb") as file:
+            if file.seek(0, 2):
+                with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as content, memoryview(content) as view:
+                    # the pages of the file are read as they are parsed:
+                    with phase(SERIALIZE):
+                        return orjson.loads(view)
+        # an empty file cannot be memory-mapped, and is not valid json anyway:
+        return orjson.loads(b"")
+    with phase(TRANSFER):
+        content = read_into(path)
+    with phase(SERIALIZE):
+        return orjson.loads(content)
@@ -0,0 +1,59 @@
+"""Conversion of data frames to streams of arrow record batches, for writing files larger than memory.
+
+Converting a whole data frame to an arrow table holds a second copy of the data in memory. Instead, `record_batches`
+converts one slice of rows at a time, so that a writer consuming the batches holds at most one slice in arrow format. It
+also accepts an iterable of data frames (such as a generator), in which case the data never needs to fit in memory.
+"""
+
+from itertools import chain
+from typing import Iterable, Iterator
+
+import pandas as pd
+import pyarrow as pa
+
+# Default number of rows per record batch; for parquet, this is also the number of rows per row group:
+DEFAULT_ROWS_PER_BATCH = 100_000
+
+
+def _preserve_index(index: pd.Index) -> bool:
+    """Whether to store the index as columns; the default RangeIndex is omitted, since it would be lost when sliced."""
+    return not (isinstance(index, pd.RangeIndex) and index.name is None)
+
+
+def record_batches(
+    data: pd.DataFrame | Iterable[pd.DataFrame],
+    *,
+    rows_per_batch: int = DEFAULT_ROWS_PER_BATCH,
+) -> pa.RecordBatchReader:
+    """Stream data frames as arrow record batches of at most `rows_per_batch` rows.
+
+    The schema, and whether to store the index, are determined by the first slice of the first data frame. All data
+    frames must have the same columns and compatible dtypes. An unnamed RangeIndex is not stored, so concatenated
+    frames load with a fresh RangeIndex.
+
+    Args:
+        data: A data frame or an iterable of data frames.
+        rows_per_batch: Maximum number of rows per record batch.
+
+    Raises:
+        ValueError: if `data` is an empty iterable or `rows_per_batch` is not positive.
+    """
+    if rows_per_batch < 1:
+        raise ValueError("rows_per_batch must be a positive integer.")
+    frames = [data] if isinstance(data, pd.DataFrame) else data
+    slices = (
+        frame.iloc[start : start + rows_per_batch]
+        for frame in frames
+        for start in range(0, max(len(frame), 1), rows_per_batch)
+    )
+    first = next(slices, None)
+    if first is None:
+        raise ValueError("Cannot write an empty stream of data frames.")
+    preserve_index = _preserve_index(first.index)
+    schema = pa.Schema.from_pandas(first, preserve_index=preserve_index)
+
+    def batches() -> Iterator[pa.RecordBatch]:
+        for frame in chain([first], slices):
+            yield from pa.Table.from_pandas(frame, schema=schema, preserve_index=preserve_index).to_batches()
+
+    return pa.RecordBatchReader.from_batches(schema, batches())
@@ -1,14 +1,26 @@
 """Pandas data frames to/from csv."""
 
-from typing import Any
+from typing import Any, Iterator
 
 import pandas as pd
 from pandahandler.indexes import is_unnamed_range_index
+from pandas.io.parsers import TextFileReader
 from upath import UPath
 
+from dummio import compression
 from dummio.constants import PathType
+from dummio.hooks import instrument
+from dummio.pandas import filters as filters_
+from dummio.pandas.filters import Filters
 
+# Number of rows per chunk when post-filtering a csv file:
+FILTER_CHUNKSIZE = 100_000
 
+# Number of bytes to sample from the start of a file to estimate the number of rows per `chunk_bytes`:
+SAMPLE_BYTES = 1 << 20
+
+
+@instrument
 def save(
     data: pd.DataFrame,
     *,
@@ -20,20 +32,123 @@ def save(
     Args:
         data: Data to save.
         filepath: Path to save the data.
-        **kwargs: Additional keyword arguments for pandas.DataFrame.to_csv
+        **kwargs: Additional keyword arguments for pandas.DataFrame.to_csv. If the file extension implies compression
+            (see dummio.compression), `compression_level` and `compression_threads` configure the compressor.
     """
     if "index" not in kwargs and is_unnamed_range_index(data.index):
         kwargs["index"] = False
-    with UPath(filepath).open("wb") as file:
+    level = kwargs.pop("compression_level", None)
+    threads = kwargs.pop("compression_threads", None)
+    with compression.open_file(filepath, "wb", level=level, threads=threads) as file:
         data.to_csv(file, **kwargs)
 
 
-def load(filepath: PathType, **kwargs: Any) -> pd.DataFrame:
+@instrument
+def load(filepath: PathType, *, filters: Filters | None = None, **kwargs: Any) -> pd.DataFrame:
     """Read a csv file.
 
     Args:
         filepath: Path to read the data.
+        filters: Row filters (see `dummio.pandas.filters`). Since csv files do not support predicate pushdown, the file
+            is read in chunks of `chunksize` rows (default FILTER_CHUNKSIZE), keeping only the matching rows of each.
         **kwargs: Additional keyword arguments for pandas.read_csv
     """
-    with UPath(filepath).open("rb") as file:
+    if filters is not None:
+        return _load_filtered(filepath, filters=filters, **kwargs)
+    with compression.open_file(filepath, "rb") as file:
         return pd.read_csv(file, **kwargs)
+
+
+def _load_filtered(filepath: PathType, *, filters: Filters, **kwargs: Any) -> pd.DataFrame:
+    """Read a csv file chunk by chunk, keeping only the rows that match the filters.
+
+    The filters are applied before `usecols` and `index_col` take effect, so that they may refer to any column of the
+    file, including the index columns and columns that are not selected.
+
+    Raises:
+        ValueError: if a filter column is not in the file.
+    """
+    chunksize = kwargs.pop("chunksize", None) or FILTER_CHUNKSIZE
+    usecols = kwargs.pop("usecols", None)
+    index_col = kwargs.pop("index_col", None)
+    with compression.open_file(filepath, "rb") as file:
+        header = list(pd.read_csv(file, nrows=0, **kwargs).columns)
+    selected = _resolve_usecols(header, usecols)
+    index = _resolve_index_col(selected, index_col)
+    missing = [column for column in filters_.columns(filters) if column not in header]
+    if missing:
+        raise ValueError(f"Filter columns {missing} are not in the csv file.")
+    needed = set(selected) | set(filters_.columns(filters))
+    kwargs["usecols"] = [column for column in header if column in needed]
+    chunks = []
+    for chunk in iter_load(filepath, chunksize=chunksize, **kwargs):
+        chunks.append(chunk.loc[filters_.mask(chunk, filters), selected])
+    data = pd.concat(chunks, ignore_index=True)
+    return data.set_index(index) if index else data
+
+
+def _resolve_usecols(header: list[Any], usecols: Any) -> list[Any]:
+    """The names of the columns selected by the `usecols` argument of pandas.read_csv, in file order."""
+    if usecols is None:
+        return header
+    if callable(usecols):
+        return [column for column in header if usecols(column)]
+    names = {header[column] if isinstance(column, int) else column for column in usecols}
+    missing = [column for column in names if column not in header]
+    if missing:
+        raise ValueError(f"Usecols do not match columns, columns expected but not found: {missing}")
+    return [column for column in header if column in names]
+
+
+def _resolve_index_col(selected: list[Any], index_col: Any) -> list[Any]:
+    """The names of the index columns given by the `index_col` argument of pandas.read_csv.
+
+    As in pandas, positions refer to the selected columns.
+    """
+    if index_col is None or index_col is False:
+        return []
+    index_cols = index_col if isinstance(index_col, (list, tuple)) else [index_col]
+    return [selected[column] if isinstance(column, int) else column for column in index_cols]
+
+
+def _rows_per_chunk(path: UPath, chunk_bytes: int) -> int:
+    """Estimate how many rows of the file fit in `chunk_bytes`, based on the average line length at its start.
+
+    For compressed files, this is in terms of the decompressed csv text.
+    """
+    with compression.open_file(path, "rb") as file:
+        sample = file.read(min(chunk_bytes, SAMPLE_BYTES))
+    n_lines = max(sample.count(b"\n"), 1)
+    return max(int(chunk_bytes * n_lines // max(len(sample), 1)), 1)
+
+
+def iter_load(
+    filepath: PathType,
+    *,
+    chunksize: int | None = None,
+    chunk_bytes: int | None = None,
+    **kwargs: Any,
+) -> Iterator[pd.DataFrame]:
+    """Read a csv file as a stream of data frames, holding only one chunk in memory at a time.
+
+    Args:
+        filepath: Path to read the data.
+        chunksize: Maximum number of rows per chunk.
+        chunk_bytes: Approximate maximum size of the csv text behind each chunk, in bytes. This is translated into a
+            number of rows based on the average line length near the start of the file.
+        **kwargs: Additional keyword arguments for pandas.read_csv
+
+    Raises:
+        ValueError: unless exactly one of `chunksize` and `chunk_bytes` is specified.
+    """
+    if (chunksize is None) == (chunk_bytes is None):
+        raise ValueError("Specify exactly one of `chunksize` and `chunk_bytes`.")
+    path = UPath(filepath)
+    if chunk_bytes is not None:
+        chunksize = _rows_per_chunk(path, chunk_bytes)
+    assert chunksize is not None, "expected chunksize to be set by now"
+    with compression.open_file(path, "rb") as file:
+        reader = pd.read_csv(file, chunksize=chunksize, **kwargs)
+        assert isinstance(reader, TextFileReader), "expected a TextFileReader since chunksize is set"
+        with reader:
+            yield from reader
@@ -1,17 +1,38 @@
-"""Pandas data frames to/from csv."""
+"""Pandas data frames to/from feather.
 
-from typing import Any
+An uncompressed feather file on the local filesystem can be loaded with `memory_map=True`, in which case arrow maps the
+file into memory and the data frame shares the file's buffers, rather than copying the data into pandas memory:
+```
+df_feather.save(df, filepath="data.feather", compression="uncompressed")
+df = df_feather.load("data.feather", memory_map=True)
+```
+Compressed (lz4 or zstd) files can be memory-mapped too, but their columns are decompressed into memory on load.
+"""
+
+from typing import Any, Literal
 
 import pandas as pd
 from upath import UPath
 
 from dummio.constants import PathType
+from dummio.hooks import instrument
+from dummio.pandas import filters as filters_
+from dummio.pandas.filters import Filters
+from dummio.utils import is_local
+
+UNCOMPRESSED = "uncompressed"
+CHUNKSIZE = "chunksize"
 
+# Arguments of pyarrow.Table.to_pandas that avoid copies when converting a memory-mapped table:
+ZERO_COPY_KWARGS = {"split_blocks": True}
 
+
+@instrument
 def save(
     data: pd.DataFrame,
     *,
     filepath: PathType,
+    compression: Literal["uncompressed", "lz4", "zstd"] | None = None,
     **kwargs: Any,
 ) -> None:
     """Save a feather file.
@@ -19,18 +40,83 @@ def save(
     Args:
         data: Data to save.
         filepath: Path to save the data.
+        compression: The compression of the columns. Defaults to pyarrow's default, which is lz4. Use "uncompressed" for
+            files to load with `memory_map=True` without copying the data; uncompressed files are then written as a
+            single record batch by default (see the `chunksize` kwarg), since pandas copies columns that span batches.
         **kwargs: Additional keyword arguments for pandas.DataFrame.to_feather
     """
+    if compression is not None:
+        kwargs["compression"] = compression
+    if compression == UNCOMPRESSED:
+        kwargs.setdefault(CHUNKSIZE, max(len(data), 1))
     with UPath(filepath).open("wb") as file:
         data.to_feather(file, **kwargs)
 
 
-def load(filepath: PathType, **kwargs: Any) -> pd.DataFrame:
+@instrument
+def load(
+    filepath: PathType,
+    *,
+    columns: list[str] | None = None,
+    filters: Filters | None = None,
+    memory_map: bool = False,
+    **kwargs: Any,
+) -> pd.DataFrame:
     """Read a feather file.
 
     Args:
         filepath: Path to read the data.
+        columns: The columns to load. If not specified, all columns are loaded. Only the selected columns are read.
+        filters: Row filters (see `dummio.pandas.filters`). If specified, the file is scanned as a pyarrow dataset,
+            filtering one record batch at a time, and the remaining kwargs apply to pyarrow.Table.to_pandas (except for
+            `use_threads`, which applies to the scan).
+        memory_map: If true, memory-map the file instead of reading it, which is supported only for local files. For
+            uncompressed files, the loaded columns then share the file's buffers where pandas allows it (e.g. numeric
+            columns without nulls), and the remaining kwargs apply to pyarrow.Table.to_pandas, with `split_blocks=True`
+            by default to avoid consolidating the columns into copied blocks. Not compatible with `filters`.
         **kwargs: Additional keyword arguments for pandas.read_feather
+
+    Raises:
+        ValueError: if `memory_map` is requested for a file that is not on the local filesystem, or with `filters`.
     """
+    if memory_map:
+        if filters is not None:
+            raise ValueError("memory_map is not supported with filters.")
+        return _load_memory_mapped(filepath, columns=columns, **kwargs)
+    if filters is not None:
+        return _load_filtered(filepath, filters=filters, columns=columns, **kwargs)
     with UPath(filepath).open("rb") as file:
-        return pd.read_feather(file, **kwargs)
+        return pd.read_feather(file, columns=columns, **kwargs)
+
+
+def _load_memory_mapped(filepath: PathType, *, columns: list[str] | None, **kwargs: Any) -> pd.DataFrame:
+    """Read a local feather file by memory-mapping it, sharing the file's buffers with the data frame."""
+    import pyarrow.feather as feather
+
+    path = UPath(filepath)
+    if not is_local(path):
+        raise ValueError("memory_map requires a local file.")
+    table = feather.read_table(path.path, columns=columns, memory_map=True)
+    return table.to_pandas(**(ZERO_COPY_KWARGS | kwargs))
+
+
+def _load_filtered(
+    filepath: PathType,
+    *,
+    filters: Filters,
+    columns: list[str] | None = None,
+    use_threads: bool = True,
+    **kwargs: Any,
+) -> pd.DataFrame:
+    """Read the rows of a feather file that match the filters, without materializing the full table."""
+    import pyarrow.dataset as ds
+    from pyarrow.fs import FSSpecHandler, PyFileSystem
+
+    path = UPath(filepath)
+    dataset = ds.dataset(path.path, format="feather", filesystem=PyFileSystem(FSSpecHandler(path.fs)))
+    table = dataset.to_table(
+        columns=columns,
+        filter=filters_.to_arrow_expression(filters),
+        use_threads=use_threads,
+    )
+    return table.to_pandas(**kwargs)
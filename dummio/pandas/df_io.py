@@ -13,6 +13,8 @@ A unified `save`/`load` API simplifies common IO operations while maintaining ex
 - Both methods accept `**kwargs` and pass them along to the underlying file-type-specific pandas IO methods.
 - We support some basic translation across discrepancies in arg names in existing IO methods (i.e.
      "usecols" in `read_csv` vs "columns" in `read_parquet`).
+- Row `filters` (see `dummio.pandas.filters`) are format-neutral: they are pushed down to the scan for parquet,
+     feather, and vortex, and applied chunk by chunk for csv.
 
 Examples:
 ```
@@ -33,19 +35,34 @@ save(df, filepath='data.txt', format='csv')  # .txt implies text format
 # Reading allows overrides for misnamed files:
 df = load('mislabeled.txt', format='parquet')
 
+# Load only the matching rows:
+df = load('data.parquet', filters=[("year", ">=", 2020), ("country", "in", ["CA", "US"])])
+
 # Support `save` when inferred format is missing or not a standard type:
 save(df, filepath='data', format='csv')  # No extension, needs type
 save(df, filepath='mydata.unknown', format='csv')  # Unclear extension
+
+# Stream a file that is larger than memory, for formats that support it:
+for chunk in iter_load('data.csv', chunksize=100_000):
+    ...
+
+# Write a file that is larger than memory from a stream of data frames, for formats that support it:
+save_stream((transform(chunk) for chunk in iter_load('data.csv', chunksize=100_000)), filepath='data.parquet')
+
+# Load many files concurrently, optionally concatenating them into a single data frame:
+df = load_many(['s3://bucket/part-0.parquet', 's3://bucket/part-1.parquet'], concat=True)
 """
 
 import importlib
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
-from typing import Callable
+from typing import Any, Callable, Iterable, Iterator, Literal, Sequence, overload
 
 import pandas as pd
 from upath import UPath
 
 from dummio.constants import PathType
+from dummio.pandas.filters import Filters
 
 CSV = "csv"
 FEATHER = "feather"
@@ -53,6 +70,9 @@ PARQUET = "parquet"
 VORTEX = "vortex"
 SUPPORTED_FORMATS = [CSV, FEATHER, PARQUET, VORTEX]
 
+# Default number of threads for `load_many` and `save_many`; these are mostly waiting on (cloud) storage:
+DEFAULT_MAX_WORKERS = 16
+
 
 @dataclass
 class Format:
@@ -76,6 +96,26 @@ class Format:
         module = importlib.import_module(f"dummio.pandas.df_{self.name}")
         return module.load
 
+    @property
+    def iter_load_method(self) -> Callable:
+        """The streaming load method name."""
+        if self.name not in SUPPORTED_FORMATS:
+            raise RuntimeError(f"Unsupported format '{self.name}'")
+        module = importlib.import_module(f"dummio.pandas.df_{self.name}")
+        if not hasattr(module, "iter_load"):
+            raise ValueError(f"Format '{self.name}' does not support streaming reads.")
+        return module.iter_load
+
+    @property
+    def save_stream_method(self) -> Callable:
+        """The streaming save method name."""
+        if self.name not in SUPPORTED_FORMATS:
+            raise RuntimeError(f"Unsupported format '{self.name}'")
+        module = importlib.import_module(f"dummio.pandas.df_{self.name}")
+        if not hasattr(module, "save_stream"):
+            raise ValueError(f"Format '{self.name}' does not support streaming writes.")
+        return module.save_stream
+
 
 def _infer_format(filepath: PathType) -> Format | None:
     """Infer the file format based on the file extension."""
@@ -140,6 +180,7 @@ def load(
     *,
     format: str | None = None,
     columns: list[str] | None = None,
+    filters: Filters | None = None,
     **kwargs,
 ) -> pd.DataFrame:
     """Load a pandas DataFrame from a file, optionally inferring the format from the file extension.
@@ -148,6 +189,8 @@ def load(
         filepath: Path to the input file.
         format: Explicit file format (optional). If provided, must match the file extension.
         columns: The columns to load. If not specified, all columns are loaded.
+        filters: Row filters, such as `[("a", ">", 1)]`. See `dummio.pandas.filters` for details. If not specified,
+            all rows are loaded.
         **kwargs: Additional arguments passed to the underlying pandas IO method.
 
     Returns:
@@ -156,10 +199,171 @@ def load(
 
     fmt = _resolve_format(filepath=filepath, input_format=format, allow_conflict=True)
     load_method = fmt.load_method
+    _add_columns(fmt=fmt, columns=columns, kwargs=kwargs)
+    if filters is not None:
+        kwargs["filters"] = filters
+    return load_method(filepath=filepath, **kwargs)
+
+
+def iter_load(
+    filepath: PathType,
+    *,
+    format: str | None = None,
+    columns: list[str] | None = None,
+    **kwargs,
+) -> Iterator[pd.DataFrame]:
+    """Stream a pandas DataFrame from a file in chunks, optionally inferring the format from the file extension.
+
+    Args:
+        filepath: Path to the input file.
+        format: Explicit file format (optional). If provided, must match the file extension.
+        columns: The columns to load. If not specified, all columns are loaded.
+        **kwargs: Additional arguments passed to the underlying streaming IO method, e.g. `chunksize` for csv.
+
+    Raises:
+        ValueError: if the format does not support streaming reads.
+    """
+    fmt = _resolve_format(filepath=filepath, input_format=format, allow_conflict=True)
+    iter_load_method = fmt.iter_load_method
+    _add_columns(fmt=fmt, columns=columns, kwargs=kwargs)
+    return iter_load_method(filepath=filepath, **kwargs)
+
+
+def save_stream(
+    data: pd.DataFrame | Iterable[pd.DataFrame],
+    *,
+    filepath: PathType,
+    format: str | None = None,
+    **kwargs,
+) -> None:
+    """Save a DataFrame, or a stream of DataFrames, to a single file in bounded memory, inferring the format.
+
+    Args:
+        data: A DataFrame or an iterable of DataFrames with the same columns, such as a generator.
+        filepath: Path to the output file.
+        format: Explicit file format (optional). If provided, must match the file extension.
+        **kwargs: Additional arguments passed to the underlying streaming IO method, e.g. `rows_per_batch`, the
+            maximum number of rows to convert at a time (and per row group for parquet).
+
+    Raises:
+        ValueError: if the format does not support streaming writes.
+    """
+    fmt = _resolve_format(filepath=filepath, input_format=format)
+    save_stream_method = fmt.save_stream_method
+    save_stream_method(data=data, filepath=filepath, **kwargs)
+
+
+def _add_columns(*, fmt: Format, columns: list[str] | None, kwargs: dict[str, Any]) -> None:
+    """Add the `columns` selection to kwargs under the argument name expected by the format."""
     if fmt.name == CSV:
         if columns is not None:
             if "usecols" in kwargs:
                 raise ValueError("Cannot specify both `columns` and `usecols`.")
             kwargs["usecols"] = columns
-        return load_method(filepath=filepath, **kwargs)
-    return load_method(filepath=filepath, columns=columns, **kwargs)
+    else:
+        kwargs["columns"] = columns
+
+
+def _upaths(filepaths: Sequence[PathType]) -> list[UPath]:
+    """Convert filepaths to UPaths, instantiating each distinct filesystem once before any worker thread needs it.
+
+    fsspec caches filesystem instances, so all paths with the same protocol and storage options share one instance.
+    """
+    paths = [UPath(filepath) for filepath in filepaths]
+    for path in paths:
+        _ = path.fs
+    return paths
+
+
+def save_many(
+    data: Sequence[pd.DataFrame],
+    *,
+    filepaths: Sequence[PathType],
+    format: str | None = None,
+    max_workers: int = DEFAULT_MAX_WORKERS,
+    **kwargs,
+) -> None:
+    """Save many data frames concurrently, one per file, on a bounded thread pool.
+
+    Args:
+        data: The DataFrames to save.
+        filepaths: Paths to the output files, matching `data` one to one.
+        format: Explicit file format (optional). If provided, must match the file extension of every file.
+        max_workers: Maximum number of files to write at the same time.
+        **kwargs: Additional arguments passed to the underlying pandas IO method for every file.
+    """
+    if len(data) != len(filepaths):
+        raise ValueError(f"Got {len(data)} data frames but {len(filepaths)} filepaths.")
+    paths = _upaths(filepaths)
+    save_methods = [_resolve_format(filepath=path, input_format=format).save_method for path in paths]
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        futures = [
+            executor.submit(save_method, data=df, filepath=path, **kwargs)
+            for save_method, df, path in zip(save_methods, data, paths)
+        ]
+        for future in futures:
+            future.result()
+
+
+@overload
+def load_many(
+    filepaths: Sequence[PathType],
+    *,
+    format: str | None = ...,
+    columns: list[str] | None = ...,
+    filters: Filters | None = ...,
+    max_workers: int = ...,
+    concat: Literal[False] = ...,
+    **kwargs,
+) -> list[pd.DataFrame]: ...
+
+
+@overload
+def load_many(
+    filepaths: Sequence[PathType],
+    *,
+    format: str | None = ...,
+    columns: list[str] | None = ...,
+    filters: Filters | None = ...,
+    max_workers: int = ...,
+    concat: Literal[True],
+    **kwargs,
+) -> pd.DataFrame: ...
+
+
+def load_many(
+    filepaths: Sequence[PathType],
+    *,
+    format: str | None = None,
+    columns: list[str] | None = None,
+    filters: Filters | None = None,
+    max_workers: int = DEFAULT_MAX_WORKERS,
+    concat: bool = False,
+    **kwargs,
+) -> list[pd.DataFrame] | pd.DataFrame:
+    """Load many data frames concurrently, one per file, on a bounded thread pool.
+
+    Args:
+        filepaths: Paths to the input files.
+        format: Explicit file format (optional). If not provided, the format is inferred per file.
+        columns: The columns to load. If not specified, all columns are loaded.
+        filters: Row filters, as in `load`.
+        max_workers: Maximum number of files to read at the same time.
+        concat: If true, return a single data frame concatenating the loaded data frames (with a fresh RangeIndex)
+            in place of the list.
+        **kwargs: Additional arguments passed to the underlying pandas IO method for every file.
+
+    Returns:
+        The loaded data frames, in the same order as `filepaths`.
+    """
+    paths = _upaths(filepaths)
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        futures = [
+            executor.submit(load, path, format=format, columns=columns, filters=filters, **kwargs) for path in paths
+        ]
+        frames = [future.result() for future in futures]
+    if not concat:
+        return frames
+    if not frames:
+        raise ValueError("Cannot concatenate an empty list of files.")
+    return pd.concat(frames, ignore_index=True)
@@ -1,17 +1,22 @@
 """Pandas data frames to/from parquet."""
 
-from typing import Any
+from typing import TYPE_CHECKING, Any, Iterable, Iterator
 
 import pandas as pd
 from upath import UPath
 
 from dummio.constants import PathType
+from dummio.hooks import instrument
+
+if TYPE_CHECKING:
+    import pyarrow.parquet as pq
 
 ENGINE = "engine"
 PYARROW = "pyarrow"
 FASTPARQUET = "fastparquet"
 
 
+@instrument
 def save(
     data: pd.DataFrame,
     *,
@@ -43,6 +48,38 @@ def save(
         raise err
 
 
+@instrument
+def save_stream(
+    data: pd.DataFrame | Iterable[pd.DataFrame],
+    *,
+    filepath: PathType,
+    rows_per_batch: int | None = None,
+    **kwargs: Any,
+) -> None:
+    """Save a data frame, or a stream of data frames, to a parquet file in bounded memory.
+
+    The data is converted to arrow and written one row group at a time (see `dummio.pandas.batches`), rather than
+    converting the whole data frame at once, so peak memory scales with the row group size. Since the data frames may
+    come from a generator, the output can be larger than memory.
+
+    Args:
+        data: A data frame or an iterable of data frames with the same columns.
+        filepath: Path to save the data.
+        rows_per_batch: Maximum number of rows to convert at a time, which is also the maximum number of rows per row
+            group of the parquet file. Defaults to `batches.DEFAULT_ROWS_PER_BATCH`.
+        **kwargs: Additional keyword arguments for pyarrow.parquet.ParquetWriter, such as `compression`
+    """
+    import pyarrow.parquet as pq
+
+    from dummio.pandas import batches
+
+    reader = batches.record_batches(data, rows_per_batch=rows_per_batch or batches.DEFAULT_ROWS_PER_BATCH)
+    with UPath(filepath).open("wb") as file, pq.ParquetWriter(file, reader.schema, **kwargs) as writer:
+        for batch in reader:
+            writer.write_batch(batch)
+
+
+@instrument
 def load(filepath: PathType, **kwargs: Any) -> pd.DataFrame:
     """Read a parquet file.
 
@@ -52,3 +89,54 @@ def load(filepath: PathType, **kwargs: Any) -> pd.DataFrame:
     """
     with UPath(filepath).open("rb") as file:
         return pd.read_parquet(file, **kwargs)
+
+
+def iter_load(
+    filepath: PathType,
+    *,
+    row_groups_per_batch: int = 1,
+    columns: list[str] | None = None,
+    **kwargs: Any,
+) -> Iterator[pd.DataFrame]:
+    """Read a parquet file as a stream of data frames, one batch of row groups at a time.
+
+    The file footer is read once, after which only the byte ranges of the selected row groups and columns are read, so
+    peak memory scales with the row group size rather than the file size.
+
+    Args:
+        filepath: Path to read the data.
+        row_groups_per_batch: Number of row groups to read into each data frame.
+        columns: The columns to load. If not specified, all columns are loaded.
+        **kwargs: Additional keyword arguments for pyarrow.Table.to_pandas
+    """
+    import pyarrow.parquet as pq
+
+    if row_groups_per_batch < 1:
+        raise ValueError("row_groups_per_batch must be a positive integer.")
+    with UPath(filepath).open("rb") as file:
+        parquet_file = pq.ParquetFile(file)
+        metadata = parquet_file.metadata
+        range_index = _range_index_metadata(parquet_file)
+        offset = 0
+        for start in range(0, metadata.num_row_groups, row_groups_per_batch):
+            row_groups = list(range(start, min(start + row_groups_per_batch, metadata.num_row_groups)))
+            table = parquet_file.read_row_groups(row_groups, columns=columns, use_pandas_metadata=True)
+            df = table.to_pandas(**kwargs)
+            if range_index is not None:
+                # a RangeIndex is stored only as metadata, which pyarrow can not apply to a subset of the rows:
+                step = range_index["step"]
+                first = range_index["start"] + offset * step
+                df.index = pd.RangeIndex(first, first + len(df) * step, step, name=range_index["name"])
+            offset += len(df)
+            yield df
+
+
+def _range_index_metadata(parquet_file: "pq.ParquetFile") -> dict[str, Any] | None:
+    """The pandas metadata describing the RangeIndex of the file, if the data frame was saved with one."""
+    pandas_metadata = parquet_file.schema_arrow.pandas_metadata
+    if not pandas_metadata:
+        return None
+    index_columns = pandas_metadata.get("index_columns", [])
+    if len(index_columns) == 1 and isinstance(index_columns[0], dict) and index_columns[0].get("kind") == "range":
+        return index_columns[0]
+    return None
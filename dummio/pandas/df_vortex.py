@@ -1,15 +1,70 @@
-"""Pandas data frames to/from vortex."""
+"""Pandas data frames to/from vortex.
 
-from typing import Any
+Local files are read and written by vortex directly. Remote files (e.g. `s3://` or `gcs://` paths) go through the
+filesystem of the universal path, including its storage options: reads are positional byte-range requests for only the
+footer and the segments that a scan needs, and writes stage the file locally before uploading it in one `put_file`
+call, which uses a multipart upload on object stores that support it.
+"""
 
+import tempfile
+from pathlib import Path
+from typing import Any, Iterable, Iterator
+
+import numpy as np
 import pandas as pd
 import pyarrow as pa
 import vortex
 import vortex.io
+from upath import UPath
 
 from dummio.constants import PathType
+from dummio.hooks import instrument
+from dummio.pandas import batches
+from dummio.pandas import filters as filters_
+from dummio.pandas.filters import Filters
+from dummio.utils import is_local
+
+# Number of rows per data frame of `iter_load`:
+DEFAULT_BATCH_SIZE = 100_000
+
+
+class _RemoteFile:
+    """Positional reads of a remote file through its fsspec filesystem, implementing `vortex.io.ReadBytesAt`.
+
+    Each read is a stateless byte-range request, so that vortex can issue many of them concurrently.
+    """
+
+    def __init__(self, path: UPath) -> None:
+        self._path = path
+
+    def size(self) -> int:
+        return self._path.stat().st_size
+
+    def read_at(self, offset: int, length: int) -> bytes:
+        return self._path.fs.cat_file(self._path.path, start=offset, end=offset + length)  # pyright: ignore[reportReturnType]
+
+
+def _open(filepath: PathType) -> vortex.VortexFile:
+    """Open a vortex file lazily, reading only its footer."""
+    path = UPath(filepath)
+    if is_local(path):
+        return vortex.open(path.path)
+    return vortex.open_readable(_RemoteFile(path))
 
 
+def _write(data: pa.RecordBatchReader, filepath: PathType, **kwargs: Any) -> None:
+    """Write a stream of record batches to a vortex file, staging remote files locally for a single upload."""
+    path = UPath(filepath)
+    if is_local(path):
+        vortex.io.write(data, path.path, **kwargs)
+        return
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        local_path = str(Path(tmp_dir) / path.name)
+        vortex.io.write(data, local_path, **kwargs)
+        path.fs.put_file(local_path, path.path)
+
+
+@instrument
 def save(
     data: pd.DataFrame,
     *,
@@ -18,31 +73,107 @@ def save(
 ) -> None:
     """Save a data frame to a vortex file.
 
+    The data frame is converted to arrow and streamed to the file in slices of rows (see `dummio.pandas.batches`).
+
     Args:
         data: Data to save.
         filepath: Path to save the data.
         **kwargs: Additional keyword arguments for vortex.io.write
     """
-    # Convert DataFrame to Arrow table and write to file
-    table = pa.Table.from_pandas(data)
-    vortex.io.write(table, str(filepath), **kwargs)
+    _write(batches.record_batches(data), filepath, **kwargs)
+
+
+@instrument
+def save_stream(
+    data: pd.DataFrame | Iterable[pd.DataFrame],
+    *,
+    filepath: PathType,
+    rows_per_batch: int = batches.DEFAULT_ROWS_PER_BATCH,
+    **kwargs: Any,
+) -> None:
+    """Save a data frame, or a stream of data frames, to a vortex file in bounded memory.
 
+    The data is converted to arrow one slice of `rows_per_batch` rows at a time (see `dummio.pandas.batches`), and
+    streamed to the file, so peak memory scales with the slice size. Since the data frames may come from a generator,
+    the output can be larger than memory.
 
-def load(filepath: PathType, **kwargs: Any) -> pd.DataFrame:
+    Args:
+        data: A data frame or an iterable of data frames with the same columns.
+        filepath: Path to save the data.
+        rows_per_batch: Maximum number of rows to convert at a time.
+        **kwargs: Additional keyword arguments for vortex.io.write
+    """
+    _write(batches.record_batches(data, rows_per_batch=rows_per_batch), filepath, **kwargs)
+
+
+def _reader(
+    filepath: PathType,
+    *,
+    columns: list[str] | None,
+    filters: Filters | None,
+    rows: tuple[int, int] | None,
+    batch_size: int | None,
+) -> pa.RecordBatchReader:
+    """Scan a vortex file as a stream of arrow record batches, reading only the selected columns and rows."""
+    vortex_file = _open(filepath)
+    expr = filters_.to_vortex_expression(filters) if filters is not None else None
+    if rows is None:
+        return vortex_file.to_arrow(columns, expr=expr, batch_size=batch_size)
+    start, stop = rows
+    if not 0 <= start <= stop:
+        raise ValueError(f"Invalid row range {rows}: expected 0 <= start <= stop.")
+    stop = min(stop, len(vortex_file))
+    indices = vortex.array(pa.array(np.arange(start, max(start, stop), dtype=np.uint64)))
+    return vortex_file.scan(columns, expr=expr, indices=indices, batch_size=batch_size).to_arrow()
+
+
+@instrument
+def load(
+    filepath: PathType,
+    *,
+    columns: list[str] | None = None,
+    filters: Filters | None = None,
+    rows: tuple[int, int] | None = None,
+    **kwargs: Any,
+) -> pd.DataFrame:
     """Read a vortex file.
 
+    Only the selected columns and rows are read from the file.
+
     Args:
         filepath: Path to read the data.
-        **kwargs: Additional keyword arguments (currently unused)
+        columns: The columns to load. If not specified, all columns are loaded.
+        filters: Row filters (see `dummio.pandas.filters`), which are pushed down to the vortex scan as a native
+            vortex expression. The filter columns need not be among the selected columns.
+        rows: A range (start, stop) of row positions to scan, as in `slice(start, stop)`, before applying any filters.
+        **kwargs: Additional keyword arguments for pyarrow.Table.to_pandas
 
     Returns:
         DataFrame: The loaded pandas DataFrame
     """
-    # Open the vortex file
-    vortex_file = vortex.open(str(filepath))
+    reader = _reader(filepath, columns=columns, filters=filters, rows=rows, batch_size=None)
+    return reader.read_all().to_pandas(**kwargs)
 
-    # Convert to Arrow RecordBatchReader, then to table, then to pandas
-    arrow_reader = vortex_file.to_arrow()
-    table = arrow_reader.read_all()
 
-    return table.to_pandas()
+def iter_load(
+    filepath: PathType,
+    *,
+    batch_size: int = DEFAULT_BATCH_SIZE,
+    columns: list[str] | None = None,
+    filters: Filters | None = None,
+    rows: tuple[int, int] | None = None,
+    **kwargs: Any,
+) -> Iterator[pd.DataFrame]:
+    """Read a vortex file as a stream of data frames, holding only one batch of rows in memory at a time.
+
+    Args:
+        filepath: Path to read the data.
+        batch_size: Maximum number of rows per data frame.
+        columns: The columns to load. If not specified, all columns are loaded.
+        filters: Row filters (see `dummio.pandas.filters`), pushed down to the vortex scan.
+        rows: A range (start, stop) of row positions to scan, before applying any filters.
+        **kwargs: Additional keyword arguments for pyarrow.RecordBatch.to_pandas
+    """
+    reader = _reader(filepath, columns=columns, filters=filters, rows=rows, batch_size=batch_size)
+    for batch in reader:
+        yield batch.to_pandas(**kwargs)
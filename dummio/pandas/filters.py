@@ -0,0 +1,120 @@
+"""Format-neutral row filters for pandas data frame IO.
+
+Filters follow the disjunctive normal form (DNF) used by `pandas.read_parquet` and pyarrow:
+- A single filter is a tuple `(column, operator, value)`, where operator is one of "==", "=", "!=", "<", "<=", ">",
+    ">=", "in", or "not in".
+- A list of filters combines them with AND.
+- A list of lists of filters combines the inner lists with OR.
+
+Rows where a filter column is null match only "not in" filters (since null is not among the values), and never match the
+other operators, consistent with pyarrow.
+"""
+
+import functools
+import operator
+from typing import TYPE_CHECKING, Any, TypeAlias
+
+import pandas as pd
+
+if TYPE_CHECKING:
+    import pyarrow.compute as pc
+
+Filter: TypeAlias = tuple[str, str, Any]
+Filters: TypeAlias = list[Filter] | list[list[Filter]]
+
+OPERATORS = ("==", "=", "!=", "<", "<=", ">", ">=", "in", "not in")
+
+
+def to_dnf(filters: Filters) -> list[list[Filter]]:
+    """Normalize filters to a list of lists of filters, validating the operators along the way."""
+    if not filters:
+        raise ValueError("filters must not be empty.")
+    dnf = [filters] if isinstance(filters[0], tuple) else filters
+    for conjunction in dnf:
+        if not isinstance(conjunction, list) or not conjunction:
+            raise ValueError("filters must be a list of tuples or a non-empty list of non-empty lists of tuples.")
+        for column_filter in conjunction:
+            if not isinstance(column_filter, tuple) or len(column_filter) != 3:
+                raise ValueError(f"Each filter must be a (column, operator, value) tuple, got {column_filter!r}.")
+            if column_filter[1] not in OPERATORS:
+                raise ValueError(f"Unsupported filter operator '{column_filter[1]}'. Use one of {OPERATORS}.")
+    return dnf  # pyright: ignore[reportReturnType]
+
+
+def columns(filters: Filters) -> list[str]:
+    """The columns referenced by the filters, in order of first appearance."""
+    names = [column for conjunction in to_dnf(filters) for column, _, _ in conjunction]
+    return list(dict.fromkeys(names))
+
+
+def to_arrow_expression(filters: Filters) -> "pc.Expression":
+    """Translate filters to a pyarrow compute expression, as used by pyarrow datasets."""
+    import pyarrow.parquet as pq
+
+    return pq.filters_to_expression(to_dnf(filters))
+
+
+def to_vortex_expression(filters: Filters) -> Any:
+    """Translate filters to a native vortex expression."""
+    import vortex.expr as ve
+
+    def _expression(column_filter: Filter) -> Any:
+        name, op, value = column_filter
+        column = ve.column(name)
+        if op in ("in", "not in"):
+            values = list(value)
+            if not values:
+                raise ValueError(f"The '{op}' filter on column '{name}' requires a non-empty collection of values.")
+            is_in = functools.reduce(operator.or_, [column == item for item in values])
+            if op == "in":
+                return is_in
+            # nulls are not among the values, as in pyarrow:
+            return ve.is_null(column) | ~is_in
+        if op in ("==", "="):
+            return column == value
+        if op == "!=":
+            return column != value
+        if op == "<":
+            return column < value
+        if op == "<=":
+            return column <= value
+        if op == ">":
+            return column > value
+        return column >= value
+
+    conjunctions = [functools.reduce(operator.and_, map(_expression, conjunction)) for conjunction in to_dnf(filters)]
+    return functools.reduce(operator.or_, conjunctions)
+
+
+def mask(df: pd.DataFrame, filters: Filters) -> pd.Series:
+    """Evaluate filters against a data frame as a boolean mask over its rows."""
+
+    def _mask(column_filter: Filter) -> pd.Series:
+        name, op, value = column_filter
+        series = df[name]
+        if op in ("==", "="):
+            result = series == value
+        elif op == "!=":
+            result = series != value
+        elif op == "<":
+            result = series < value
+        elif op == "<=":
+            result = series <= value
+        elif op == ">":
+            result = series > value
+        elif op == ">=":
+            result = series >= value
+        elif op == "in":
+            result = series.isin(list(value))
+        else:
+            # nulls are not among the values, as in pyarrow:
+            return ~series.isin(list(value)) | series.isna()
+        return result.fillna(False).astype(bool) & series.notna()
+
+    result = pd.Series(False, index=df.index)
+    for conjunction in to_dnf(filters):
+        conjunction_mask = pd.Series(True, index=df.index)
+        for column_filter in conjunction:
+            conjunction_mask &= _mask(column_filter)
+        result |= conjunction_mask
+    return result
@@ -1,22 +1,135 @@
-"""IO for pickle."""
+"""IO for pickle.
 
+With `out_of_band=True`, `save` uses pickle protocol 5 to write large buffers (such as the data of numpy arrays and
+pandas blocks) out of band, each aligned to ALIGNMENT bytes, in a container file that starts with MAGIC:
+- MAGIC,
+- the size of the pickle stream and the number of buffers, followed by the offset and size of each buffer (all
+  little-endian unsigned 64-bit integers),
+- the pickle stream, and
+- the buffers.
+
+`load` detects the container automatically. Local containers are memory-mapped (copy-on-write), so that the arrays of
+the loaded object are backed by the file rather than copied into memory, and load nearly instantly. Remote containers
+are read into a single buffer, which the arrays share.
+"""
+
+import mmap
 import pickle
-from typing import Any
+import struct
+from typing import IO, Any
 
 from upath import UPath
 
+from dummio import compression
 from dummio.constants import PathType
+from dummio.hooks import SERIALIZE, TRANSFER, instrument, phase
+from dummio.utils import fill, is_local
+
+MAGIC = b"DUMMIOP5"
+ALIGNMENT = 64
+
+# Buffers smaller than this many bytes are kept in the pickle stream even with `out_of_band=True`:
+MIN_OUT_OF_BAND_BYTES = 4096
 
+_COUNTS = struct.Struct("<QQ")
+_BUFFER = struct.Struct("<QQ")
 
-def save(data: Any, *, filepath: PathType) -> None:
-    """Save a pickle file."""
-    path = UPath(filepath)
-    with path.open("wb") as file:
+
+@instrument
+def save(
+    data: Any,
+    *,
+    filepath: PathType,
+    out_of_band: bool = False,
+    compression_level: int | None = None,
+    compression_threads: int | None = None,
+) -> None:
+    """Save a pickle file.
+
+    Args:
+        data: Data to save.
+        filepath: Path to save the data.
+        out_of_band: If true, write large buffers out of band with pickle protocol 5, so that they can be
+            memory-mapped on load. This is not compatible with compression.
+        compression_level: Compression level, if the file extension implies compression (see dummio.compression).
+        compression_threads: Number of compression threads, for zstd compression.
+    """
+    if out_of_band:
+        if compression.codec(filepath):
+            raise ValueError("out_of_band is not supported for compressed files, since they cannot be memory-mapped.")
+        _save_out_of_band(data, filepath=filepath)
+        return
+    with compression.open_file(filepath, "wb", level=compression_level, threads=compression_threads) as file:
         pickle.dump(data, file)
 
 
+def _padding(position: int) -> int:
+    """Number of bytes to pad after `position` to reach the next multiple of ALIGNMENT."""
+    return -position % ALIGNMENT
+
+
+def _save_out_of_band(data: Any, *, filepath: PathType) -> None:
+    """Save a container with the pickle stream followed by the aligned out-of-band buffers."""
+    buffers: list[memoryview] = []
+
+    def buffer_callback(buffer: pickle.PickleBuffer) -> bool:
+        # returning a true value keeps the buffer in band:
+        raw = buffer.raw()
+        if raw.nbytes < MIN_OUT_OF_BAND_BYTES:
+            return True
+        buffers.append(raw)
+        return False
+
+    with phase(SERIALIZE):
+        stream = pickle.dumps(data, protocol=5, buffer_callback=buffer_callback)
+    header_size = len(MAGIC) + _COUNTS.size + _BUFFER.size * len(buffers)
+    position = header_size + len(stream)
+    layout = []
+    for buffer in buffers:
+        position += _padding(position)
+        layout.append((position, buffer.nbytes))
+        position += buffer.nbytes
+    with phase(TRANSFER), UPath(filepath).open("wb") as file:
+        file.write(MAGIC)
+        file.write(_COUNTS.pack(len(stream), len(buffers)))
+        for offset, size in layout:
+            file.write(_BUFFER.pack(offset, size))
+        file.write(stream)
+        position = header_size + len(stream)
+        for buffer, (offset, size) in zip(buffers, layout):
+            file.write(b"\0" * (offset - position))
+            file.write(buffer)
+            position = offset + size
+
+
+def _load_out_of_band(path: UPath, file: IO[bytes]) -> Any:
+    """Load a container, given a file positioned just after MAGIC."""
+    stream_size, n_buffers = _COUNTS.unpack(file.read(_COUNTS.size))
+    layout = [_BUFFER.unpack(file.read(_BUFFER.size)) for _ in range(n_buffers)]
+    stream_offset = len(MAGIC) + _COUNTS.size + _BUFFER.size * n_buffers
+    content: Any
+    if is_local(path):
+        with open(path.path, "rb") as local_file:
+            # copy-on-write, so that the loaded arrays are writeable without modifying the file:
+            content = mmap.mmap(local_file.fileno(), 0, access=mmap.ACCESS_COPY)
+    else:
+        file.seek(0)
+        content = bytearray(max([stream_offset + stream_size] + [offset + size for offset, size in layout]))
+        fill(file, content)
+    view = memoryview(content)
+    stream = view[stream_offset : stream_offset + stream_size]
+    return pickle.loads(stream, buffers=[view[offset : offset + size] for offset, size in layout])
+
+
+@instrument
 def load(filepath: PathType) -> Any:
-    """Read a pickle file."""
-    path = UPath(filepath)
-    with path.open("rb") as file:
+    """Read a pickle file, including containers saved with `out_of_band=True`."""
+    if compression.codec(filepath) is None:
+        path = UPath(filepath)
+        with path.open("rb") as file:
+            if file.read(len(MAGIC)) == MAGIC:
+                return _load_out_of_band(path, file)
+            file.seek(0)
+            return pickle.load(file)
+    with compression.open_file(filepath, "rb") as file:
         return pickle.load(file)
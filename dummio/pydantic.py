@@ -1,33 +1,242 @@
-"""IO for pydantic models."""
+"""IO for pydantic models.
 
-from typing import Type, TypeVar
+Besides `save`/`load` of one model instance per file, this module supports many records of the same model per file:
+- `save_list`/`load_list` write and read a json array of records, validating the whole array in a single call of a
+    cached `pydantic.TypeAdapter(list[model])`, which is far cheaper per record than validating each record separately.
+- `save_jsonl`/`iter_load_jsonl` write and read JSON Lines (one record per line) in batches, for datasets larger than
+    memory.
+
+Files written by trusted pipelines can be loaded faster with `load(..., trusted=True)`, which skips validation: the json
+is decoded with orjson and the model is built with `model_construct`, converting only the fields that are not native
+json types (such as datetimes, UUIDs, and nested models). Since this would silently produce invalid objects from a file
+saved with an older version of the model, trusted loads require a schema fingerprint, written by
+`save(..., fingerprint=True)` (see dummio.fingerprint).
+"""
+
+from functools import lru_cache
+from inspect import isclass
+from itertools import islice
+from typing import Any, Callable, Iterable, Iterator, Type, TypeVar, get_args, get_origin
 
 import pydantic
 from upath import UPath
 
+from dummio import compression
+from dummio import fingerprint as fingerprint_
 from dummio.constants import PathType
+from dummio.hooks import SERIALIZE, TRANSFER, instrument, phase
 
 T = TypeVar("T", bound=pydantic.BaseModel)
 
+# Suffixes of the sidecar files that `save` may write next to the data file (see dummio.utils.sidecars):
+SIDECAR_SUFFIXES = (fingerprint_.SUFFIX,)
+
+# Number of records to serialize or validate per call, for JSON Lines:
+DEFAULT_BATCH_SIZE = 10_000
+
+# Number of models (or types) for which to keep schema fingerprints, decoders, and TypeAdapters:
+CACHE_SIZE = 128
 
+# Field types whose values orjson decodes as is:
+_JSON_NATIVE_TYPES = (str, int, float, bool, type(None), Any, dict, list)
+
+
+@instrument
 def save(
     data: pydantic.BaseModel,
     *,
     filepath: PathType,
+    fingerprint: bool = False,
 ) -> None:
-    """Save a pydantic model instance to a json text file."""
-    data_json_str = data.model_dump_json()
-    UPath(filepath).write_text(data_json_str)
+    """Save a pydantic model instance to a json text file.
+
+    Args:
+        data: The model instance to save.
+        filepath: Path to save the data.
+        fingerprint: If true, also write the fingerprint of the model's schema to a sidecar file, which is required for
+            loading the file with trusted=True.
+    """
+    with phase(SERIALIZE):
+        data_json_str = data.model_dump_json()
+    fingerprint_.remove(filepath=filepath)
+    with phase(TRANSFER):
+        UPath(filepath).write_text(data_json_str)
+    if fingerprint:
+        fingerprint_.write(schema_fingerprint(type(data)), filepath=filepath)
 
 
+@instrument
 def load(
     filepath: PathType,
     *,
     model: Type[T],
+    trusted: bool = False,
 ) -> T:
-    """Load a pydantic model instance from a json text file."""
-    data_json_str = UPath(filepath).read_text()
-    return model.model_validate_json(data_json_str)
+    """Load a pydantic model instance from a json text file.
+
+    Args:
+        filepath: Path to read the data.
+        model: The pydantic model of the data.
+        trusted: If true, skip validation (see module docstring). The file must have been saved with fingerprint=True
+            from a model with the same schema.
+
+    Raises:
+        ValueError: if trusted and the schema fingerprint of the file is missing or does not match the model.
+    """
+    if trusted:
+        fingerprint_.verify(schema_fingerprint(model), filepath=filepath)
+        import orjson
+
+        with phase(TRANSFER):
+            content = UPath(filepath).read_bytes()
+        with phase(SERIALIZE):
+            return _decoder(model)(orjson.loads(content))
+    with phase(TRANSFER):
+        data_json_str = UPath(filepath).read_text()
+    with phase(SERIALIZE):
+        return model.model_validate_json(data_json_str)
+
+
+@lru_cache(maxsize=CACHE_SIZE)
+def schema_fingerprint(model: type[pydantic.BaseModel]) -> str:
+    """The fingerprint of the json schema of a model."""
+    return fingerprint_.digest(model.model_json_schema())
+
+
+def _is_model(annotation: Any) -> bool:
+    return isclass(annotation) and issubclass(annotation, pydantic.BaseModel)
+
+
+def _converter(annotation: Any) -> Callable[[Any], Any] | None:
+    """A function converting a json-decoded value to the annotated type, or None if no conversion is needed."""
+    origin = get_origin(annotation)
+    args = get_args(annotation)
+    if annotation in _JSON_NATIVE_TYPES or (origin in (dict, list) and all(arg in _JSON_NATIVE_TYPES for arg in args)):
+        return None
+    if _is_model(annotation):
+        # look up the decoder when called rather than now, to support recursive models:
+        return lambda value: _decoder(annotation)(value)
+    if origin is list and len(args) == 1 and _is_model(args[0]):
+        return lambda values: [_decoder(args[0])(value) for value in values]
+    return _adapter(annotation).validate_python
+
+
+@lru_cache(maxsize=CACHE_SIZE)
+def _decoder(model: Type[T]) -> Callable[[dict[str, Any]], T]:
+    """A function constructing a model instance from json-decoded values without validation, built once per model."""
+    converters = {
+        name: converter
+        for name, field in model.model_fields.items()
+        if (converter := _converter(field.annotation)) is not None
+    }
+
+    def decode(values: dict[str, Any]) -> T:
+        for name, converter in converters.items():
+            if name in values:
+                values[name] = converter(values[name])
+        return model.model_construct(**values)
+
+    return decode
+
+
+@lru_cache(maxsize=CACHE_SIZE)
+def _adapter(type_: Any) -> pydantic.TypeAdapter[Any]:
+    """A TypeAdapter for the type, built once per type since building it is expensive."""
+    return pydantic.TypeAdapter(type_)
+
+
+def _list_model(data: list[T], model: Type[T] | None) -> Any:
+    """The model of the records of a list, or Any for an empty list of unknown model.
+
+    Raises:
+        ValueError: if the model is not given and the records are not all of the same model, since each record would be
+            serialized with the fields of the first.
+    """
+    if model is not None or not data:
+        return model or Any
+    types = {type(record) for record in data}
+    if len(types) > 1:
+        names = sorted(type_.__name__ for type_ in types)
+        raise ValueError(f"Cannot save records of mixed types {names} without specifying the model.")
+    return types.pop()
+
+
+@instrument
+def save_list(
+    data: list[T],
+    *,
+    filepath: PathType,
+    model: Type[T] | None = None,
+) -> None:
+    """Save a list of pydantic model instances to a json file, as an array of records.
+
+    Args:
+        data: The model instances to save, which may be an empty list.
+        filepath: Path to save the data.
+        model: The model of the records. Defaults to their common type, and is required for a list of mixed types.
+    """
+    with phase(SERIALIZE):
+        content = _adapter(list[_list_model(data, model)]).dump_json(data)
+    with phase(TRANSFER), compression.open_file(filepath, "wb") as file:
+        file.write(content)
+
+
+@instrument
+def load_list(
+    filepath: PathType,
+    *,
+    model: Type[T],
+) -> list[T]:
+    """Load a list of pydantic model instances from a json file, validating all records in a single call."""
+    with phase(TRANSFER), compression.open_file(filepath, "rb") as file:
+        content = file.read()
+    with phase(SERIALIZE):
+        return _adapter(list[model]).validate_json(content)
+
+
+@instrument
+def save_jsonl(
+    data: Iterable[T],
+    *,
+    filepath: PathType,
+    model: Type[T] | None = None,
+    batch_size: int = DEFAULT_BATCH_SIZE,
+) -> None:
+    """Save pydantic model instances to a JSON Lines file, serializing them batch by batch.
+
+    Args:
+        data: Model instances to save. This may be any iterable, such as a generator; it is consumed batch by batch.
+        filepath: Path to save the data.
+        model: The model of the records. Defaults to their common type, and is required for records of mixed types.
+        batch_size: Number of records to serialize per write.
+    """
+    records = iter(data)
+    with compression.open_file(filepath, "wb") as file:
+        while batch := list(islice(records, batch_size)):
+            adapter = _adapter(_list_model(batch, model))
+            file.write(b"".join(adapter.dump_json(record) + b"\n" for record in batch))
+
+
+def iter_load_jsonl(
+    filepath: PathType,
+    *,
+    model: Type[T],
+    batch_size: int = DEFAULT_BATCH_SIZE,
+) -> Iterator[T]:
+    """Load pydantic model instances from a JSON Lines file, holding only one batch of records in memory at a time.
+
+    Each batch of lines is validated in a single call, as if it were a json array.
+
+    Args:
+        filepath: Path to read the data.
+        model: The pydantic model of the records.
+        batch_size: Number of records to validate per call.
+    """
+    adapter = _adapter(list[model])
+    with compression.open_file(filepath, "rb") as file:
+        lines = (line for line in file if line.strip())
+        while batch := list(islice(lines, batch_size)):
+            yield from adapter.validate_json(b"[" + b",".join(batch) + b"]")
 
 
 def example(filepath: PathType) -> None:
@@ -1,24 +1,38 @@
 """IO for text."""
 
-from upath import UPath
-
+from dummio import compression
 from dummio.constants import DEFAULT_ENCODING, DEFAULT_WRITE_MODE, PathType, TextMode
+from dummio.hooks import instrument
 
 
+@instrument
 def save(
     data: str,
     *,
     filepath: PathType,
     encoding: str = DEFAULT_ENCODING,
     mode: TextMode = DEFAULT_WRITE_MODE,
+    compression_level: int | None = None,
+    compression_threads: int | None = None,
 ) -> None:
-    """Save text."""
-    path = UPath(filepath)
-    with path.open(mode=mode, encoding=encoding) as file:
+    """Save text.
+
+    Args:
+        data: Text to save.
+        filepath: Path to save the data.
+        encoding: Encoding to use.
+        mode: Write mode.
+        compression_level: Compression level, if the file extension implies compression (see dummio.compression).
+        compression_threads: Number of compression threads, for zstd compression.
+    """
+    with compression.open_file(
+        filepath, mode, encoding=encoding, level=compression_level, threads=compression_threads
+    ) as file:
         file.write(data)
 
 
+@instrument
 def load(filepath: PathType, encoding: str = DEFAULT_ENCODING) -> str:
     """Read text."""
-    path = UPath(filepath)
-    return path.read_text(encoding=encoding)
+    with compression.open_file(filepath, "r", encoding=encoding) as file:
+        return file.read()
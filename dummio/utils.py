@@ -0,0 +1,49 @@
+"""Utilities shared across dummio IO modules."""
+
+from types import ModuleType
+from typing import IO
+
+from upath import UPath
+
+from dummio.constants import PathType
+
+LOCAL_PROTOCOLS = ("", "file", "local")
+
+
+def is_local(filepath: PathType) -> bool:
+    """Whether the filepath refers to the local filesystem (as opposed to e.g. a cloud bucket)."""
+    return UPath(filepath).protocol in LOCAL_PROTOCOLS
+
+
+def sidecars(filepath: PathType, *, module: ModuleType) -> list[UPath]:
+    """The paths of the sidecar files that a module may have written next to a data file, whether or not they exist.
+
+    A module that writes sidecar files, named like the data file plus a suffix, declares the suffixes in its
+    SIDECAR_SUFFIXES attribute.
+    """
+    path = UPath(filepath)
+    return [path.with_name(path.name + suffix) for suffix in getattr(module, "SIDECAR_SUFFIXES", ())]
+
+
+def fill(file: IO[bytes], buffer: bytearray) -> None:
+    """Fill a pre-sized buffer from a file, reading until it is full.
+
+    Raises:
+        EOFError: if the file ends before the buffer is full.
+    """
+    view = memoryview(buffer)
+    position = 0
+    while position < len(buffer):
+        n_read = file.readinto(view[position:])  # pyright: ignore[reportAttributeAccessIssue]
+        if not n_read:
+            raise EOFError(f"Expected {len(buffer)} bytes but read only {position}")
+        position += n_read
+
+
+def read_into(filepath: PathType) -> bytearray:
+    """Read a whole file into a single buffer of the file's size, without intermediate copies."""
+    path = UPath(filepath)
+    buffer = bytearray(path.stat().st_size)
+    with path.open("rb") as file:
+        fill(file, buffer)
+    return buffer
@@ -1,50 +1,105 @@
 """IO for yaml.
 
-dummio.yaml requires ruamel.yaml (not pyyaml) because ruamel.yaml appears to be the way of the future.
+dummio.yaml requires ruamel.yaml (not pyyaml) because ruamel.yaml appears to be the way of the future. For speed, the
+`engine` option can instead select pyyaml's bindings to the libyaml C library:
+- "ruamel" (default): ruamel.yaml, with the `typ` option selecting e.g. round-trip ("rt") or "safe" IO.
+- "libyaml": pyyaml's C-accelerated safe loader and dumper, which requires pyyaml built with libyaml. This is typically
+    an order of magnitude faster than ruamel.yaml's round-trip IO, but does not preserve comments or anchors.
+- "auto": "libyaml" if available, otherwise ruamel.yaml's "safe" IO.
+
+The configured ruamel.yaml instances are reused across calls, with one instance per thread and `typ`.
 """
 
-from upath import UPath
+import threading
+from types import ModuleType
+from typing import Any, Literal, TypeAlias
 
+from dummio import compression
 from dummio.constants import DEFAULT_ENCODING, DEFAULT_WRITE_MODE, AnyDict, PathType, TextMode
+from dummio.hooks import instrument
 
 try:
     import ruamel.yaml as yaml
 except ImportError:
     raise ImportError("Install ruamel.yaml to use dummio.yaml")
 
+Engine: TypeAlias = Literal["ruamel", "libyaml", "auto"]
+
+_thread_local = threading.local()
+
+
+def _ruamel(typ: str) -> yaml.YAML:
+    """The ruamel.yaml instance of the current thread for the given typ."""
+    instances: dict[str, yaml.YAML] | None = getattr(_thread_local, "instances", None)
+    if instances is None:
+        instances = _thread_local.instances = {}
+    if typ not in instances:
+        instances[typ] = yaml.YAML(typ=typ)  # pyright: ignore
+    return instances[typ]
+
+
+def _pyyaml() -> ModuleType | None:
+    """The pyyaml module, if it is installed with libyaml bindings."""
+    try:
+        import yaml as pyyaml
+    except ImportError:
+        return None
+    return pyyaml if getattr(pyyaml, "__with_libyaml__", False) else None
+
+
+def _resolve(engine: Engine, typ: str) -> tuple[ModuleType | None, str]:
+    """The pyyaml module to use (None for ruamel.yaml) and the ruamel.yaml typ."""
+    if engine not in ("ruamel", "libyaml", "auto"):
+        raise ValueError(f"Unsupported engine '{engine}'")
+    if engine == "ruamel":
+        return None, typ
+    pyyaml = _pyyaml()
+    if pyyaml is None and engine == "libyaml":
+        raise ImportError("Install pyyaml with libyaml bindings to use engine='libyaml'")
+    return pyyaml, "safe"
+
 
+@instrument
 def save(
     data: AnyDict,
     *,
     filepath: PathType,
+    engine: Engine = "ruamel",
     typ: str = "rt",
     encoding: str = DEFAULT_ENCODING,
     mode: TextMode = DEFAULT_WRITE_MODE,
+    compression_level: int | None = None,
+    compression_threads: int | None = None,
 ) -> None:
     """Save a yaml file.
 
     Args:
         data: The data to save.
         filepath: The file path.
+        engine: The yaml library to use: "ruamel", "libyaml", or "auto" (see module docstring).
         typ: The type of ruamel.yaml IO to use. "rt" for round-trip (default, a subclass of "safe").If you need faster
             IO, consider setting this to "safe" or "unsafe". See https://stackoverflow.com/a/51318354/2232265 for
-            details.
+            details. Only applies to engine="ruamel".
         encoding: The encoding to use.
         mode: The write mode.
+        compression_level: Compression level, if the file extension implies compression (see dummio.compression).
+        compression_threads: Number of compression threads, for zstd compression.
     """
-    yaml_ = yaml.YAML(typ=typ)  # pyright: ignore
-    dumper = yaml_.dump
-    if isinstance(filepath, UPath):
-        with filepath.open(mode, encoding=encoding) as stream:
-            dumper(data, stream)
-    else:
-        with open(filepath, mode, encoding=encoding) as file:
-            dumper(data, file)
+    pyyaml, typ = _resolve(engine, typ)
+    with compression.open_file(
+        filepath, mode, encoding=encoding, level=compression_level, threads=compression_threads
+    ) as file:
+        if pyyaml is None:
+            _ruamel(typ).dump(data, file)
+        else:
+            pyyaml.dump(data, file, Dumper=pyyaml.CSafeDumper, sort_keys=False, allow_unicode=True)
 
 
+@instrument
 def load(
     filepath: PathType,
     *,
+    engine: Engine = "ruamel",
     typ: str = "rt",
     encoding: str = DEFAULT_ENCODING,
 ) -> AnyDict:
@@ -52,15 +107,14 @@ def load(
 
     Args:
         filepath: The file path.
+        engine: The yaml library to use: "ruamel", "libyaml", or "auto" (see module docstring).
         typ: The type of ruamel.yaml IO to use. "rt" for round-trip (default, a subclass of "safe").If you need faster
             IO, consider setting this to "safe" or "unsafe". See https://stackoverflow.com/a/51318354/2232265 for
-            details.
+            details. Only applies to engine="ruamel".
         encoding: The encoding to use.
     """
-    yaml_ = yaml.YAML(typ=typ)  # pyright: ignore
-    loader = yaml_.load
-    if isinstance(filepath, UPath):
-        data_str = filepath.read_text(encoding=encoding)
-        return loader(data_str)
-    with open(filepath, "r", encoding=encoding) as file:
-        return loader(file)
+    pyyaml, typ = _resolve(engine, typ)
+    with compression.open_file(filepath, "r", encoding=encoding) as file:
+        text = file.read()
+    data: Any = _ruamel(typ).load(text) if pyyaml is None else pyyaml.load(text, Loader=pyyaml.CSafeLoader)
+    return data
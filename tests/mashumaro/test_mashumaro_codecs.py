@@ -0,0 +1,76 @@
+"""Test the mashumaro modules that serialize with compiled codecs: orjson and MessagePack."""
+
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from enum import Enum
+from pathlib import Path
+from types import ModuleType
+
+import pytest
+from mashumaro.mixins.msgpack import DataClassMessagePackMixin
+from mashumaro.mixins.orjson import DataClassORJSONMixin
+from upath import UPath
+
+from dummio.mashumaro import msgpack, orjson
+
+MODULES = [(orjson, "data.json"), (msgpack, "data.msgpack")]
+
+
+class Currency(Enum):
+    USD = "USD"
+    EUR = "EUR"
+
+
+@dataclass
+class Position(DataClassORJSONMixin, DataClassMessagePackMixin):
+    currency: Currency
+    balance: float
+    updated_at: datetime
+
+
+@dataclass
+class Bond(Position):
+    coupon: float
+
+
+@dataclass
+class Portfolio(DataClassORJSONMixin, DataClassMessagePackMixin):
+    positions: list[Position]
+
+
+def _positions() -> list[Position]:
+    updated_at = datetime(2024, 1, 1, tzinfo=timezone.utc)
+    return [Position(Currency.USD, 238.67, updated_at), Position(Currency.EUR, 361.84, updated_at)]
+
+
+@pytest.mark.parametrize("module,filename", MODULES)
+def test_cycle(tmp_path: Path, module: ModuleType, filename: str) -> None:
+    data = Portfolio(positions=_positions())
+    for filepath in [tmp_path / filename, UPath(tmp_path / filename)]:
+        module.save(data, filepath=filepath)
+        assert module.load(filepath, model=Portfolio) == data
+
+
+@pytest.mark.parametrize("module,filename", MODULES)
+def test_list(tmp_path: Path, module: ModuleType, filename: str) -> None:
+    data = _positions()
+    filepath = tmp_path / filename
+    module.save_list(data, filepath=filepath)
+    assert module.load_list(filepath, model=Position) == data
+
+    module.save_list([], filepath=filepath)
+    assert module.load_list(filepath, model=Position) == []
+
+
+@pytest.mark.parametrize("module,filename", MODULES)
+def test_list_mixed_types(tmp_path: Path, module: ModuleType, filename: str) -> None:
+    bond = Bond(Currency.USD, 100.0, datetime(2024, 1, 1, tzinfo=timezone.utc), coupon=0.05)
+    data = [*_positions(), bond]
+    filepath = tmp_path / filename
+    with pytest.raises(ValueError, match="mixed types"):
+        module.save_list(data, filepath=filepath)
+    module.save_list(data, filepath=filepath, model=Position)
+    assert module.load_list(filepath, model=Position) == [
+        *_positions(),
+        Position(bond.currency, 100.0, bond.updated_at),
+    ]
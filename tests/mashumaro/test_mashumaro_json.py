@@ -2,6 +2,7 @@ from dataclasses import dataclass
 from enum import Enum
 from pathlib import Path
 
+import pytest
 from mashumaro.mixins.json import DataClassJSONMixin
 
 from dummio.mashumaro.json import example, load, save
@@ -58,3 +59,24 @@ def test_json(tmp_path: Path):
 
     # Also run the example:
     example(filepath=filepath)
+
+
+def test_trusted(tmp_path: Path) -> None:
+    data = Portfolio(currencies=[CurrencyPosition(Currency.USD, 238.67)], stocks=[StockPosition("AAPL", "Apple", 10)])
+    filepath = tmp_path / "data.json"
+    save(data, filepath=filepath, fingerprint=True)
+    assert load(filepath, model=Portfolio, trusted=True) == data
+
+    @dataclass
+    class Other(DataClassJSONMixin):
+        currencies: list[CurrencyPosition]
+
+    with pytest.raises(ValueError, match="stale"):
+        load(filepath, model=Other, trusted=True)
+    save(data, filepath=tmp_path / "other.json")
+    with pytest.raises(ValueError, match="no schema fingerprint"):
+        load(tmp_path / "other.json", model=Portfolio, trusted=True)
+    # re-saving without a fingerprint removes the stale sidecar file:
+    save(data, filepath=filepath)
+    with pytest.raises(ValueError, match="no schema fingerprint"):
+        load(filepath, model=Portfolio, trusted=True)
@@ -1,8 +1,10 @@
 from pathlib import Path
 
 import numpy as np
+import pytest
+from upath import UPath
 
-from dummio.numpy.ndarray_io import load, save
+from dummio.numpy.ndarray_io import load, load_lazy, save
 
 
 def test_ndarray_io(tmp_path: Path) -> None:
@@ -18,3 +20,48 @@ def test_ndarray_io(tmp_path: Path) -> None:
     save(array, filepath=filepath)
     loaded_array = load(filepath)
     np.testing.assert_array_equal(array, loaded_array)
+
+
+def test_ndarray_mmap(tmp_path: Path) -> None:
+    array = np.arange(12).reshape(3, 4)
+    filepath = tmp_path / "data.npy"
+    save(array, filepath=filepath)
+    loaded_array = load(filepath, mmap_mode="r")
+    assert isinstance(loaded_array, np.memmap)
+    np.testing.assert_array_equal(array, loaded_array)
+
+    with pytest.raises(ValueError, match="mmap_mode requires a local file"):
+        load(UPath("memory://arrays/data.npy"), mmap_mode="r")
+
+
+@pytest.mark.parametrize("directory", ["local", "memory://lazy"])
+def test_ndarray_lazy(tmp_path: Path, directory: str) -> None:
+    filepath = UPath(tmp_path if directory == "local" else directory) / "data.npy"
+    array = np.arange(60, dtype=np.float32).reshape(5, 3, 4)
+    save(array, filepath=filepath)
+    lazy = load_lazy(filepath)
+    assert lazy.shape == array.shape
+    assert lazy.dtype == array.dtype
+    assert len(lazy) == 5
+    keys = [
+        2,
+        -1,
+        slice(1, 3),
+        slice(None, None, 2),
+        slice(None, None, -2),
+        slice(3, 3),
+        (1, slice(None), 2),
+        (slice(1, 4), 0),
+        (Ellipsis, 1),
+        [0, 4],
+    ]
+    for key in keys:
+        np.testing.assert_array_equal(array[key], lazy[key])
+    np.testing.assert_array_equal(array, np.asarray(lazy))
+    with pytest.raises(IndexError):
+        lazy[5]
+
+    # Fortran-ordered arrays are read in full:
+    fortran_array = np.asfortranarray(array)
+    save(fortran_array, filepath=filepath)
+    np.testing.assert_array_equal(fortran_array[1:3], load_lazy(filepath)[1:3])
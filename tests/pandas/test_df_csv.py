@@ -0,0 +1,47 @@
+from pathlib import Path
+
+import pandas as pd
+import pytest
+from upath import UPath
+
+from dummio.pandas import df_csv, df_io
+
+
+def dataframe() -> pd.DataFrame:
+    return pd.DataFrame({"a": range(1000), "b": [f"row_{i}" for i in range(1000)]})
+
+
+@pytest.mark.parametrize("directory", ["local", "memory://csv"])
+def test_iter_load(tmp_path: Path, directory: str) -> None:
+    filepath = UPath(tmp_path if directory == "local" else directory) / "data.csv"
+    df = dataframe()
+    df_csv.save(df, filepath=filepath)
+
+    chunks = list(df_csv.iter_load(filepath, chunksize=300))
+    assert [len(chunk) for chunk in chunks] == [300, 300, 300, 100]
+    pd.testing.assert_frame_equal(df, pd.concat(chunks))
+
+    # chunk_bytes translates into roughly as many rows as fit in that many bytes:
+    chunks = list(df_csv.iter_load(filepath, chunk_bytes=4096))
+    assert len(chunks) > 1
+    assert all(len(chunk) * 8 <= 4096 for chunk in chunks)
+    pd.testing.assert_frame_equal(df, pd.concat(chunks))
+
+    # kwargs are passed along to pandas.read_csv:
+    chunks = list(df_csv.iter_load(filepath, chunksize=500, usecols=["b"]))
+    pd.testing.assert_frame_equal(df[["b"]], pd.concat(chunks))
+
+    with pytest.raises(ValueError, match="exactly one of"):
+        list(df_csv.iter_load(filepath))
+
+
+def test_df_io_iter_load(tmp_path: Path) -> None:
+    df = dataframe()
+    df_io.save(df, filepath=tmp_path / "data.csv")
+    chunks = list(df_io.iter_load(tmp_path / "data.csv", columns=["a"], chunksize=400))
+    assert len(chunks) == 3
+    pd.testing.assert_frame_equal(df[["a"]], pd.concat(chunks))
+
+    df_io.save(df, filepath=tmp_path / "data.feather")
+    with pytest.raises(ValueError, match="does not support streaming"):
+        df_io.iter_load(tmp_path / "data.feather")
@@ -0,0 +1,61 @@
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+import pyarrow.feather as feather
+import pytest
+from upath import UPath
+
+from dummio.pandas import df_feather, df_io
+
+
+def _frame(n: int = 100_000) -> pd.DataFrame:
+    return pd.DataFrame({"a": np.arange(n), "b": np.linspace(0, 1, n), "c": [f"name_{i % 10}" for i in range(n)]})
+
+
+def test_compression(tmp_path: Path) -> None:
+    data = _frame()
+    sizes = {}
+    for compression in ["uncompressed", "lz4", "zstd"]:
+        path = tmp_path / f"{compression}.feather"
+        df_feather.save(data, filepath=path, compression=compression)  # pyright: ignore[reportArgumentType]
+        pd.testing.assert_frame_equal(df_feather.load(path), data)
+        pd.testing.assert_frame_equal(df_feather.load(path, memory_map=True), data)
+        sizes[compression] = path.stat().st_size
+    assert sizes["uncompressed"] > max(sizes["lz4"], sizes["zstd"])
+    # uncompressed files are written as a single record batch, so that memory-mapped columns need not be concatenated:
+    assert feather.read_table(tmp_path / "uncompressed.feather").column("a").num_chunks == 1
+
+
+def test_columns(tmp_path: Path) -> None:
+    path = tmp_path / "data.feather"
+    data = _frame()
+    df_feather.save(data, filepath=path)
+    pd.testing.assert_frame_equal(df_feather.load(path, columns=["c", "a"]), data[["c", "a"]])
+    pd.testing.assert_frame_equal(df_feather.load(path, columns=["b"], memory_map=True), data[["b"]])
+    loaded = df_feather.load(path, columns=["c"], filters=[("a", "<", 5)])
+    pd.testing.assert_frame_equal(loaded, data.loc[:4, ["c"]])
+    pd.testing.assert_frame_equal(df_io.load(path, columns=["a"]), data[["a"]])
+
+
+def test_memory_map_zero_copy(tmp_path: Path) -> None:
+    path = tmp_path / "data.feather"
+    n = 100_000
+    data = pd.DataFrame({"a": np.arange(n), "b": np.linspace(0, 1, n)})
+    df_feather.save(data, filepath=path, compression="uncompressed")
+    before = pa.total_allocated_bytes()
+    loaded = df_feather.load(path, memory_map=True)
+    # the numeric columns share the memory-mapped file rather than arrow-allocated copies:
+    assert pa.total_allocated_bytes() - before < 2 * n
+    pd.testing.assert_frame_equal(loaded, data)
+
+
+def test_memory_map_unsupported(tmp_path: Path) -> None:
+    path = UPath("memory://dummio-test-feather/data.feather")
+    df_feather.save(_frame(10), filepath=path)
+    pd.testing.assert_frame_equal(df_feather.load(path, columns=["a"]), _frame(10)[["a"]])
+    with pytest.raises(ValueError, match="memory_map requires a local file"):
+        df_feather.load(path, memory_map=True)
+    with pytest.raises(ValueError, match="not supported with filters"):
+        df_feather.load(tmp_path / "data.feather", memory_map=True, filters=[("a", "<", 5)])
@@ -4,7 +4,7 @@ from pathlib import Path
 import pandas as pd
 import pytest
 
-from dummio.pandas.df_io import load, save
+from dummio.pandas.df_io import iter_load, load, load_many, save, save_many, save_stream
 
 
 def test_df_io(tmp_path: Path) -> None:
@@ -26,3 +26,52 @@ def test_df_io(tmp_path: Path) -> None:
     # Also it's permitted to skip the extension when writing a file:
     save(df, filepath=tmp_path / "data", format="feather")
     pd.testing.assert_frame_equal(df, load(tmp_path / "data", format="feather"))
+
+
+def test_load_many_save_many(tmp_path: Path) -> None:
+    frames = [pd.DataFrame({"a": range(i, i + 3), "b": [float(i)] * 3}) for i in range(10)]
+    filepaths = [tmp_path / f"part-{i}.parquet" for i in range(10)]
+    save_many(frames, filepaths=filepaths, max_workers=4)
+
+    loaded = load_many(filepaths, max_workers=4)
+    assert len(loaded) == len(frames)
+    for expected, actual in zip(frames, loaded):
+        pd.testing.assert_frame_equal(expected, actual)
+
+    combined = load_many(filepaths, columns=["a"], filters=[("a", "<", 5)], concat=True)
+    expected = pd.concat(frames, ignore_index=True)[["a"]]
+    pd.testing.assert_frame_equal(expected.loc[expected["a"] < 5].reset_index(drop=True), combined)
+
+    # shards may mix formats, each inferred from its extension:
+    mixed = [tmp_path / "part.csv", tmp_path / "part.feather"]
+    save_many(frames[:2], filepaths=mixed)
+    pd.testing.assert_frame_equal(pd.concat(frames[:2], ignore_index=True), load_many(mixed, concat=True))
+
+    with pytest.raises(ValueError, match="2 data frames but 1 filepaths"):
+        save_many(frames[:2], filepaths=mixed[:1])
+
+
+@pytest.mark.parametrize("format", ["parquet", "vortex"])
+def test_save_stream(tmp_path: Path, format: str) -> None:
+    frames = [pd.DataFrame({"a": range(i * 250, (i + 1) * 250), "b": [f"x{i}"] * 250}) for i in range(4)]
+    filepath = tmp_path / f"data.{format}"
+    save_stream(iter(frames), filepath=filepath, rows_per_batch=100)
+    expected = pd.concat(frames, ignore_index=True)
+    pd.testing.assert_frame_equal(load(filepath), expected)
+    if format == "parquet":
+        chunks = list(iter_load(filepath))
+        assert [len(chunk) for chunk in chunks] == [100, 100, 50] * 4
+
+
+def test_save_stream_index(tmp_path: Path) -> None:
+    df = pd.DataFrame({"a": range(10)}, index=pd.Index([f"k{i}" for i in range(10)], name="key"))
+    filepath = tmp_path / "data.parquet"
+    save_stream(df, filepath=filepath, rows_per_batch=3)
+    pd.testing.assert_frame_equal(load(filepath), df)
+
+
+def test_save_stream_unsupported(tmp_path: Path) -> None:
+    with pytest.raises(ValueError, match="does not support streaming writes"):
+        save_stream(pd.DataFrame({"a": [1]}), filepath=tmp_path / "data.csv")
+    with pytest.raises(ValueError, match="empty stream"):
+        save_stream(iter([]), filepath=tmp_path / "data.parquet")
@@ -2,8 +2,9 @@ from pathlib import Path
 
 import pandas as pd
 import pytest
+from upath import UPath
 
-from dummio.pandas import df_parquet
+from dummio.pandas import df_io, df_parquet
 
 
 def test_io(tmp_path: Path) -> None:
@@ -24,3 +25,22 @@ def test_io(tmp_path: Path) -> None:
         df_parquet.save(data, filepath=path, engine="fastparquet")
     # but should work fine with pyarrow
     df_parquet.save(data, filepath=path, engine="pyarrow")
+
+
+@pytest.mark.parametrize("directory", ["local", "memory://parquet"])
+def test_iter_load(tmp_path: Path, directory: str) -> None:
+    path = UPath(tmp_path if directory == "local" else directory) / "data.parquet"
+    data = pd.DataFrame({"a": range(100), "b": [f"row_{i}" for i in range(100)]}, index=range(100, 200))
+    df_parquet.save(data, filepath=path, engine="pyarrow", row_group_size=30)
+
+    chunks = list(df_parquet.iter_load(path))
+    assert [len(chunk) for chunk in chunks] == [30, 30, 30, 10]
+    pd.testing.assert_frame_equal(data, pd.concat(chunks))
+
+    chunks = list(df_parquet.iter_load(path, row_groups_per_batch=3, columns=["b"]))
+    assert [len(chunk) for chunk in chunks] == [90, 10]
+    pd.testing.assert_frame_equal(data[["b"]], pd.concat(chunks))
+
+    # also reachable via df_io:
+    chunks = list(df_io.iter_load(path, columns=["a"]))
+    pd.testing.assert_frame_equal(data[["a"]], pd.concat(chunks))
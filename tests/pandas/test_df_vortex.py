@@ -1,8 +1,11 @@
 from pathlib import Path
+from typing import Any
 
 import pandas as pd
+import pytest
+from upath import UPath
 
-from dummio.pandas import df_vortex
+from dummio.pandas import df_io, df_vortex
 
 
 def test_io(tmp_path: Path) -> None:
@@ -43,3 +46,63 @@ def test_with_nulls(tmp_path: Path) -> None:
     df_vortex.save(data, filepath=path)
     loaded_data = df_vortex.load(path)
     pd.testing.assert_frame_equal(data, loaded_data)
+
+
+def _frame(n: int = 1000) -> pd.DataFrame:
+    return pd.DataFrame({"a": range(n), "b": [f"name_{i}" for i in range(n)], "c": [i / 7 for i in range(n)]})
+
+
+def test_columns_filters_rows(tmp_path: Path) -> None:
+    path = tmp_path / "data.vortex"
+    data = _frame()
+    df_vortex.save(data, filepath=path)
+    pd.testing.assert_frame_equal(df_vortex.load(path, columns=["c", "a"]), data[["c", "a"]])
+    loaded = df_vortex.load(path, columns=["b"], filters=[("a", ">=", 990)])
+    pd.testing.assert_frame_equal(loaded, data.loc[990:, ["b"]].reset_index(drop=True))
+    loaded = df_vortex.load(path, rows=(100, 110))
+    pd.testing.assert_frame_equal(loaded, data.iloc[100:110].reset_index(drop=True))
+    # rows are selected before filtering, and the range is clipped to the file:
+    loaded = df_vortex.load(path, rows=(990, 2000), filters=[("a", "<", 995)])
+    pd.testing.assert_frame_equal(loaded, data.iloc[990:995].reset_index(drop=True))
+    with pytest.raises(ValueError, match="Invalid row range"):
+        df_vortex.load(path, rows=(10, 5))
+
+
+def test_iter_load(tmp_path: Path) -> None:
+    path = tmp_path / "data.vortex"
+    data = _frame()
+    df_vortex.save(data, filepath=path)
+    chunks = list(df_vortex.iter_load(path, batch_size=300, columns=["a"]))
+    assert [len(chunk) for chunk in chunks] == [300, 300, 300, 100]
+    pd.testing.assert_frame_equal(pd.concat(chunks, ignore_index=True), data[["a"]])
+    # via df_io:
+    chunks = list(df_io.iter_load(path, columns=["a"], batch_size=500, filters=[("a", "<", 10)]))
+    pd.testing.assert_frame_equal(pd.concat(chunks, ignore_index=True), data.loc[:9, ["a"]])
+
+
+def test_remote() -> None:
+    path = UPath("memory://dummio-test-vortex/data.vortex")
+    data = _frame()
+    df_vortex.save(data, filepath=path)
+    pd.testing.assert_frame_equal(df_vortex.load(path), data)
+    loaded = df_vortex.load(path, columns=["b"], filters=[("a", ">=", 990)], rows=(900, 1000))
+    pd.testing.assert_frame_equal(loaded, data.loc[990:, ["b"]].reset_index(drop=True))
+    df_vortex.save_stream((data.iloc[i : i + 250] for i in range(0, 1000, 250)), filepath=path, rows_per_batch=100)
+    chunks = list(df_vortex.iter_load(str(path), batch_size=300, columns=["a"]))
+    pd.testing.assert_frame_equal(pd.concat(chunks, ignore_index=True), data[["a"]])
+
+
+def test_remote_reads_ranges(monkeypatch: pytest.MonkeyPatch) -> None:
+    path = UPath("memory://dummio-test-vortex/ranges.vortex")
+    df_vortex.save(_frame(100_000), filepath=path)
+    requested: list[int] = []
+    cat_file = path.fs.cat_file
+
+    def spy(*args: Any, start: int, end: int, **kwargs: Any) -> Any:
+        requested.append(end - start)
+        return cat_file(*args, start=start, end=end, **kwargs)
+
+    monkeypatch.setattr(path.fs, "cat_file", spy)
+    loaded = df_vortex.load(path, columns=["a"], rows=(0, 10))
+    pd.testing.assert_frame_equal(loaded, _frame(10)[["a"]])
+    assert 0 < sum(requested) < path.stat().st_size
@@ -0,0 +1,94 @@
+from pathlib import Path
+
+import pandas as pd
+import pytest
+
+from dummio.pandas import df_io, filters
+
+FORMATS = ["csv", "feather", "parquet", "vortex"]
+
+FILTERS = [
+    [("a", ">", 2)],
+    [("a", ">=", 2), ("b", "!=", "y")],
+    [[("a", "<", 2)], [("b", "in", ["y", "z"])]],
+    [("b", "not in", ["x"]), ("a", "==", 4)],
+]
+
+
+def dataframe() -> pd.DataFrame:
+    return pd.DataFrame({"a": [1, 2, 3, 4, 5], "b": ["x", "y", "z", "x", "y"], "c": [0.5, 1.5, 2.5, 3.5, 4.5]})
+
+
+@pytest.mark.parametrize("format", FORMATS)
+@pytest.mark.parametrize("row_filters", FILTERS)
+def test_df_io_filters(tmp_path: Path, format: str, row_filters: filters.Filters) -> None:
+    df = dataframe()
+    filepath = tmp_path / f"data.{format}"
+    df_io.save(df, filepath=filepath)
+    expected = df.loc[filters.mask(df, row_filters)].reset_index(drop=True)
+    loaded = df_io.load(filepath, filters=row_filters).reset_index(drop=True)
+    pd.testing.assert_frame_equal(expected, loaded, check_dtype=False)
+
+    # the filter columns need not be among the loaded columns:
+    loaded = df_io.load(filepath, columns=["c"], filters=row_filters).reset_index(drop=True)
+    pd.testing.assert_frame_equal(expected[["c"]], loaded)
+
+
+def test_csv_filters_in_chunks(tmp_path: Path) -> None:
+    df = pd.DataFrame({"a": range(1000)})
+    filepath = tmp_path / "data.csv"
+    df_io.save(df, filepath=filepath)
+    loaded = df_io.load(filepath, filters=[("a", "<", 250)], chunksize=100)
+    pd.testing.assert_frame_equal(df.iloc[:250], loaded)
+
+
+@pytest.mark.parametrize(
+    "kwargs",
+    [{"index_col": "a"}, {"index_col": 0}, {"usecols": [2]}, {"usecols": lambda column: column == "c"}],
+)
+def test_csv_filters_columns(tmp_path: Path, kwargs: dict) -> None:
+    """Filters may refer to index columns and to columns that are deselected by position or by a callable."""
+    df = dataframe()
+    filepath = tmp_path / "data.csv"
+    df_io.save(df, filepath=filepath)
+    expected = pd.read_csv(filepath, **kwargs).loc[df["a"].gt(2).to_numpy()]
+    if "index_col" not in kwargs:
+        expected = expected.reset_index(drop=True)
+    pd.testing.assert_frame_equal(expected, df_io.load(filepath, filters=[("a", ">", 2)], **kwargs))
+
+    with pytest.raises(ValueError, match="not in the csv file"):
+        df_io.load(filepath, filters=[("d", ">", 2)])
+
+
+def test_mask_nulls() -> None:
+    df = pd.DataFrame({"a": [1.0, None, 3.0]})
+    assert filters.mask(df, [("a", "!=", 1.0)]).tolist() == [False, False, True]
+    assert filters.mask(df, [("a", "not in", [3.0])]).tolist() == [True, True, False]
+
+
+NULL_FILTERS = [
+    [("a", "not in", [1.0])],
+    [("b", "not in", ["x"])],
+    [("a", "!=", 1.0)],
+    [("b", "in", ["x", "z"])],
+    [("a", ">", 0.0)],
+]
+
+
+@pytest.mark.parametrize("format", FORMATS)
+@pytest.mark.parametrize("row_filters", NULL_FILTERS)
+def test_df_io_filters_nulls(tmp_path: Path, format: str, row_filters: filters.Filters) -> None:
+    """Nulls are filtered the same way for all formats, and the same way as by pyarrow."""
+    df = pd.DataFrame({"a": [1.0, None, 3.0], "b": ["x", None, "z"]})
+    filepath = tmp_path / f"data.{format}"
+    df_io.save(df, filepath=filepath)
+    expected = df.loc[filters.mask(df, row_filters)].reset_index(drop=True)
+    loaded = df_io.load(filepath, filters=row_filters).reset_index(drop=True)
+    pd.testing.assert_frame_equal(expected, loaded, check_dtype=False)
+
+
+def test_invalid_filters() -> None:
+    with pytest.raises(ValueError, match="Unsupported filter operator"):
+        filters.to_dnf([("a", "~", 1)])
+    with pytest.raises(ValueError, match="must not be empty"):
+        filters.to_dnf([])
@@ -0,0 +1,111 @@
+"""Test the coroutine equivalents of the module save/load methods."""
+
+import asyncio
+from pathlib import Path
+from types import ModuleType
+from typing import Any
+
+import numpy as np
+import pandas as pd
+import pytest
+from fsspec.implementations.asyn_wrapper import AsyncFileSystemWrapper
+from pydantic import BaseModel
+from upath import UPath
+
+import dummio
+from dummio import aio, fingerprint
+from dummio.pandas import df_parquet
+
+CASES: list[tuple[ModuleType, Any, str]] = [
+    (dummio.json, {"a": 1, "b": [1, 2]}, "data.json"),
+    (dummio.orjson, {"a": 1}, "data.json"),
+    (dummio.pickle, {"a": (1, 2)}, "data.pkl"),
+    (dummio.text, "Hello world!", "data.txt"),
+]
+
+
+async def _cycle(module: ModuleType, data: Any, filepath: UPath) -> Any:
+    await aio.save(data, filepath=filepath, module=module)
+    return await aio.load(filepath, module=module)
+
+
+@pytest.mark.parametrize("module, data, name", CASES)
+@pytest.mark.parametrize("directory", ["local", "memory://aio"])
+def test_aio_cycle(tmp_path: Path, module: ModuleType, data: Any, name: str, directory: str) -> None:
+    filepath = UPath(tmp_path if directory == "local" else directory) / name
+    assert asyncio.run(_cycle(module, data, filepath)) == data
+
+
+def test_aio_async_filesystem(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Exercise the path where transfers are coroutines on an async filesystem."""
+    memory = UPath("memory://aio-async").fs
+
+    def _async_filesystem(path: UPath) -> AsyncFileSystemWrapper:
+        return AsyncFileSystemWrapper(memory, asynchronous=True)
+
+    monkeypatch.setattr(aio, "_async_filesystem", _async_filesystem)
+
+    async def _many() -> list[Any]:
+        paths = [UPath(f"memory://aio-async/{i}.json") for i in range(50)]
+        await asyncio.gather(*[aio.save({"i": i}, filepath=p, module=dummio.json) for i, p in enumerate(paths)])
+        return await asyncio.gather(*[aio.load(p, module=dummio.json) for p in paths])
+
+    assert asyncio.run(_many()) == [{"i": i} for i in range(50)]
+    # the scratch files used for serialization are cleaned up:
+    assert not UPath(aio.SCRATCH_DIRECTORY).fs.exists(UPath(aio.SCRATCH_DIRECTORY).path + "/")
+
+    # extension-based behavior carries over, e.g. for data frames:
+    df = pd.DataFrame({"a": [1, 2], "b": [3.0, 4.0]})
+    filepath = UPath("memory://aio-async/data.parquet")
+    pd.testing.assert_frame_equal(df, asyncio.run(_cycle(df_parquet, df, filepath)))
+
+    # appending falls back to running the module's own save method:
+    filepath = UPath("memory://aio-async/data.txt")
+    asyncio.run(aio.save("a", filepath=filepath, module=dummio.text))
+    asyncio.run(aio.save("b", filepath=filepath, module=dummio.text, mode="a"))
+    assert asyncio.run(aio.load(filepath, module=dummio.text)) == "ab"
+
+
+def test_aio_sidecars(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Sidecar files are transferred along with the data file on the async path."""
+    memory = UPath("memory://aio-sidecars").fs
+    monkeypatch.setattr(aio, "_async_filesystem", lambda path: AsyncFileSystemWrapper(memory, asynchronous=True))
+
+    class Model(BaseModel):
+        a: int
+
+    filepath = UPath("memory://aio-sidecars/data.json")
+    asyncio.run(aio.save(Model(a=1), filepath=filepath, module=dummio.pydantic, fingerprint=True))
+    assert fingerprint.sidecar(filepath).exists()
+    loaded = asyncio.run(aio.load(filepath, module=dummio.pydantic, model=Model, trusted=True))
+    assert loaded == Model(a=1)
+    # saving without a fingerprint removes the stale sidecar:
+    asyncio.run(aio.save(Model(a=2), filepath=filepath, module=dummio.pydantic))
+    assert not fingerprint.sidecar(filepath).exists()
+
+    # files that merely look like sidecars of another module are left alone:
+    unrelated = UPath("memory://aio-sidecars/table.csv.data")
+    unrelated.write_bytes(b"unrelated")
+    asyncio.run(aio.save({"a": 1}, filepath=unrelated.with_name("table.csv"), module=dummio.json))
+    assert unrelated.read_bytes() == b"unrelated"
+
+    # a module that fails before writing anything raises its own error, rather than one from the cleanup:
+    with pytest.raises(TypeError):
+        asyncio.run(aio.save(object(), filepath=filepath, module=dummio.orjson))
+    assert not UPath(aio.SCRATCH_DIRECTORY).fs.exists(UPath(aio.SCRATCH_DIRECTORY).path + "/")
+
+
+def test_aio_onnx_external_data(monkeypatch: pytest.MonkeyPatch) -> None:
+    onnx = pytest.importorskip("onnx")
+    from onnx import helper, numpy_helper
+
+    memory = UPath("memory://aio-onnx").fs
+    monkeypatch.setattr(aio, "_async_filesystem", lambda path: AsyncFileSystemWrapper(memory, asynchronous=True))
+    weights = numpy_helper.from_array(np.arange(10_000, dtype=np.float32), "weights")
+    model = helper.make_model(helper.make_graph([], "graph", [], [], initializer=[weights]))
+    filepath = UPath("memory://aio-onnx/model.onnx")
+    asyncio.run(aio.save(model, filepath=filepath, module=dummio.onnx, external_data=True))
+    assert filepath.with_name("model.onnx.data").exists()
+    loaded = asyncio.run(aio.load(filepath, module=dummio.onnx))
+    assert isinstance(loaded, onnx.ModelProto)
+    assert loaded.SerializeToString() == model.SerializeToString()
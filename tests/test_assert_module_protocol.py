@@ -9,6 +9,8 @@ from dummio.protocol import assert_module_protocol
 IO_MODULES = [
     "dummio.dill",
     "dummio.json",
+    "dummio.jsonl",
+    "dummio.msgpack",
     "dummio.onnx",
     "dummio.orjson",
     "dummio.pickle",
@@ -16,6 +18,8 @@ IO_MODULES = [
     "dummio.text",
     "dummio.yaml",
     "dummio.mashumaro.json",
+    "dummio.mashumaro.msgpack",
+    "dummio.mashumaro.orjson",
     "dummio.mashumaro.yaml",
     "dummio.numpy.ndarray_io",
     "dummio.pandas.df_csv",
@@ -0,0 +1,52 @@
+"""Test the benchmark harness."""
+
+import json
+from pathlib import Path
+
+import pytest
+
+from dummio import bench, cli
+
+
+def test_run_in_process(tmp_path: Path) -> None:
+    results = bench.run(["json", "text", "df_parquet"], rows=20, repeats=3, directory=tmp_path, isolate=False)
+    assert [result.case for result in results] == ["json", "text", "df_parquet"]
+    for result in results:
+        assert result.skipped is None
+        assert result.file_bytes and result.file_bytes > 0
+        assert result.load_p50_s is not None and result.load_p99_s is not None
+        assert result.load_p50_s <= result.load_p99_s
+        assert result.save_mb_per_s and result.load_mb_per_s
+    assert "json" in bench.format_table(results)
+
+
+def test_cli(tmp_path: Path, capsys: pytest.CaptureFixture) -> None:
+    output = tmp_path / "results.json"
+    cli.main(["bench", "--cases", "orjson,numpy", "--rows", "10", "--repeats", "2", "--output", str(output)])
+    assert "orjson" in capsys.readouterr().out
+    report = json.loads(output.read_text())
+    assert [result["case"] for result in report["results"]] == ["orjson", "numpy"]
+    assert report["results"][0]["peak_rss_mb"] > 0
+
+
+def test_unknown_case() -> None:
+    with pytest.raises(ValueError, match="Unknown benchmark cases"):
+        bench.run(["nope"])
+
+
+def test_invalid_repeats(capsys: pytest.CaptureFixture) -> None:
+    with pytest.raises(ValueError, match="repeats must be at least 1"):
+        bench.run(["json"], repeats=0)
+    with pytest.raises(SystemExit):
+        cli.main(["bench", "--cases", "json", "--repeats", "0"])
+    assert "expected a positive integer" in capsys.readouterr().err
+
+
+def test_format_zero_rss_increase() -> None:
+    result = bench.Result(
+        case="json", module="dummio.json", rows=1, repeats=1, file_bytes=bench.MB, peak_rss_increase_mb=0.0
+    )
+    result.save_p50_s = result.load_p50_s = result.save_mb_per_s = result.load_mb_per_s = 1.0
+    assert bench.format_table([result]).splitlines()[1].endswith("0.0")
+    result.peak_rss_increase_mb = None
+    assert bench.format_table([result]).splitlines()[1].endswith("nan")
@@ -0,0 +1,99 @@
+"""Test the read-through cache for remote files."""
+
+from pathlib import Path
+
+import pandas as pd
+import pytest
+from pydantic import BaseModel
+from upath import UPath
+
+import dummio
+from dummio import fingerprint
+from dummio.cache import ReadThroughCache
+from dummio.pandas import df_io, df_parquet
+
+
+def _count_downloads(monkeypatch: pytest.MonkeyPatch, path: UPath) -> list[str]:
+    downloads = []
+    get_file = path.fs.get_file
+
+    def _get_file(rpath: str, lpath: str, **kwargs) -> None:
+        downloads.append(rpath)
+        get_file(rpath, lpath, **kwargs)
+
+    monkeypatch.setattr(path.fs, "get_file", _get_file)
+    return downloads
+
+
+def test_read_through(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    cache = ReadThroughCache(tmp_path / "cache")
+    remote = UPath("memory://cache-test/data.json")
+    dummio.json.save({"a": 1}, filepath=remote)
+    downloads = _count_downloads(monkeypatch, remote)
+
+    assert cache.load(remote, module=dummio.json) == {"a": 1}
+    assert cache.load(remote, module=dummio.json) == {"a": 1}
+    assert len(downloads) == 1
+
+    # a new version of the file is downloaded again:
+    dummio.json.save({"a": 1, "b": 2}, filepath=remote)
+    assert cache.load(remote, module=dummio.json) == {"a": 1, "b": 2}
+    assert len(downloads) == 2
+
+    # the local copy keeps the file name, so that extension-based IO works:
+    df = pd.DataFrame({"a": [1, 2]})
+    df_parquet.save(df, filepath=UPath("memory://cache-test/data.parquet"))
+    pd.testing.assert_frame_equal(df, cache.load("memory://cache-test/data.parquet", module=df_io))
+
+    # local paths pass straight through:
+    local = tmp_path / "local.json"
+    dummio.json.save({"c": 3}, filepath=local)
+    assert cache.localize(local) == local
+
+    cache.clear()
+    assert cache.size() == 0
+
+
+def test_lru_eviction(tmp_path: Path) -> None:
+    cache = ReadThroughCache(tmp_path / "cache", max_bytes=250)
+    paths = [UPath(f"memory://cache-lru/{i}.txt") for i in range(4)]
+    for path in paths:
+        dummio.text.save("x" * 100, filepath=path)
+
+    cache.localize(paths[0])
+    cache.localize(paths[1])
+    cache.localize(paths[0])  # now paths[1] is the least recently used
+    cache.localize(paths[2])
+    assert cache.size() == 200
+    cached = {entry.name for entry in (tmp_path / "cache").iterdir()}
+    assert cache._entry(paths[1]).name not in cached
+    assert cache._entry(paths[0]).name in cached
+
+
+def test_sidecars(tmp_path: Path) -> None:
+    """Sidecar files, such as schema fingerprints, are cached and revalidated together with the data file."""
+
+    class Model(BaseModel):
+        a: int
+
+    cache = ReadThroughCache(tmp_path / "cache")
+    remote = UPath("memory://cache-sidecars/data.json")
+    dummio.pydantic.save(Model(a=1), filepath=remote, fingerprint=True)
+    assert cache.load(remote, module=dummio.pydantic, model=Model, trusted=True) == Model(a=1)
+    assert fingerprint.sidecar(cache.localize(remote, module=dummio.pydantic)).exists()
+
+    # removing the remote sidecar file invalidates the cached copy:
+    fingerprint.sidecar(remote).unlink()
+    with pytest.raises(ValueError, match="no schema fingerprint"):
+        cache.load(remote, module=dummio.pydantic, model=Model, trusted=True)
+
+
+def test_sidecars_of_other_modules(tmp_path: Path) -> None:
+    """Files that merely look like sidecars of another module are neither checked nor cached."""
+    cache = ReadThroughCache(tmp_path / "cache")
+    remote = UPath("memory://cache-other-sidecars/data.json")
+    dummio.json.save({"a": 1}, filepath=remote)
+    remote.with_name("data.json.data").write_bytes(b"x" * 1000)
+    assert cache.load(remote, module=dummio.json) == {"a": 1}
+    assert not UPath(cache.localize(remote, module=dummio.json)).with_name("data.json.data").exists()
+    assert cache.size() == remote.stat().st_size
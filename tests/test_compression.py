@@ -0,0 +1,74 @@
+"""Test transparent compression by file extension."""
+
+import gzip
+from pathlib import Path
+from types import ModuleType
+from typing import Any
+
+import pandas as pd
+import pytest
+from upath import UPath
+
+import dummio
+from dummio import compression
+from dummio.pandas import df_csv
+
+EXTENSIONS = [".gz", ".bz2", ".zst", ".lz4"]
+
+MODULES: list[tuple[ModuleType, str, Any]] = [
+    (dummio.json, "data.json", {"a": [1, 2, 3], "b": "text"}),
+    (dummio.yaml, "data.yaml", {"a": [1, 2, 3], "b": "text"}),
+    (dummio.pickle, "data.pkl", {"a": {1, 2, 3}}),
+    (dummio.dill, "data.pkl", {"a": {1, 2, 3}}),
+    (dummio.text, "data.txt", "line 1\nline 2\n" * 1000),
+]
+
+
+@pytest.mark.parametrize("extension", EXTENSIONS)
+@pytest.mark.parametrize("module,filename,data", MODULES)
+def test_cycle(tmp_path: Path, module: ModuleType, filename: str, data: Any, extension: str) -> None:
+    for filepath in [tmp_path / (filename + extension), UPath(tmp_path / (filename + extension))]:
+        module.save(data, filepath=filepath)
+        assert module.load(filepath) == data
+
+
+@pytest.mark.parametrize("extension", EXTENSIONS)
+def test_df_csv(tmp_path: Path, extension: str) -> None:
+    df = pd.DataFrame({"a": range(1000), "b": [f"name_{i}" for i in range(1000)]})
+    filepath = tmp_path / ("data.csv" + extension)
+    df_csv.save(df, filepath=filepath)
+    pd.testing.assert_frame_equal(df_csv.load(filepath), df)
+    chunks = list(df_csv.iter_load(filepath, chunksize=300))
+    assert [len(chunk) for chunk in chunks] == [300, 300, 300, 100]
+    pd.testing.assert_frame_equal(pd.concat(chunks), df)
+
+
+def test_compressed_on_disk(tmp_path: Path) -> None:
+    filepath = tmp_path / "data.json.gz"
+    dummio.json.save({"a": 1}, filepath=filepath, compression_level=1)
+    with gzip.open(filepath, "rt") as file:
+        assert file.read().startswith("{")
+
+
+def test_text_append(tmp_path: Path) -> None:
+    filepath = tmp_path / "data.txt.zst"
+    dummio.text.save("a", filepath=filepath)
+    dummio.text.save("b", filepath=filepath, mode="a")
+    assert dummio.text.load(filepath) == "ab"
+
+
+def test_zstd_threads(tmp_path: Path) -> None:
+    filepath = tmp_path / "data.txt.zst"
+    data = "line\n" * 100_000
+    dummio.text.save(data, filepath=filepath, compression_level=10, compression_threads=2)
+    assert dummio.text.load(filepath) == data
+
+
+def test_threads_unsupported(tmp_path: Path) -> None:
+    with pytest.raises(ValueError, match="only for zstd"):
+        dummio.text.save("a", filepath=tmp_path / "data.txt.gz", compression_threads=2)
+
+
+def test_codec() -> None:
+    assert compression.codec("s3://bucket/data.json.ZST") == compression.ZSTD
+    assert compression.codec("data.json") is None
@@ -0,0 +1,87 @@
+"""Test the instrumentation hooks around save/load."""
+
+from pathlib import Path
+
+import pandas as pd
+import pytest
+from upath import UPath
+
+import dummio
+from dummio import hooks
+from dummio.pandas import df_io
+
+
+def test_hooks(tmp_path: Path) -> None:
+    started: list[hooks.Event] = []
+    finished: list[hooks.Event] = []
+    hooks.register(on_start=started.append, on_finish=finished.append)
+    try:
+        dummio.json.save({"a": 1}, filepath=tmp_path / "data.json")
+        dummio.json.load(tmp_path / "data.json")
+        with pytest.raises(FileNotFoundError):
+            dummio.text.load(UPath("memory://hooks/missing.txt"))
+    finally:
+        hooks.unregister(on_start=started.append, on_finish=finished.append)
+
+    assert started == finished
+    assert [(event.module, event.operation) for event in finished] == [
+        ("dummio.json", "save"),
+        ("dummio.json", "load"),
+        ("dummio.text", "load"),
+    ]
+    save, load, failed = finished
+    assert save.protocol == "file"
+    assert save.nbytes == (tmp_path / "data.json").stat().st_size
+    assert load.duration_s is not None and load.duration_s >= 0
+    assert isinstance(failed.error, FileNotFoundError)
+    assert failed.protocol == "memory"
+    assert failed.nbytes is None
+
+    # nothing is recorded once unregistered:
+    dummio.json.load(tmp_path / "data.json")
+    assert len(finished) == 3
+
+
+def test_stats(tmp_path: Path) -> None:
+    stats = hooks.Stats(count_bytes=True)
+    stats.install()
+    try:
+        df = pd.DataFrame({"a": [1, 2, 3]})
+        for _ in range(3):
+            df_io.save(df, filepath=tmp_path / "data.parquet")
+            df_io.load(tmp_path / "data.parquet")
+    finally:
+        stats.uninstall()
+    summary = {(record["module"], record["operation"]): record for record in stats.summary()}
+    # df_io delegates to the format module, which is what gets counted:
+    assert set(summary) == {("dummio.pandas.df_parquet", "save"), ("dummio.pandas.df_parquet", "load")}
+    load = summary[("dummio.pandas.df_parquet", "load")]
+    assert load["count"] == 3
+    assert load["errors"] == 0
+    assert load["nbytes"] == 3 * (tmp_path / "data.parquet").stat().st_size
+    assert sum(load["latency_histogram"].values()) == 3
+
+
+def test_phases(tmp_path: Path) -> None:
+    finished: list[hooks.Event] = []
+    hooks.register(on_finish=finished.append)
+    try:
+        dummio.orjson.save({"a": list(range(1000))}, filepath=tmp_path / "data.json")
+        dummio.orjson.load(tmp_path / "data.json")
+        dummio.text.save("a", filepath=tmp_path / "data.txt")
+    finally:
+        hooks.unregister(on_finish=finished.append)
+
+    save, load, text = finished
+    # modules that serialize to bytes split their duration into serialization and transfer:
+    assert save.serialize_s is not None and save.transfer_s is not None and save.duration_s is not None
+    assert save.serialize_s + save.transfer_s <= save.duration_s
+    assert load.serialize_s is not None
+    # other modules do not report the phases:
+    assert text.serialize_s is None and text.transfer_s is None
+
+    # phases are no-ops outside of instrumented calls, or when no hooks are registered:
+    with hooks.phase(hooks.SERIALIZE):
+        pass
+    dummio.orjson.save({"a": 1}, filepath=tmp_path / "data.json")
+    assert len(finished) == 3
@@ -0,0 +1,47 @@
+"""Guard against regressions in the cost of `import dummio`."""
+
+import subprocess
+import sys
+
+import dummio
+
+LAZY_DEPENDENCIES = ["dill", "msgpack", "onnx", "orjson", "pydantic", "ruamel.yaml"]
+
+SCRIPT = f"""
+import sys
+
+import dummio
+
+eager = [name for name in {LAZY_DEPENDENCIES!r} if name in sys.modules]
+assert not eager, f"import dummio eagerly imported {{eager}}"
+"""
+
+MISSING_DEPENDENCY_SCRIPT = """
+import sys
+
+# simulate that onnx is not installed:
+sys.modules["onnx"] = None
+
+import dummio
+
+assert not hasattr(dummio, "onnx")
+try:
+    dummio.onnx
+except AttributeError as err:
+    assert isinstance(err.__cause__, ImportError), err
+"""
+
+
+def test_import_is_lazy():
+    # measuring import time directly would be flaky on CI, so check that the heavy dependencies are not imported:
+    subprocess.run([sys.executable, "-c", SCRIPT], capture_output=True, text=True, check=True)
+
+
+def test_missing_dependency():
+    subprocess.run([sys.executable, "-c", MISSING_DEPENDENCY_SCRIPT], capture_output=True, text=True, check=True)
+
+
+def test_lazy_submodules_resolve():
+    assert dummio.yaml.load is not None
+    assert dummio.orjson.save is not None
+    assert "yaml" in dir(dummio)
@@ -0,0 +1,46 @@
+"""Test IO for JSON Lines."""
+
+from pathlib import Path
+from typing import Iterator
+
+from upath import UPath
+
+import dummio
+from dummio import jsonl
+
+
+def _records(n: int) -> Iterator[dict]:
+    for i in range(n):
+        yield {"id": i, "name": f"name_{i}", "tags": ["a", "b"]}
+
+
+def test_cycle(tmp_path: Path) -> None:
+    filepath = tmp_path / "events.jsonl"
+    # a generator with more records than the batch size:
+    jsonl.save(_records(25), filepath=filepath, batch_size=10)
+    assert jsonl.load(filepath) == list(_records(25))
+    assert filepath.read_text().count("\n") == 25
+
+
+def test_lazy(tmp_path: Path) -> None:
+    filepath = UPath(tmp_path / "events.jsonl")
+    jsonl.save(list(_records(3)), filepath=filepath)
+    records = jsonl.load(filepath, lazy=True)
+    assert not isinstance(records, list)
+    assert next(records) == {"id": 0, "name": "name_0", "tags": ["a", "b"]}
+    assert list(records) == list(_records(3))[1:]
+
+
+def test_append_and_blank_lines(tmp_path: Path) -> None:
+    filepath = tmp_path / "events.jsonl"
+    jsonl.save([{"a": 1}], filepath=filepath)
+    with open(filepath, "a") as file:
+        file.write("\n")
+    jsonl.save([{"a": 2}], filepath=filepath, mode="a")
+    assert dummio.jsonl.load(filepath) == [{"a": 1}, {"a": 2}]
+
+
+def test_compressed(tmp_path: Path) -> None:
+    filepath = tmp_path / "events.jsonl.gz"
+    jsonl.save(_records(100), filepath=filepath)
+    assert list(jsonl.load(filepath, lazy=True)) == list(_records(100))
@@ -0,0 +1,125 @@
+"""Test in-process memoization of load."""
+
+import copy
+import json
+import pickle
+from collections import Counter, OrderedDict
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import pytest
+from upath import UPath
+
+import dummio
+from dummio.memo import Memo, estimate_size, freeze
+
+
+def _count_loads(monkeypatch: pytest.MonkeyPatch) -> list[str]:
+    loads = []
+    load = dummio.json.load
+
+    def _load(filepath: str, **kwargs) -> dict:
+        loads.append(str(filepath))
+        return load(filepath, **kwargs)
+
+    monkeypatch.setattr(dummio.json, "load", _load)
+    return loads
+
+
+@pytest.mark.parametrize("directory", ["local", "memory://memo"])
+def test_memo_copy(tmp_path: Path, monkeypatch: pytest.MonkeyPatch, directory: str) -> None:
+    filepath = UPath(tmp_path if directory == "local" else directory) / "data.json"
+    dummio.json.save({"a": [1, 2]}, filepath=filepath)
+    loads = _count_loads(monkeypatch)
+    memo = Memo()
+
+    data = memo.load(filepath, module=dummio.json)
+    data["a"].append(3)  # does not corrupt the memo
+    assert memo.load(filepath, module=dummio.json) == {"a": [1, 2]}
+    assert len(loads) == 1
+
+    # a changed file is loaded again:
+    dummio.json.save({"a": [1, 2], "b": 1}, filepath=filepath)
+    assert memo.load(filepath, module=dummio.json) == {"a": [1, 2], "b": 1}
+    assert len(loads) == 2
+    assert len(memo) == 1
+
+
+def test_memo_readonly(tmp_path: Path) -> None:
+    filepath = tmp_path / "data.json"
+    dummio.json.save({"a": [1, 2], "b": {"c": 3}}, filepath=filepath)
+    memo = Memo(policy="readonly")
+    data = memo.load(filepath, module=dummio.json)
+    assert data is memo.load(filepath, module=dummio.json)
+    # the frozen object behaves like an unfrozen load:
+    assert isinstance(data, dict)
+    assert isinstance(data["a"], list)
+    assert data == dummio.json.load(filepath)
+    assert json.loads(json.dumps(data)) == data
+    with pytest.raises(TypeError):
+        data["b"]["c"] = 4
+    with pytest.raises(TypeError):
+        data["a"].append(3)
+    assert data == {"a": [1, 2], "b": {"c": 3}}
+
+    # a deep copy is mutable again:
+    thawed = copy.deepcopy(data)
+    assert type(thawed) is dict and type(thawed["a"]) is list
+    thawed["a"].append(3)
+
+
+def test_memo_readonly_yaml(tmp_path: Path) -> None:
+    filepath = tmp_path / "config.yaml"
+    filepath.write_text("a: [1, 2]  # comment\nb:\n  c: 3\n")
+    memo = Memo(policy="readonly")
+    config = memo.load(filepath, module=dummio.yaml)
+    # the frozen object keeps the ordered map type of ruamel:
+    assert isinstance(config, type(dummio.yaml.load(filepath)))
+    with pytest.raises(TypeError):
+        config["b"]["c"] = 4
+    with pytest.raises(TypeError):
+        config["a"].append(3)
+    assert memo.load(filepath, module=dummio.yaml) == {"a": [1, 2], "b": {"c": 3}}
+
+    thawed = copy.deepcopy(config)
+    assert type(thawed) is type(dummio.yaml.load(filepath))
+    thawed["b"]["c"] = 4
+    dummio.yaml.save(thawed, filepath=tmp_path / "copy.yaml")
+    assert "# comment" in (tmp_path / "copy.yaml").read_text()
+
+
+def test_memo_eviction(tmp_path: Path) -> None:
+    memo = Memo(max_bytes=3 * estimate_size({"x": "x" * 1000}))
+    for i in range(5):
+        dummio.json.save({"x": "x" * 1000}, filepath=tmp_path / f"{i}.json")
+        memo.load(tmp_path / f"{i}.json", module=dummio.json)
+    assert len(memo) == 3
+    assert memo.size <= memo.max_bytes
+
+
+def test_estimate_size_and_freeze() -> None:
+    array = np.zeros(1000)
+    assert estimate_size(array) >= 8000
+    assert estimate_size(pd.DataFrame({"a": array})) >= 8000
+    assert estimate_size({"a": array, "b": array}) < 2 * 8000
+    frozen = freeze({"a": array})
+    with pytest.raises(ValueError):
+        frozen["a"][0] = 1
+    assert array.flags.writeable
+    frozen_set = freeze({1, 2})
+    assert isinstance(frozen_set, set)
+    with pytest.raises(TypeError):
+        frozen_set.add(3)
+
+    # subclasses are frozen too, and pickle as the original class:
+    counter = freeze(Counter(a=1))
+    assert isinstance(counter, Counter)
+    with pytest.raises(TypeError):
+        counter.update(a=1)
+    unpickled = pickle.loads(pickle.dumps(counter))
+    assert type(unpickled) is Counter and unpickled == {"a": 1}
+    unpickled.update(a=1)
+    # subclasses implemented in C can not be frozen:
+    with pytest.raises(TypeError, match="Cannot freeze"):
+        freeze(OrderedDict(a=1))
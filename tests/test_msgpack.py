@@ -0,0 +1,58 @@
+"""Test IO for MessagePack."""
+
+import datetime
+from pathlib import Path
+
+import numpy as np
+import pytest
+from upath import UPath
+
+from dummio import msgpack as dummio_msgpack
+
+
+def _data() -> dict:
+    return {
+        "name": "text",
+        1: [1, 2.5, None, True],
+        "blob": b"\x00\x01",
+        "aware": datetime.datetime(2024, 1, 1, 12, tzinfo=datetime.timezone.utc),
+        "naive": datetime.datetime(2024, 1, 1, 12, 30),
+        "array": np.arange(12, dtype="float32").reshape(3, 4),
+        "scalar": np.int64(7),
+    }
+
+
+def _assert_equal(loaded: dict, data: dict) -> None:
+    array = loaded.pop("array")
+    np.testing.assert_array_equal(array, data["array"])
+    assert array.dtype == data["array"].dtype
+    assert loaded == {key: value for key, value in data.items() if key != "array"}
+
+
+@pytest.mark.parametrize("filename", ["data.msgpack", "data.msgpack.zst"])
+def test_cycle(tmp_path: Path, filename: str) -> None:
+    data = _data()
+    for filepath in [tmp_path / filename, str(tmp_path / filename), UPath(tmp_path / filename)]:
+        dummio_msgpack.save(data, filepath=filepath)
+        _assert_equal(dummio_msgpack.load(filepath), data)
+
+
+def test_remote() -> None:
+    data = _data()
+    filepath = UPath("memory://dummio-test-msgpack/data.msgpack")
+    dummio_msgpack.save(data, filepath=filepath)
+    _assert_equal(dummio_msgpack.load(filepath), data)
+
+
+def test_stream(tmp_path: Path) -> None:
+    filepath = tmp_path / "records.msgpack"
+    dummio_msgpack.save_stream(({"id": i} for i in range(25)), filepath=filepath, batch_size=10)
+    dummio_msgpack.save_stream([{"id": 25}], filepath=filepath, mode="a")
+    records = dummio_msgpack.iter_load(filepath, chunk_bytes=16)
+    assert next(records) == {"id": 0}
+    assert list(records) == [{"id": i} for i in range(1, 26)]
+
+
+def test_object_array(tmp_path: Path) -> None:
+    with pytest.raises(TypeError, match="object dtype"):
+        dummio_msgpack.save({"a": np.array([{}], dtype=object)}, filepath=tmp_path / "data.msgpack")
@@ -1,7 +1,132 @@
 from pathlib import Path
 
+import numpy as np
+import onnx
+import pytest
+from onnx import external_data_helper, helper, numpy_helper
+from upath import UPath
+
 from dummio import onnx as onnx_io
 
 
 def test_onnx_io_cycle(tmp_path: Path) -> None:
     _ = onnx_io.example(tmp_path / "model.onnx")
+
+
+def _model() -> onnx.ModelProto:
+    """A model with a large and a small initializer."""
+    weights = np.arange(10_000, dtype=np.float32).reshape(100, 100)
+    bias = np.ones(3, dtype=np.int64)
+    graph = helper.make_graph(
+        nodes=[helper.make_node("MatMul", ["x", "weights"], ["y"])],
+        name="graph",
+        inputs=[helper.make_tensor_value_info("x", onnx.TensorProto.FLOAT, [1, 100])],
+        outputs=[helper.make_tensor_value_info("y", onnx.TensorProto.FLOAT, [1, 100])],
+        initializer=[numpy_helper.from_array(weights, "weights"), numpy_helper.from_array(bias, "bias")],
+    )
+    return helper.make_model(graph)
+
+
+@pytest.mark.parametrize("local", [True, False])
+def test_external_data(tmp_path: Path, local: bool) -> None:
+    model = _model()
+    serialized = model.SerializeToString()
+    directory = UPath(tmp_path) if local else UPath("memory://dummio-test-onnx")
+    filepath = directory / "model.onnx"
+    onnx_io.save(model, filepath=filepath, external_data=True)
+    # the caller's model is unchanged:
+    assert model.SerializeToString() == serialized
+    # the weights are in the sidecar file, and not in the model file:
+    assert (directory / ("model.onnx" + onnx_io.EXTERNAL_DATA_SUFFIX)).stat().st_size == 40_000
+    assert filepath.stat().st_size < 1000
+
+    assert onnx_io.load(filepath).SerializeToString() == serialized
+
+    graph_only = onnx_io.load(filepath, load_external_data=False)
+    assert graph_only.graph.node[0].op_type == "MatMul"
+    assert not graph_only.graph.initializer[0].HasField("raw_data")
+
+    initializers = onnx_io.load_initializers(filepath)
+    np.testing.assert_array_equal(initializers["weights"], numpy_helper.to_array(model.graph.initializer[0]))
+    np.testing.assert_array_equal(initializers["bias"], np.ones(3))
+    assert isinstance(initializers["weights"], np.memmap) == local
+
+
+def test_external_data_overwrite(tmp_path: Path) -> None:
+    filepath = tmp_path / "model.onnx"
+    onnx_io.save(_model(), filepath=filepath, external_data=True)
+    onnx_io.save(_model(), filepath=filepath, external_data=True)
+    assert onnx_io.load(filepath).SerializeToString() == _model().SerializeToString()
+
+
+@pytest.mark.parametrize("local", [True, False])
+def test_external_data_removed(tmp_path: Path, local: bool) -> None:
+    directory = UPath(tmp_path) if local else UPath("memory://dummio-test-onnx-removed")
+    filepath = directory / "model.onnx"
+    sidecar = directory / ("model.onnx" + onnx_io.EXTERNAL_DATA_SUFFIX)
+    onnx_io.save(_model(), filepath=filepath, external_data=True)
+    assert sidecar.exists()
+    # re-saving without external data removes the stale sidecar file:
+    onnx_io.save(_model(), filepath=filepath)
+    assert not sidecar.exists()
+    onnx_io.save(_model(), filepath=filepath, external_data=True)
+    # no tensor is large enough for the sidecar file:
+    onnx_io.save(_model(), filepath=filepath, external_data=True, size_threshold=10**6)
+    assert not sidecar.exists()
+    assert onnx_io.load(filepath).SerializeToString() == _model().SerializeToString()
+
+
+def test_external_data_subgraph(tmp_path: Path) -> None:
+    """Tensors in subgraphs and in node attributes are read back from the sidecar file too."""
+    branch = helper.make_graph(
+        nodes=[helper.make_node("Identity", ["branch_weights"], ["z"])],
+        name="branch",
+        inputs=[],
+        outputs=[helper.make_tensor_value_info("z", onnx.TensorProto.FLOAT, [1000])],
+        initializer=[numpy_helper.from_array(np.arange(1000, dtype=np.float32), "branch_weights")],
+    )
+    constant = numpy_helper.from_array(np.ones(1000, dtype=np.float32), "constant")
+    nodes = [
+        helper.make_node("If", ["condition"], ["y"], then_branch=branch, else_branch=branch),
+        helper.make_node("Constant", [], ["c"], value=constant),
+    ]
+    graph = helper.make_graph(
+        nodes=nodes,
+        name="graph",
+        inputs=[helper.make_tensor_value_info("condition", onnx.TensorProto.BOOL, [])],
+        outputs=[helper.make_tensor_value_info("y", onnx.TensorProto.FLOAT, [1000])],
+    )
+    model = helper.make_model(graph)
+    filepath = tmp_path / "model.onnx"
+    external_data_helper.convert_model_to_external_data(model, location="model.onnx.data", convert_attribute=True)
+    onnx.save_model(model, str(filepath))
+    loaded = onnx_io.load(filepath)
+    assert not any(external_data_helper.uses_external_data(tensor) for tensor in onnx_io._tensors(loaded.graph))
+    assert numpy_helper.to_array(loaded.graph.node[1].attribute[0].t).sum() == 1000
+    branch_weights = loaded.graph.node[0].attribute[0].g.initializer[0]
+    np.testing.assert_array_equal(numpy_helper.to_array(branch_weights), np.arange(1000, dtype=np.float32))
+
+
+def test_external_data_upload_order(monkeypatch: pytest.MonkeyPatch) -> None:
+    """On remote paths, the sidecar file is uploaded before the model file."""
+    filepath = UPath("memory://dummio-test-onnx-order/model.onnx")
+    uploads = []
+    put_file = filepath.fs.put_file
+
+    def _put_file(lpath: str, rpath: str, **kwargs) -> None:
+        uploads.append(Path(rpath).name)
+        put_file(lpath, rpath, **kwargs)
+
+    monkeypatch.setattr(filepath.fs, "put_file", _put_file)
+    onnx_io.save(_model(), filepath=filepath, external_data=True)
+    assert uploads == ["model.onnx.data", "model.onnx"]
+
+
+def test_unsupported_location(tmp_path: Path) -> None:
+    model = _model()
+    external_data_helper.set_external_data(model.graph.initializer[0], location="../weights.data")
+    model.graph.initializer[0].data_location = onnx.TensorProto.EXTERNAL
+    model.graph.initializer[0].ClearField("raw_data")
+    onnx_io.save(model, filepath=tmp_path / "model.onnx")
+    with pytest.raises(ValueError, match="Unsupported external data location"):
+        onnx_io.load(tmp_path / "model.onnx")
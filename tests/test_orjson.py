@@ -0,0 +1,39 @@
+"""Test IO for json using orjson."""
+
+from pathlib import Path
+
+import pytest
+from upath import UPath
+
+from dummio import orjson as dummio_orjson
+from dummio import utils
+
+DATA = {"a": [1, 2.5, None], "b": {"c": "text " * 1000}}
+
+
+def test_local(tmp_path: Path) -> None:
+    for filepath in [tmp_path / "data.json", str(tmp_path / "data.json"), UPath(tmp_path / "data.json")]:
+        dummio_orjson.save(DATA, filepath=filepath)
+        assert dummio_orjson.load(filepath) == DATA
+
+
+def test_remote() -> None:
+    filepath = UPath("memory://dummio-test-orjson/data.json")
+    dummio_orjson.save(DATA, filepath=filepath)
+    assert dummio_orjson.load(filepath) == DATA
+
+
+def test_empty_file(tmp_path: Path) -> None:
+    filepath = tmp_path / "data.json"
+    filepath.touch()
+    with pytest.raises(ValueError):
+        dummio_orjson.load(filepath)
+
+
+def test_truncated_read() -> None:
+    class ShortFile:
+        def readinto(self, buffer: memoryview) -> int:
+            return 0
+
+    with pytest.raises(EOFError):
+        utils.fill(ShortFile(), bytearray(3))  # pyright: ignore[reportArgumentType]
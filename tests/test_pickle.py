@@ -0,0 +1,72 @@
+"""Test IO for pickle, including out-of-band buffers."""
+
+import mmap
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import pytest
+from upath import UPath
+
+from dummio import pickle
+
+
+def _data() -> dict:
+    rng = np.random.default_rng(0)
+    return {
+        "weights": rng.standard_normal((1000, 100)),
+        "small": np.arange(3),
+        "frame": pd.DataFrame({"a": rng.standard_normal(10_000), "b": np.arange(10_000)}),
+        "name": "model",
+    }
+
+
+def _assert_equal(loaded: dict, data: dict) -> None:
+    assert loaded.keys() == data.keys()
+    np.testing.assert_array_equal(loaded["weights"], data["weights"])
+    np.testing.assert_array_equal(loaded["small"], data["small"])
+    pd.testing.assert_frame_equal(loaded["frame"], data["frame"])
+    assert loaded["name"] == data["name"]
+
+
+def test_out_of_band_local(tmp_path: Path) -> None:
+    data = _data()
+    filepath = tmp_path / "model.pkl"
+    pickle.save(data, filepath=filepath, out_of_band=True)
+    assert filepath.read_bytes().startswith(pickle.MAGIC)
+    loaded = pickle.load(filepath)
+    _assert_equal(loaded, data)
+    # the large array is backed by the memory-mapped file, aligned, and writeable without modifying the file:
+    weights = loaded["weights"]
+    base = weights
+    while isinstance(base, np.ndarray):
+        base = base.base
+    assert isinstance(base, memoryview) and isinstance(base.obj, mmap.mmap)
+    assert weights.ctypes.data % pickle.ALIGNMENT == 0
+    weights[0, 0] = 42.0
+    np.testing.assert_array_equal(pickle.load(filepath)["weights"], data["weights"])
+
+
+def test_out_of_band_remote() -> None:
+    data = _data()
+    filepath = UPath("memory://dummio-test-pickle/model.pkl")
+    pickle.save(data, filepath=filepath, out_of_band=True)
+    _assert_equal(pickle.load(filepath), data)
+
+    # a truncated container fails rather than loading zeros in place of the missing bytes:
+    filepath.write_bytes(filepath.read_bytes()[:-100])
+    with pytest.raises(EOFError):
+        pickle.load(filepath)
+
+
+def test_in_band_auto_detect(tmp_path: Path) -> None:
+    data = _data()
+    filepath = tmp_path / "model.pkl"
+    pickle.save(data, filepath=filepath)
+    assert not filepath.read_bytes().startswith(pickle.MAGIC)
+    _assert_equal(pickle.load(filepath), data)
+
+
+def test_out_of_band_compressed(tmp_path: Path) -> None:
+    with pytest.raises(ValueError, match="not supported for compressed files"):
+        pickle.save(_data(), filepath=tmp_path / "model.pkl.gz", out_of_band=True)
@@ -1,10 +1,13 @@
-from datetime import datetime
+from datetime import datetime, timezone
 from pathlib import Path
+from typing import Iterator
 from uuid import UUID
 
+import pytest
 from pydantic import BaseModel
 
 import dummio.pydantic
+from dummio import fingerprint
 
 
 class Data(BaseModel):
@@ -17,3 +20,122 @@ class Data(BaseModel):
 
 def test_pydantic_io(tmp_path: Path) -> None:
     _ = dummio.pydantic.example(filepath=tmp_path / "data.json")
+
+
+def _records(n: int) -> list[Data]:
+    return [
+        Data(
+            id=UUID(int=i),
+            documentation=f"record {i}",
+            config={"i": i},
+            rmse=i / 7,
+            trained_at=datetime(2024, 1, 1, tzinfo=timezone.utc),
+        )
+        for i in range(n)
+    ]
+
+
+def test_list(tmp_path: Path) -> None:
+    records = _records(100)
+    filepath = tmp_path / "data.json"
+    dummio.pydantic.save_list(records, filepath=filepath)
+    assert dummio.pydantic.load_list(filepath, model=Data) == records
+
+
+def test_empty_list(tmp_path: Path) -> None:
+    filepath = tmp_path / "data.json"
+    dummio.pydantic.save_list([], filepath=filepath)
+    assert filepath.read_text() == "[]"
+    assert dummio.pydantic.load_list(filepath, model=Data) == []
+
+
+def test_list_mixed_types(tmp_path: Path) -> None:
+    class Scored(Data):
+        score: float
+
+    records = _records(2)
+    scored = Scored(**records[0].model_dump(), score=1.0)
+    filepath = tmp_path / "data.json"
+    with pytest.raises(ValueError, match="mixed types"):
+        dummio.pydantic.save_list([*records, scored], filepath=filepath)
+    with pytest.raises(ValueError, match="mixed types"):
+        dummio.pydantic.save_jsonl([*records, scored], filepath=tmp_path / "data.jsonl")
+    # with an explicit model, each record is serialized as that model:
+    dummio.pydantic.save_list([*records, scored], filepath=filepath, model=Data)
+    assert dummio.pydantic.load_list(filepath, model=Data) == [*records, records[0]]
+
+
+@pytest.mark.parametrize("filename", ["data.jsonl", "data.jsonl.gz"])
+def test_jsonl(tmp_path: Path, filename: str) -> None:
+    records = _records(25)
+    filepath = tmp_path / filename
+    dummio.pydantic.save_jsonl(iter(records), filepath=filepath, batch_size=10)
+    loaded = dummio.pydantic.iter_load_jsonl(filepath, model=Data, batch_size=10)
+    assert isinstance(loaded, Iterator)
+    assert list(loaded) == records
+
+
+class Child(BaseModel):
+    name: str
+    born: datetime
+
+
+class Parent(BaseModel):
+    id: UUID
+    scores: list[float]
+    child: Child
+    children: list[Child]
+    maybe_child: Child | None = None
+    parent: "Parent | None" = None
+
+
+def _parent() -> Parent:
+    child = Child(name="c", born=datetime(2020, 1, 1, tzinfo=timezone.utc))
+    return Parent(
+        id=UUID(int=1),
+        scores=[1.5, 2.5],
+        child=child,
+        children=[child, child],
+        maybe_child=child,
+        parent=Parent(id=UUID(int=2), scores=[], child=child, children=[]),
+    )
+
+
+def test_trusted(tmp_path: Path) -> None:
+    data = _parent()
+    filepath = tmp_path / "data.json"
+    dummio.pydantic.save(data, filepath=filepath, fingerprint=True)
+    loaded = dummio.pydantic.load(filepath, model=Parent, trusted=True)
+    assert loaded == data
+    assert isinstance(loaded.child.born, datetime)
+    assert loaded.parent is not None and isinstance(loaded.parent.child, Child)
+
+
+def test_trusted_requires_fingerprint(tmp_path: Path) -> None:
+    filepath = tmp_path / "data.json"
+    dummio.pydantic.save(_parent(), filepath=filepath)
+    with pytest.raises(ValueError, match="no schema fingerprint"):
+        dummio.pydantic.load(filepath, model=Parent, trusted=True)
+
+
+def test_trusted_stale(tmp_path: Path) -> None:
+    filepath = tmp_path / "data.json"
+    dummio.pydantic.save(Child(name="c", born=datetime(2020, 1, 1)), filepath=filepath, fingerprint=True)
+
+    class Child2(BaseModel):
+        name: str
+        born: datetime
+        age: int = 0
+
+    with pytest.raises(ValueError, match="stale"):
+        dummio.pydantic.load(filepath, model=Child2, trusted=True)
+
+
+def test_resave_removes_fingerprint(tmp_path: Path) -> None:
+    filepath = tmp_path / "data.json"
+    dummio.pydantic.save(_parent(), filepath=filepath, fingerprint=True)
+    # data of another model, saved without a fingerprint, must not be loaded in trusted mode:
+    dummio.pydantic.save(Child(name="c", born=datetime(2020, 1, 1)), filepath=filepath)
+    assert not fingerprint.sidecar(filepath).exists()
+    with pytest.raises(ValueError, match="no schema fingerprint"):
+        dummio.pydantic.load(filepath, model=Parent, trusted=True)
@@ -1,10 +1,13 @@
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from textwrap import dedent
 
+import pytest
 from upath import UPath
 
 import dummio
 from dummio.constants import PathType
+from dummio.yaml import Engine
 
 # example yaml string:
 CONF = dedent("""
@@ -48,3 +51,36 @@ def test_yaml(tmp_path: Path) -> None:
     _assert_yaml_content(oldpath, newpath)
     _assert_yaml_content(str(oldpath), str(newpath))
     _assert_yaml_content(UPath(oldpath), UPath(newpath))
+
+
+@pytest.mark.parametrize(
+    "engine",
+    [
+        "ruamel",
+        pytest.param(
+            "libyaml",
+            marks=pytest.mark.skipif(dummio.yaml._pyyaml() is None, reason="requires pyyaml with libyaml bindings"),
+        ),
+        "auto",
+    ],
+)
+def test_engines(tmp_path: Path, engine: Engine) -> None:
+    data = {"a": [1, 2.5, None], "b": {"c": "text", "d": True}}
+    filepath = tmp_path / "data.yaml"
+    dummio.yaml.save(data, filepath=filepath, engine=engine)
+    assert dummio.yaml.load(filepath, engine=engine) == data
+    # files are interchangeable across engines:
+    assert dummio.yaml.load(filepath, engine="ruamel", typ="safe") == data
+
+
+def test_unsupported_engine(tmp_path: Path) -> None:
+    with pytest.raises(ValueError, match="Unsupported engine"):
+        dummio.yaml.load(tmp_path / "data.yaml", engine="fast")  # pyright: ignore[reportArgumentType]
+
+
+def test_instances_per_thread() -> None:
+    instance = dummio.yaml._ruamel("safe")
+    assert dummio.yaml._ruamel("safe") is instance
+    assert dummio.yaml._ruamel("rt") is not instance
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        assert executor.submit(dummio.yaml._ruamel, "safe").result() is not instance